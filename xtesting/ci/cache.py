@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Cache of the successful results
+
+The result record of every passing test case is stored under a key hashing
+its block in testcases.yaml, the inputs listed by its arguments (e.g. the
+suites or the playbook) and the env values. The cached result is reused
+instead of running the test case again until one of them changes.
+
+Only the arguments known to list inputs (HASHED_ARGS) are hashed as the
+other paths may be written by the drivers (e.g. private_data_dir) or may
+be whole trees.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+from xtesting.ci import record
+from xtesting.core import testcase
+from xtesting.utils import constants
+from xtesting.utils import env
+from xtesting.utils import files
+
+LOGGER = logging.getLogger('xtesting.ci.cache')
+
+EXCLUDED_ENV_VARS = ['BUILD_TAG']
+TTL = 7 * 24 * 3600
+MAX_ENTRIES = 1000
+HASHED_ARGS = ['suites', 'test_file', 'variablefile', 'argumentfile']
+
+
+def _walk(value):
+    """Yield all the strings found in the arguments"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _walk(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _walk(item)
+
+
+def _hash_file(path, digest):
+    try:
+        with open(path, 'rb') as cfile:
+            for chunk in iter(lambda: cfile.read(65536), b''):
+                digest.update(chunk)
+    except OSError as exc:
+        LOGGER.warning("Cannot hash %s: %s", path, exc)
+
+
+def get_inputs(args):
+    """Return the paths of the inputs listed by the arguments"""
+    inputs = [value for key in HASHED_ARGS for value in _walk(
+        args.get(key))]
+    if isinstance(args.get('playbook'), str):
+        # the playbook is relative to the project of private_data_dir
+        inputs += [os.path.join(str(args.get('private_data_dir', '')), path,
+                                args['playbook']) for path in ['project', '']]
+    return inputs
+
+
+def hash_files(run_dict):
+    """Return the hashes of the files listed by the arguments"""
+    hashes = {}
+    args = run_dict.get('args')
+    for value in get_inputs(args if isinstance(args, dict) else {}):
+        if os.path.isfile(value):
+            digest = hashlib.sha256()
+            _hash_file(value, digest)
+            hashes[value] = digest.hexdigest()
+        elif os.path.isdir(value):
+            digest = hashlib.sha256()
+            for root, dirs, names in os.walk(value):
+                dirs.sort()
+                for name in sorted(names):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, value).encode())
+                    _hash_file(path, digest)
+            hashes[value] = digest.hexdigest()
+    return hashes
+
+
+def get_key(test_dict):
+    """Return the key of the test case in the cache"""
+    data = {
+        'test': test_dict,
+        'files': hash_files(test_dict.get('run', {})),
+        'env': {var: env.get(var) for var in env.INPUTS
+                if var not in EXCLUDED_ENV_VARS}}
+    return hashlib.sha256(json.dumps(
+        data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class Cache():
+    """Local on-disk cache of the successful results
+
+    The entries older than ttl seconds are removed and only the
+    max_entries most recently used ones are kept.
+    """
+
+    def __init__(self, path=constants.CACHE_DIR, ttl=TTL,
+                 max_entries=MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict()
+
+    @staticmethod
+    def is_cacheable(test_dict):
+        """Check if the result of the test case can be reused"""
+        return bool(test_dict) and test_dict.get('cacheable', True)
+
+    def get_entries(self):
+        """Return the entries from the least to the most recently used"""
+        try:
+            return sorted([entry for entry in os.scandir(self.path)
+                           if entry.name.endswith('.json')],
+                          key=lambda entry: entry.stat().st_mtime)
+        except FileNotFoundError:
+            return []
+        except OSError:
+            LOGGER.exception("Cannot read the cache %s", self.path)
+            return []
+
+    def evict(self):
+        """Remove the expired and the least recently used entries"""
+        entries = self.get_entries()
+        for index, entry in enumerate(entries):
+            if (time.time() - entry.stat().st_mtime > self.ttl or
+                    len(entries) - index > self.max_entries):
+                LOGGER.debug("Evicting %s", entry.path)
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    LOGGER.exception("Cannot evict %s", entry.path)
+
+    def get(self, test_dict):
+        """Return the cached test case or None"""
+        if not self.is_cacheable(test_dict):
+            return None
+        try:
+            path = os.path.join(self.path, f'{get_key(test_dict)}.json')
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, encoding='utf-8') as cfile:
+                test_case = record.load(json.load(cfile))
+            os.utime(path)
+            return test_case
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def add(self, test_dict, test_case):
+        """Store the result of the test case if it passed
+
+        A result which cannot be written is only logged as the test case
+        has passed anyway.
+        """
+        if (not self.is_cacheable(test_dict) or test_case.is_skipped or
+                test_case.is_successful() != testcase.TestCase.EX_OK):
+            return
+        try:
+            files.write_atomically(
+                os.path.join(self.path, f'{get_key(test_dict)}.json'),
+                json.dumps(record.dump(test_case), default=str))
+        except OSError:
+            LOGGER.exception("Cannot cache %s in %s",
+                             test_case.case_name, self.path)
+            return
+        self.evict()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Checkpoint of the campaign
+
+The result record of every completed test case is appended to a JSON Lines
+file in RESULTS_DIR once it completes (one line per test case whatever the
+size of the campaign). An interrupted campaign can be resumed without
+running again the test cases which already completed.
+"""
+
+import json
+import logging
+import os
+import threading
+
+from xtesting.ci import record
+from xtesting.utils import constants
+from xtesting.utils import files
+
+LOGGER = logging.getLogger('xtesting.ci.checkpoint')
+
+CHECKPOINT_FILE = 'checkpoint.jsonl'
+
+
+def read(path):
+    """Return the result records saved in the checkpoint by names
+
+    The last record of a test case wins and the lines which cannot be
+    parsed (e.g. the last one if the campaign died while writing it) are
+    skipped.
+    """
+    records = {}
+    with open(path, encoding='utf-8') as cfile:
+        for line in cfile:
+            try:
+                data = json.loads(line)
+                records[data['case_name']] = data
+            except (ValueError, KeyError, TypeError):
+                LOGGER.warning("Skipping the line %r of %s", line, path)
+    return records
+
+
+def to_jsonl(data):
+    """Return the result record as one JSON line"""
+    return json.dumps(data, default=str, sort_keys=True) + '\n'
+
+
+class Checkpoint():
+    """Result records of the completed test cases"""
+
+    def __init__(self, path=os.path.join(
+            constants.RESULTS_DIR, CHECKPOINT_FILE)):
+        self.path = path
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Load the result records saved by the previous campaign
+
+        The checkpoint is compacted to one line per test case.
+        """
+        try:
+            self.records = read(self.path)
+            LOGGER.info("%d completed test case(s) loaded from %s",
+                        len(self.records), self.path)
+        except FileNotFoundError:
+            LOGGER.info("No checkpoint %s found", self.path)
+            return
+        try:
+            files.write_atomically(self.path, ''.join(
+                to_jsonl(data) for data in self.records.values()))
+        except OSError:
+            LOGGER.exception("Cannot compact %s", self.path)
+
+    def reset(self):
+        """Forget the result records (e.g. before running them again)"""
+        with self.lock:
+            self.records = {}
+
+    def add(self, test_case):
+        """Save the result record of the completed test case
+
+        The record is copied at once as the details may be modified later
+        (e.g. when publishing the artifacts in background). The previous
+        checkpoint is overwritten by the first record.
+        """
+        line = to_jsonl(record.dump(test_case))
+        with self.lock:
+            mode = 'a' if self.records else 'w'
+            self.records[test_case.case_name] = json.loads(line)
+            try:
+                with open(self.path, mode, encoding='utf-8') as cfile:
+                    cfile.write(line)
+                    cfile.flush()
+                    os.fsync(cfile.fileno())
+            except OSError:
+                LOGGER.exception("Cannot save %s in %s",
+                                 test_case.case_name, self.path)
+
+    def get(self, name):
+        """Return the completed test case rebuilt from its record or None"""
+        if name in self.records:
+            return record.load(self.records[name])
+        return None
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Resolve the drivers (xtesting.testcase entry points) once
+
+stevedore scans the entry points every time a DriverManager is built. The
+driver classes are then cached by names for the whole campaign.
+"""
+
+import functools
+
+from stevedore import driver
+
+
+@functools.lru_cache(maxsize=None)
+def get(name):
+    """Return the driver class registered as name in xtesting.testcase"""
+    return driver.DriverManager(
+        namespace='xtesting.testcase', name=name).driver
+
+
+def load(name, test_dict):
+    """Instantiate the driver of the test case"""
+    return get(name)(**test_dict)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""History of the test cases
+
+The duration, the result and the start time of the last runs of every test
+case are kept in a small SQLite database in RESULTS_DIR. The durations
+allow starting the longest test cases first.
+"""
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+
+from xtesting.core import testcase
+from xtesting.utils import constants
+
+LOGGER = logging.getLogger('xtesting.ci.history')
+
+HISTORY_FILE = 'history.db'
+SIZE = 10
+
+
+def by_duration(durations):
+    """Return the sort key starting the longest test cases first
+
+    The test cases without history are given the mean duration.
+    """
+    mean = sum(durations.values()) / len(durations) if durations else 0
+    return lambda name: -durations.get(name, mean)
+
+
+class History():
+    """Last runs of the test cases (at most size runs per test case)"""
+
+    def __init__(self, path=os.path.join(constants.RESULTS_DIR, HISTORY_FILE),
+                 size=SIZE):
+        self.path = path
+        self.size = size
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Yield a connection committing on success"""
+        with self.lock, contextlib.closing(sqlite3.connect(self.path)) as conn:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS runs (case_name TEXT NOT "
+                    "NULL, start_time REAL, duration REAL, result TEXT)")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS runs_case_name ON runs "
+                    "(case_name, start_time)")
+                yield conn
+
+    def add(self, test_case):
+        """Record the run of the test case and forget the oldest ones"""
+        if test_case.is_skipped:
+            return
+        result = 'PASS' if (
+            test_case.is_successful() == testcase.TestCase.EX_OK) else 'FAIL'
+        duration = None
+        if test_case.start_time and test_case.stop_time:
+            duration = test_case.stop_time - test_case.start_time
+        try:
+            with self.connect() as conn:
+                conn.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?)",
+                    (test_case.case_name, test_case.start_time, duration,
+                     result))
+                conn.execute(
+                    "DELETE FROM runs WHERE case_name = ? AND rowid NOT IN "
+                    "(SELECT rowid FROM runs WHERE case_name = ? ORDER BY "
+                    "start_time DESC LIMIT ?)",
+                    (test_case.case_name, test_case.case_name, self.size))
+        except sqlite3.Error:
+            LOGGER.exception("Cannot record %s in %s",
+                             test_case.case_name, self.path)
+
+    def get_runs(self, name):
+        """Return the last runs of the test case from the most recent one
+
+        Each of them is a tuple (start_time, duration, result).
+        """
+        if not os.path.isfile(self.path):
+            return []
+        try:
+            with self.connect() as conn:
+                return conn.execute(
+                    "SELECT start_time, duration, result FROM runs WHERE "
+                    "case_name = ? ORDER BY start_time DESC",
+                    (name, )).fetchall()
+        except sqlite3.Error:
+            LOGGER.exception("Cannot read %s", self.path)
+            return []
+
+    def get_durations(self):
+        """Return the mean durations of the test cases"""
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with self.connect() as conn:
+                return dict(conn.execute(
+                    "SELECT case_name, AVG(duration) FROM runs WHERE "
+                    "duration IS NOT NULL GROUP BY case_name").fetchall())
+        except sqlite3.Error:
+            LOGGER.exception("Cannot read %s", self.path)
+            return {}
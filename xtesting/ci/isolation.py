@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Run the test cases in child processes
+
+The drivers are loaded and run in a child process which only sends back
+the result record of the test case. The memory allocated by the drivers is
+then released after each test case and a crashing driver cannot kill the
+campaign. The child process leads its own process group so that all the
+processes started by the driver (e.g. robot or ansible-playbook) are killed
+with it on timeout.
+
+The child processes are forked even if the campaign runs threads (--workers
+or --background). It is safe as the child only runs the test case and
+exits: the logging module reinitializes its locks after fork and the HTTP
+sessions are per process (see xtesting.utils.session). The forkserver and
+spawn contexts would neither inherit the logging configuration nor the
+env file sourced by run_tests.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+
+from xtesting.ci import drivers
+from xtesting.ci import record
+from xtesting.ci import timings
+
+LOGGER = logging.getLogger('xtesting.ci.isolation')
+
+KILL_TIMEOUT = 5
+
+
+def _execute(conn, run_dict, test_dict, clean_flag):
+    """Load and run the test case in the child process
+
+    A failed record holding the exception is sent if the driver raises.
+    """
+    os.setsid()
+    start_time = time.time()
+    try:
+        phases = {}
+        with timings.measure(phases, 'load'):
+            test_case = drivers.load(run_dict['name'], test_dict)
+        with timings.measure(phases, 'check_requirements'):
+            test_case.check_requirements()
+        exit_code = None
+        if not test_case.is_skipped:
+            LOGGER.info("Running test case '%s'...", test_dict['case_name'])
+            with timings.measure(phases, 'run'):
+                exit_code = test_case.run(**run_dict.get('args', {}))
+            if clean_flag:
+                with timings.measure(phases, 'clean'):
+                    test_case.clean()
+        timings.get(test_case).update(phases)
+        conn.send(record.dump(test_case, exit_code))
+    except Exception as exc:  # pylint: disable=broad-except
+        LOGGER.exception(
+            "\n\nPlease fix the testcase %s.\n"
+            "All exceptions should be caught by the testcase instead!"
+            "\n\n",
+            test_dict['case_name'])
+        conn.send(record.dump(record.failed(test_dict, start_time, {
+            'exception': f"{type(exc).__name__}: {exc}"})))
+    finally:
+        conn.close()
+
+
+def kill(process, timeout=KILL_TIMEOUT):
+    """Kill the child process and all the processes it has started
+
+    They are terminated first and killed if the child process is still
+    running after timeout seconds.
+    """
+    for sig in [signal.SIGTERM, signal.SIGKILL]:
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            # the child process may not lead its process group yet
+            if process.exitcode is None:
+                os.kill(process.pid, sig)
+        if sig == signal.SIGTERM:
+            process.join(timeout)
+
+
+def execute(run_dict, test_dict, clean_flag=True, timeout=None):
+    """Load and run the test case in a child process
+
+    Args:
+        run_dict: the 'run' block of the test case
+        test_dict: the block of the test case in testcases.yaml
+        clean_flag: clean the resources after running the test case
+        timeout: the maximum duration of the test case in seconds
+
+    Returns:
+        the test case rebuilt from the result record sent by the child
+        process or a failed one if the child process exits without result
+        or is killed after timeout seconds (the test case is not cleaned
+        then)
+    """
+    context = multiprocessing.get_context('fork')
+    reader, writer = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_execute, args=(writer, run_dict, test_dict, clean_flag))
+    start_time = time.time()
+    process.start()
+    writer.close()
+    data = None
+    details = None
+    try:
+        if reader.poll(timeout):
+            data = reader.recv()
+        else:
+            LOGGER.error("Killing %s after %s second(s)",
+                         test_dict['case_name'], timeout)
+            kill(process)
+            details = {'timeout': timeout}
+            if clean_flag:
+                LOGGER.warning("The test case %s is not cleaned",
+                               test_dict['case_name'])
+                details['clean'] = 'skipped'
+    except EOFError:
+        pass
+    except BaseException:
+        # e.g. KeyboardInterrupt as the child process has left the session
+        kill(process)
+        raise
+    finally:
+        reader.close()
+        process.join()
+    if data:
+        return record.load(data)
+    if not details:
+        LOGGER.error("The child process running %s exited with %s",
+                     test_dict['case_name'], process.exitcode)
+        details = {'exitcode': process.exitcode}
+    return record.failed(test_dict, start_time, details)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Merge the results of the shards of a campaign
+
+The checkpoints written by the shards (see run_tests --shard) are merged
+into one summary table, one checkpoint and one timings file. The results
+can then be pushed to the database at once.
+"""
+
+import argparse
+import logging
+import logging.config
+import os
+import sys
+
+from xtesting.ci import checkpoint
+from xtesting.ci import record
+from xtesting.ci import run_tests
+from xtesting.ci import timings
+from xtesting.core import testcase
+from xtesting.utils import config
+from xtesting.utils import constants
+from xtesting.utils import env
+
+LOGGER = logging.getLogger('xtesting.ci.merge')
+
+
+class MergeParser():
+    """Parser to merge the results"""
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self):
+        self.parser = argparse.ArgumentParser()
+        self.parser.add_argument("checkpoints", nargs='+',
+                                 help="Checkpoint files written by the "
+                                 "shards.")
+        self.parser.add_argument("-r", "--report", help="Push results to "
+                                 "database (default=false).",
+                                 action="store_true")
+
+    def parse_args(self, argv=None):
+        """Parse arguments.
+
+        It can call sys.exit if arguments are incorrect.
+
+        Returns:
+            the arguments from cmdline
+        """
+        return vars(self.parser.parse_args(argv))
+
+
+def load(paths):
+    """Return the test cases rebuilt from all the checkpoints"""
+    test_cases = {}
+    for path in paths:
+        for name, data in checkpoint.read(path).items():
+            if name in test_cases:
+                LOGGER.warning("%s is overridden by %s", name, path)
+            test_cases[name] = record.load(data)
+    return test_cases
+
+
+def merge(paths, report=False):
+    """Merge the results of the shards
+
+    Returns:
+        Result.EX_OK if all the merged test cases passed or were skipped
+        Result.EX_ERROR otherwise
+    """
+    runner = run_tests.Runner()
+    runner.report_flag = report
+    runner.executed_test_cases = load(paths)
+    campaign = timings.Timings()
+    results = checkpoint.Checkpoint()
+    for test_case in runner.executed_test_cases.values():
+        if not test_case.is_skipped:
+            runner.publish(test_case)
+            if test_case.is_successful() != testcase.TestCase.EX_OK:
+                runner.overall_result = run_tests.Result.EX_ERROR
+        campaign.add(test_case.case_name, timings.get(test_case))
+        campaign.start_time = min(
+            campaign.start_time, test_case.start_time or campaign.start_time)
+        results.add(test_case)
+    campaign.dump()
+    runner.summary()
+    if runner.publication_errors:
+        runner.summary_publications()
+    return runner.overall_result
+
+
+def main():
+    """Entry point"""
+    os.makedirs(constants.RESULTS_DIR, exist_ok=True)
+    if env.get('DEBUG').lower() == 'true':
+        logging.config.fileConfig(config.get_xtesting_config(
+            'logging.debug.ini', constants.DEBUG_INI_PATH_DEFAULT))
+    else:
+        logging.config.fileConfig(config.get_xtesting_config(
+            'logging.ini', constants.INI_PATH_DEFAULT))
+    args = MergeParser().parse_args(sys.argv[1:])
+    return merge(args['checkpoints'], args['report']).value
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Bounded queue processed in background
+
+It allows overlapping the publication of the artifacts and the results of
+one test case with the execution of the next ones.
+"""
+
+import logging
+import queue
+import threading
+
+LOGGER = logging.getLogger('xtesting.ci.pipeline')
+
+
+class Pipeline():
+    """Process the queued items one by one in a background thread"""
+
+    def __init__(self, target, maxsize=4):
+        self.target = target
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.thread = threading.Thread(target=self._process, daemon=True)
+        self.thread.start()
+
+    def _process(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            try:
+                self.target(item)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Cannot process %s", item)
+
+    def put(self, item):
+        """Queue the item
+
+        It blocks while the queue is full.
+        """
+        self.queue.put(item)
+
+    def join(self):
+        """Wait for all the queued items and stop the background thread"""
+        self.queue.put(None)
+        self.thread.join()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Execution plan of a campaign
+
+The test cases which would be executed are scheduled on the workers as
+Runner would do without running them. Their durations are predicted from
+the previous campaigns (history or timings) and the test cases without any
+recorded duration are given the mean of the known durations.
+"""
+
+import heapq
+import logging
+
+import prettytable
+
+LOGGER = logging.getLogger('xtesting.ci.planner')
+
+
+def format_duration(duration):
+    """Format the duration in seconds as MM:SS"""
+    return f"{int(duration // 60):02}:{int(duration % 60):02}"
+
+
+class Planner():
+    """Simulation of the campaign assuming that all the test cases pass"""
+
+    def __init__(self, durations=None, workers=1):
+        self.durations = durations or {}
+        self.mean = sum(self.durations.values()) / len(
+            self.durations) if self.durations else 0
+        self.workers = workers
+        self.clock = 0.0
+        self.rows = []
+
+    def predict(self, name):
+        """Return the predicted duration of the test case"""
+        return self.durations.get(name, self.mean)
+
+    def add(self, name, tier_name, worker, start):
+        """Record the test case started at start and return its end"""
+        duration = self.predict(name)
+        self.rows.append({
+            'test case': name, 'tier': tier_name, 'worker': worker,
+            'start': start, 'duration': duration,
+            'estimated': name not in self.durations, 'result': 'RUN'})
+        return start + duration
+
+    def skip(self, name, tier_name, reason):
+        """Record the test case which would not be executed"""
+        self.rows.append({
+            'test case': name, 'tier': tier_name, 'worker': None,
+            'start': None, 'duration': 0, 'estimated': False,
+            'result': reason})
+
+    def run_batch(self, tests, tier_name):
+        """Schedule the test cases of the batch on the workers
+
+        The test cases are started in order as soon as a worker is free
+        and the next batch waits for all of them.
+        """
+        workers = [self.clock] * (min(self.workers, len(tests)) or 1)
+        for test in tests:
+            worker = workers.index(min(workers))
+            workers[worker] = self.add(
+                test.get_name(), tier_name, worker + 1, workers[worker])
+        self.clock = max(workers)
+
+    def run_dag(self, scheduler, tier_names):
+        """Schedule the test cases as soon as their prerequisites end
+
+        Args:
+            scheduler: the Scheduler of the test cases
+            tier_names: the tier names of the test cases by names
+        """
+        waiting = {name: {dependency for dependency in test.get_depends_on()
+                          if dependency in scheduler.tests}
+                   for name, test in scheduler.tests.items()
+                   if name not in scheduler.unmet}
+        ready = sorted([name for name, value in waiting.items() if not value],
+                       key=scheduler.get_priority)
+        free = list(range(1, self.workers + 1))
+        running = []
+        started = set()
+        while ready or running:
+            while ready and free:
+                name = ready.pop(0)
+                worker = free.pop(0)
+                started.add(name)
+                end = self.add(name, tier_names.get(name), worker, self.clock)
+                heapq.heappush(running, (end, worker, name))
+            self.clock, worker, name = heapq.heappop(running)
+            free.append(worker)
+            free.sort()
+            for dependent in scheduler.dependents[name]:
+                if dependent in waiting:
+                    waiting[dependent].discard(name)
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+            ready.sort(key=scheduler.get_priority)
+        for name in scheduler.tests:
+            if name not in started:
+                self.skip(name, tier_names.get(name), 'NOT RUN')
+
+    def get_total(self):
+        """Return the predicted duration of the campaign"""
+        return self.clock
+
+    def __str__(self):
+        msg = prettytable.PrettyTable(
+            header_style='upper', padding_width=5,
+            field_names=['test case', 'tier', 'worker', 'start',
+                         'duration', 'result'])
+        for row in self.rows:
+            if row['start'] is None:
+                msg.add_row([row['test case'], row['tier'], '', '', '',
+                             row['result']])
+                continue
+            duration = format_duration(row['duration'])
+            msg.add_row([row['test case'], row['tier'], row['worker'],
+                         format_duration(row['start']),
+                         f"~{duration}" if row['estimated'] else duration,
+                         row['result']])
+        return msg.get_string()
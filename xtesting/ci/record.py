@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Compact result records of the test cases
+
+They allow exchanging the results of the test cases without the driver
+objects (e.g. from a child process).
+"""
+
+import time
+
+from xtesting.core import testcase
+
+FIELDS = ['case_name', 'project_name', 'criteria', 'result', 'start_time',
+          'stop_time', 'details', 'is_skipped', 'res_dir']
+
+
+class TestCase(testcase.TestCase):
+    """Test case rebuilt from its result record"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.successful = testcase.TestCase.EX_TESTCASE_FAILED
+        self.exit_code = testcase.TestCase.EX_RUN_ERROR
+
+    def run(self, **kwargs):
+        return self.exit_code
+
+    def is_successful(self):
+        return self.successful
+
+
+def dump(test_case, exit_code=None):
+    """Return the result record of the test case"""
+    data = {key: getattr(test_case, key) for key in FIELDS}
+    data['successful'] = test_case.is_successful()
+    data['exit_code'] = exit_code
+    return data
+
+
+def load(data):
+    """Rebuild the test case from its result record"""
+    test_case = TestCase(case_name=data['case_name'])
+    for key, value in data.items():
+        setattr(test_case, key, value)
+    return test_case
+
+
+def failed(test_dict, start_time, details):
+    """Return the failed test case which did not complete"""
+    test_case = TestCase(**test_dict)
+    test_case.start_time = start_time
+    test_case.stop_time = time.time()
+    test_case.details = details
+    return test_case
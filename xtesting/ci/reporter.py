@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Machine-readable results written as soon as the test cases complete
+
+Every result is appended to a JSON Lines file which can be tailed while
+the campaign runs. The JUnit XML file of the campaign is rewritten at once
+every JUNIT_TESTS results or JUNIT_INTERVAL seconds and when the campaign
+ends. Both files in RESULTS_DIR stay usable if it dies halfway.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from xml.etree import ElementTree
+
+from xtesting.ci import record
+from xtesting.core import testcase
+from xtesting.utils import constants
+from xtesting.utils import files
+
+LOGGER = logging.getLogger('xtesting.ci.reporter')
+
+JSONL_FILE = 'results.jsonl'
+JUNIT_FILE = 'results.xml'
+JUNIT_TESTS = 100
+JUNIT_INTERVAL = 30
+
+
+def get_status(test_case):
+    """Return PASS, FAIL or SKIP"""
+    if test_case.is_skipped:
+        return 'SKIP'
+    return 'PASS' if (
+        test_case.is_successful() == testcase.TestCase.EX_OK) else 'FAIL'
+
+
+def get_duration(test_case):
+    """Return the duration in seconds"""
+    try:
+        return round(test_case.stop_time - test_case.start_time, 3)
+    except TypeError:
+        return 0
+
+
+class Reporter():
+    """JSON Lines and JUnit XML results of the campaign"""
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, results_dir=constants.RESULTS_DIR,
+                 junit_tests=JUNIT_TESTS, junit_interval=JUNIT_INTERVAL):
+        self.jsonl_file = os.path.join(results_dir, JSONL_FILE)
+        self.junit_file = os.path.join(results_dir, JUNIT_FILE)
+        self.junit_tests = junit_tests
+        self.junit_interval = junit_interval
+        self.test_cases = {}
+        self.pending = 0
+        self.written = time.monotonic()
+        self.lock = threading.Lock()
+
+    def add(self, test_case, tier_name=None):
+        """Write the result of the completed test case"""
+        data = record.dump(test_case)
+        data.update(tier=tier_name, status=get_status(test_case),
+                    duration=get_duration(test_case))
+        with self.lock:
+            # the previous results are overwritten by the first one
+            mode = 'a' if self.test_cases else 'w'
+            self.test_cases.pop(test_case.case_name, None)
+            self.test_cases[test_case.case_name] = data
+            self.pending += 1
+            try:
+                os.makedirs(os.path.dirname(self.jsonl_file), exist_ok=True)
+                with open(self.jsonl_file, mode, encoding='utf-8') as jfile:
+                    jfile.write(json.dumps(data, default=str) + '\n')
+            except OSError:
+                LOGGER.exception("Cannot write the result of %s",
+                                 test_case.case_name)
+            if (self.pending >= self.junit_tests or
+                    time.monotonic() - self.written >= self.junit_interval):
+                self.write_junit()
+
+    def flush(self):
+        """Write the JUnit XML file if any result is not written yet"""
+        with self.lock:
+            if self.pending:
+                self.write_junit()
+
+    def write_junit(self):
+        """Rewrite the JUnit XML file (the lock must be held)"""
+        try:
+            files.write_atomically(self.junit_file, self.to_junit())
+        except OSError:
+            LOGGER.exception("Cannot write %s", self.junit_file)
+        self.pending = 0
+        self.written = time.monotonic()
+
+    def to_junit(self):
+        """Return the results in the JUnit XML format
+
+        The test cases are grouped by tiers in test suites.
+        """
+        root = ElementTree.Element('testsuites', name='xtesting')
+        suites = {}
+        for data in self.test_cases.values():
+            name = data['tier'] or 'xtesting'
+            if name not in suites:
+                suites[name] = ElementTree.SubElement(
+                    root, 'testsuite', name=name)
+            case = ElementTree.SubElement(
+                suites[name], 'testcase', name=data['case_name'],
+                classname=str(data['project_name']),
+                time=str(data['duration']))
+            if data['status'] == 'SKIP':
+                ElementTree.SubElement(case, 'skipped')
+            elif data['status'] == 'FAIL':
+                ElementTree.SubElement(
+                    case, 'failure',
+                    message=f"result {data['result']} does not meet the "
+                    f"criteria {data['criteria']}")
+        for element in [root] + list(suites.values()):
+            cases = list(element.iter('testcase'))
+            element.set('tests', str(len(cases)))
+            element.set('failures', str(len(
+                [case for case in cases if case.find('failure') is not None])))
+            element.set('skipped', str(len(
+                [case for case in cases if case.find('skipped') is not None])))
+            element.set('time', str(round(sum(
+                float(case.get('time')) for case in cases), 3)))
+        return ElementTree.tostring(root, encoding='unicode')
@@ -14,20 +14,33 @@
 """
 
 import argparse
+from concurrent import futures
 import errno
+import functools
 import logging
 import logging.config
 import os
 import re
 import sys
 import textwrap
+import time
 
 import enum
 import prettytable
-from stevedore import driver
-import yaml
 
+from xtesting.ci import cache
+from xtesting.ci import checkpoint
+from xtesting.ci import drivers
+from xtesting.ci import history
+from xtesting.ci import isolation
+from xtesting.ci import pipeline
+from xtesting.ci import planner
+from xtesting.ci import reporter
+from xtesting.ci import scheduler
+from xtesting.ci import shard
+from xtesting.ci import stats
 from xtesting.ci import tier_builder
+from xtesting.ci import timings
 from xtesting.core import testcase
 from xtesting.utils import config
 from xtesting.utils import constants
@@ -53,10 +66,14 @@ class RunTestsParser():
 
     def __init__(self):
         self.parser = argparse.ArgumentParser()
-        self.parser.add_argument("-t", "--test", dest="test", action='store',
-                                 help="Test case or tier (group of tests) "
-                                 "to be executed. It will run all the test "
-                                 "if not specified.")
+        self.parser.add_argument("-t", "--test", dest="test", nargs='+',
+                                 help="Test cases or tiers (group of tests) "
+                                 "to be executed: names, glob patterns or "
+                                 "regular expressions prefixed by 're:'. "
+                                 "It will run all the test if not "
+                                 "specified.")
+        self.parser.add_argument("--tags", nargs='+', help="Run only the "
+                                 "test cases having any of these tags.")
         self.parser.add_argument("-n", "--noclean", help="Do not clean "
                                  "OpenStack resources after running each "
                                  "test (default=false).",
@@ -67,6 +84,71 @@ class RunTestsParser():
         self.parser.add_argument("-p", "--push", help="Push artifacts to "
                                  "S3 repository (default=false).",
                                  action="store_true")
+        self.parser.add_argument("--background", help="Publish the "
+                                 "artifacts and push the results while "
+                                 "the next test cases run "
+                                 "(default=false).",
+                                 action="store_true")
+        self.parser.add_argument("-w", "--workers", help="Number of test "
+                                 "cases marked as parallel which can run "
+                                 "at the same time in a tier (default=1).",
+                                 type=int, default=1)
+        self.parser.add_argument("--isolate", help="Load and run each "
+                                 "test case in a child process "
+                                 "(default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--resume", help="Skip the test cases "
+                                 "already completed by the interrupted "
+                                 "campaign and reload their results "
+                                 "(default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--reuse-results", help="Reuse the "
+                                 "cached results of the test cases which "
+                                 "passed if neither their definitions, "
+                                 "their suites nor the env have changed "
+                                 "(default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--shard", help="Run only the shard i "
+                                 "of the N shards balanced according to "
+                                 "the durations of the test cases (i/N) "
+                                 "or round-robin without --durations.",
+                                 type=shard.parse)
+        self.parser.add_argument("--durations", help="Timings file of a "
+                                 "previous campaign used to balance the "
+                                 "shards which must be the same for all "
+                                 "of them (default=RESULTS_DIR/"
+                                 "timings.json for --plan only).")
+        self.parser.add_argument("--longest-first", help="Start the "
+                                 "longest test cases first according to "
+                                 "their history when running them in "
+                                 "parallel (default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--repeat", help="Run the test case or "
+                                 "the tier N times and report the "
+                                 "statistics of the iterations.",
+                                 type=int)
+        self.parser.add_argument("--soak-duration", help="Run the test "
+                                 "case or the tier again and again for "
+                                 "SECONDS and report the statistics of "
+                                 "the iterations.",
+                                 type=float)
+        self.parser.add_argument("--serve", help="Keep running and run "
+                                 "the test cases requested on the Unix "
+                                 "socket (default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--socket", help="Unix socket of --serve "
+                                 "(default=RESULTS_DIR/run_tests.sock).",
+                                 default=constants.SOCKET_PATH)
+        self.parser.add_argument("--plan", help="Print the test cases "
+                                 "which would be executed and their "
+                                 "predicted durations without running "
+                                 "them (default=false).",
+                                 action="store_true")
+        self.parser.add_argument("--dag", help="Start the test cases as "
+                                 "soon as the test cases they depend on "
+                                 "(depends_on) have passed whatever their "
+                                 "tiers (default=false).",
+                                 action="store_true")
 
     def parse_args(self, argv=None):
         """Parse arguments.
@@ -81,16 +163,30 @@ class RunTestsParser():
 
 class Runner():
     """Runner class"""
+    # pylint: disable=too-many-instance-attributes,too-many-public-methods
 
-    def __init__(self):
+    def __init__(self, tiers=None):
         self.executed_test_cases = {}
         self.overall_result = Result.EX_OK
         self.clean_flag = True
         self.report_flag = False
         self.push_flag = False
-        self.tiers = tier_builder.TierBuilder(config.get_xtesting_config(
-            constants.TESTCASE_DESCRIPTION,
-            constants.TESTCASE_DESCRIPTION_DEFAULT))
+        self.workers = 1
+        self.dag_flag = False
+        self.isolate_flag = False
+        self.pipeline = None
+        self.publication_errors = {}
+        self.timings = timings.Timings()
+        self.checkpoint = checkpoint.Checkpoint()
+        self.cache = None
+        self.history = history.History()
+        self.reporter = reporter.Reporter()
+        self.durations = None
+        self.distributions = {}
+        self.tiers = tiers or tier_builder.TierBuilder(
+            config.get_xtesting_config(
+                constants.TESTCASE_DESCRIPTION,
+                constants.TESTCASE_DESCRIPTION_DEFAULT))
 
     @staticmethod
     def source_envfile(rc_file=constants.ENV_FILE):
@@ -112,26 +208,18 @@ class Runner():
             rcfd.seek(0, 0)
             LOGGER.debug("Sourcing env file %s\n\n%s", rc_file, rcfd.read())
 
-    @staticmethod
-    def get_dict_by_test(testname):
-        # pylint: disable=missing-docstring
-        with open(config.get_xtesting_config(
-                constants.TESTCASE_DESCRIPTION,
-                constants.TESTCASE_DESCRIPTION_DEFAULT),
-                encoding='utf-8') as tyaml:
-            testcases_yaml = yaml.safe_load(tyaml)
-        for dic_tier in testcases_yaml.get("tiers"):
-            for dic_testcase in dic_tier['testcases']:
-                if dic_testcase['case_name'] == testname:
-                    return dic_testcase
-        LOGGER.error('Project %s is not defined in testcases.yaml', testname)
-        return None
+    def get_dict_by_test(self, testname):
+        """Obtain the block of the testcase from the parsed testcases.yaml"""
+        dic_testcase = self.tiers.get_dict_by_test(testname)
+        if dic_testcase is None:
+            LOGGER.error(
+                'Project %s is not defined in testcases.yaml', testname)
+        return dic_testcase
 
-    @staticmethod
-    def get_run_dict(testname):
+    def get_run_dict(self, testname):
         """Obtain the 'run' block of the testcase from testcases.yaml"""
         try:
-            dic_testcase = Runner.get_dict_by_test(testname)
+            dic_testcase = self.get_dict_by_test(testname)
             if not dic_testcase:
                 LOGGER.error("Cannot get %s's config options", testname)
             elif 'run' in dic_testcase:
@@ -141,7 +229,65 @@ class Runner():
             LOGGER.exception("Cannot get %s's config options", testname)
             return None
 
-    def run_test(self, test):
+    @staticmethod
+    def get_timeout(test_dict):
+        """Obtain the maximum duration of the test case in seconds"""
+        try:
+            return float(test_dict['timeout']) if test_dict.get(
+                'timeout') else None
+        except (ValueError, TypeError):
+            LOGGER.warning("Wrong value for timeout: %s",
+                           test_dict['timeout'])
+            return None
+
+    @staticmethod
+    def run_driver(test_case, run_dict):
+        """Run the test case with the arguments listed in testcases.yaml"""
+        try:
+            kwargs = run_dict['args']
+            test_case.run(**kwargs)
+        except KeyError:
+            test_case.run()
+
+    def execute(self, test, run_dict, test_dict):
+        """Load and run the test case in the current process
+
+        The test cases having a timeout are run by isolation.execute
+        instead as the in-process drivers cannot be interrupted.
+        """
+        phases = {}
+        with timings.measure(phases, 'load'):
+            test_case = drivers.load(run_dict['name'], test_dict)
+        self.executed_test_cases[test.get_name()] = test_case
+        with timings.measure(phases, 'check_requirements'):
+            test_case.check_requirements()
+        if not test_case.is_skipped:
+            LOGGER.info("Running test case '%s'...", test.get_name())
+            with timings.measure(phases, 'run'):
+                self.run_driver(test_case, run_dict)
+            if self.clean_flag:
+                with timings.measure(phases, 'clean'):
+                    test_case.clean()
+        timings.get(test_case).update(phases)
+        return test_case
+
+    def store(self, test, test_dict, test_case, cached=False):
+        """Store the result of the test case
+
+        The result is also saved in the checkpoint, in the machine-readable
+        results and, unless it was reused from the cache, in the history
+        and in the cache.
+        """
+        self.executed_test_cases[test.get_name()] = test_case
+        self.timings.add(test.get_name(), timings.get(test_case))
+        self.checkpoint.add(test_case)
+        self.reporter.add(test_case, self.tiers.get_tier_name(test.get_name()))
+        if not cached:
+            self.history.add(test_case)
+            if self.cache:
+                self.cache.add(test_dict, test_case)
+
+    def run_test(self, test):  # pylint: disable=too-many-branches
         """Run one test case"""
         if not test.is_enabled() or test.is_skipped():
             msg = prettytable.PrettyTable(
@@ -151,37 +297,49 @@ class Runner():
             msg.add_row([test.get_name(), test.get_project(), "00:00", "SKIP"])
             LOGGER.info("Test result:\n\n%s\n", msg)
             return testcase.TestCase.EX_TESTCASE_SKIPPED
+        test_case = self.checkpoint.get(test.get_name())
+        if test_case:
+            LOGGER.info("Test case '%s' already completed:\n\n%s\n",
+                        test.get_name(), test_case)
+            self.executed_test_cases[test.get_name()] = test_case
+            self.timings.add(test.get_name(), timings.get(test_case))
+            self.reporter.add(
+                test_case, self.tiers.get_tier_name(test.get_name()))
+            if test_case.is_skipped:
+                return testcase.TestCase.EX_TESTCASE_SKIPPED
+            return test_case.is_successful()
         result = testcase.TestCase.EX_TESTCASE_FAILED
         run_dict = self.get_run_dict(test.get_name())
         if run_dict:
             try:
                 LOGGER.info("Loading test case '%s'...", test.get_name())
-                test_dict = Runner.get_dict_by_test(test.get_name())
-                test_case = driver.DriverManager(
-                    namespace='xtesting.testcase',
-                    name=run_dict['name'],
-                    invoke_on_load=True,
-                    invoke_kwds=test_dict).driver
-                self.executed_test_cases[test.get_name()] = test_case
-                test_case.check_requirements()
+                test_dict = self.get_dict_by_test(test.get_name())
+                cached = self.cache.get(test_dict) if self.cache else None
+                if cached:
+                    LOGGER.info("Reusing the cached result of test case "
+                                "'%s'", test.get_name())
+                    test_case = cached
+                elif self.isolate_flag or self.get_timeout(test_dict):
+                    # the test case must run in a child process to be
+                    # killed after timeout seconds
+                    test_case = isolation.execute(
+                        run_dict, test_dict, self.clean_flag,
+                        self.get_timeout(test_dict))
+                else:
+                    test_case = self.execute(test, run_dict, test_dict)
+                self.store(test, test_dict, test_case, cached)
                 if test_case.is_skipped:
                     LOGGER.info("Skipping test case '%s'...", test.get_name())
                     LOGGER.info("Test result:\n\n%s\n", test_case)
                     return testcase.TestCase.EX_TESTCASE_SKIPPED
-                LOGGER.info("Running test case '%s'...", test.get_name())
-                try:
-                    kwargs = run_dict['args']
-                    test_case.run(**kwargs)
-                except KeyError:
-                    test_case.run()
                 result = test_case.is_successful()
                 LOGGER.info("Test result:\n\n%s\n", test_case)
-                if self.clean_flag:
-                    test_case.clean()
-                if self.push_flag:
-                    test_case.publish_artifacts()
-                if self.report_flag:
-                    test_case.push_to_db()
+                if cached:
+                    return result
+                if self.pipeline:
+                    self.pipeline.put(test_case)
+                else:
+                    self.publish(test_case)
             except ImportError:
                 LOGGER.exception("Cannot import module %s", run_dict['module'])
             except AttributeError:
@@ -196,6 +354,84 @@ class Runner():
             raise Exception("Cannot import the class for the test case.")
         return result
 
+    def publish(self, test_case):
+        """Publish the artifacts and push the results of the test case"""
+        phases = timings.get(test_case)
+        if self.push_flag:
+            with timings.measure(phases, 'publish_artifacts'):
+                status = test_case.publish_artifacts()
+            if status != testcase.TestCase.EX_OK:
+                self.publication_errors.setdefault(
+                    test_case.case_name, []).append('publish_artifacts')
+        if self.report_flag:
+            with timings.measure(phases, 'push_to_db'):
+                status = test_case.push_to_db()
+            if status != testcase.TestCase.EX_OK:
+                self.publication_errors.setdefault(
+                    test_case.case_name, []).append('push_to_db')
+
+    def check_test(self, test):
+        """Check the result of one executed test case"""
+        test_case = self.executed_test_cases[test.get_name()]
+        if test_case.is_successful() == test_case.EX_TESTCASE_FAILED:
+            LOGGER.error("The test case '%s' failed.", test.get_name())
+            self.overall_result = Result.EX_ERROR
+            if test.is_blocking():
+                raise BlockingTestFailed(
+                    f"The test case {test.get_name()} "
+                    "failed and is blocking")
+
+    def sort_tests(self, tests):
+        """Sort the test cases to start the longest ones first if set"""
+        if self.durations is None:
+            return tests
+        key = history.by_duration(self.durations)
+        return sorted(tests, key=lambda test: key(test.get_name()))
+
+    def run_parallel_tests(self, tests):
+        """Run independent test cases at the same time on a worker pool
+
+        The remaining test cases are cancelled as soon as a blocking test
+        case fails. The results are checked in the tier order whatever the
+        completion order.
+        """
+        with futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            jobs = {pool.submit(self.run_test, test): test
+                    for test in self.sort_tests(tests)}
+            for job in futures.as_completed(jobs):
+                if job.cancelled() or job.exception():
+                    continue
+                if (job.result() == testcase.TestCase.EX_TESTCASE_FAILED and
+                        jobs[job].is_blocking()):
+                    for pending in jobs:
+                        pending.cancel()
+        for job, test in sorted(
+                jobs.items(), key=lambda job: tests.index(job[1])):
+            if job.cancelled():
+                LOGGER.info("The test case '%s' was not started.",
+                            test.get_name())
+                continue
+            job.result()
+            self.check_test(test)
+
+    def get_batches(self, tests):
+        """Group the consecutive test cases which can run in parallel
+
+        A batch ends before any test case depending on (depends_on) one of
+        the test cases of the batch.
+        """
+        batches = []
+        for test in tests:
+            if (self.workers > 1 and test.is_parallel() and batches and
+                    batches[-1][-1].is_parallel() and not set(
+                        test.get_depends_on()).intersection(
+                            previous.get_name()
+                            for previous in batches[-1])):
+                batches[-1].append(test)
+            else:
+                batches.append([test])
+        return batches
+
     def run_tier(self, tier):
         """Run one tier"""
         tests = tier.get_tests()
@@ -204,18 +440,43 @@ class Runner():
                         "for the given scenario")
             self.overall_result = Result.EX_ERROR
         else:
-            for test in tests:
-                self.run_test(test)
-                test_case = self.executed_test_cases[test.get_name()]
-                if test_case.is_successful() == test_case.EX_TESTCASE_FAILED:
-                    LOGGER.error("The test case '%s' failed.", test.get_name())
-                    self.overall_result = Result.EX_ERROR
-                    if test.is_blocking():
-                        raise BlockingTestFailed(
-                            f"The test case {test.get_name()} "
-                            "failed and is blocking")
+            if any(test.get_depends_on() for test in tests):
+                LOGGER.warning("The test cases are run after their "
+                               "dependencies (depends_on) but even if they "
+                               "failed unless --dag is set")
+            for batch in self.get_batches(tests):
+                if len(batch) > 1:
+                    self.run_parallel_tests(batch)
+                else:
+                    self.run_test(batch[0])
+                    self.check_test(batch[0])
+        return self.overall_result
+
+    def run_dag(self, tiers):
+        """Run the test cases as soon as their dependencies have passed"""
+        plan = scheduler.Scheduler(tiers, self.durations)
+        LOGGER.info("EXECUTION PLAN:\n\n%s\n", plan)
+        results = plan.run(self.run_test, self.workers)
+        for test in plan.get_tests():
+            if test.get_name() in results:
+                self.check_test(test)
         return self.overall_result
 
+    def select_shard(self, index, count, durations=None):
+        """Keep only the test cases of the shard index (1-based)
+
+        The disabled and skipped test cases are listed by the first shard.
+        """
+        names = [test.get_name() for tier in self.tiers.get_tiers()
+                 for test in tier.get_tests()]
+        selection = shard.partition(names, count, durations)[index - 1]
+        LOGGER.info("Test cases of the shard %d/%d: %s", index, count,
+                    ' '.join(selection))
+        if index == 1:
+            selection += [test.get_name() for tier in self.tiers.get_tiers()
+                          for test in tier.get_skipped_test()]
+        self.tiers.select(selection)
+
     def run_all(self):
         """Run all available testcases"""
         tiers_to_run = []
@@ -230,53 +491,254 @@ class Runner():
                              textwrap.fill(' '.join([str(x.get_name(
                                  )) for x in tier.get_tests()]), width=40)])
         LOGGER.info("TESTS TO BE EXECUTED:\n\n%s\n", msg)
+        if self.dag_flag:
+            self.run_dag(tiers_to_run)
+            return
         for tier in tiers_to_run:
             self.run_tier(tier)
 
-    def main(self, **kwargs):  # pylint: disable=too-many-branches
+    def plan(self, selectors=None, tags=None, durations=None):
+        """Print the execution plan without running the test cases
+
+        The durations are predicted from the history or else from the
+        timings of the previous campaign (see shard.load_durations).
+        """
+        if not isinstance(selectors, list):
+            selectors = [selectors] if selectors else []
+        if selectors or tags:
+            try:
+                self.tiers.select(self.tiers.resolve(
+                    selectors or ['all'], tags))
+            except ValueError as exc:
+                LOGGER.error(exc)
+                return Result.EX_ERROR
+        predictions = shard.load_durations(durations or os.path.join(
+            constants.RESULTS_DIR, timings.JSON_FILE))
+        predictions.update(self.history.get_durations())
+        plan = planner.Planner(predictions, self.workers)
+        tiers = [tier for tier in self.tiers.get_tiers() if tier.get_tests()]
+        if self.dag_flag:
+            try:
+                dag = scheduler.Scheduler(tiers, self.durations)
+            except scheduler.DependencyError as exc:
+                LOGGER.error(exc)
+                return Result.EX_ERROR
+            plan.run_dag(dag, {test.get_name(): tier.get_name()
+                               for tier in tiers for test in tier.get_tests()})
+        else:
+            for tier in tiers:
+                for batch in self.get_batches(tier.get_tests()):
+                    plan.run_batch(
+                        self.sort_tests(batch) if len(batch) > 1 else batch,
+                        tier.get_name())
+        for tier in self.tiers.get_tiers():
+            for test in tier.get_skipped_test():
+                plan.skip(test.get_name(), tier.get_name(), 'SKIP')
+        LOGGER.info("EXECUTION PLAN:\n\n%s\n", plan)
+        LOGGER.info("Predicted duration: %s (%d worker(s))",
+                    planner.format_duration(plan.get_total()), self.workers)
+        return Result.EX_OK
+
+    def run_single_test(self, test):
+        """Run one test case outside of its tier"""
+        result = self.run_test(test)
+        if result == testcase.TestCase.EX_TESTCASE_FAILED:
+            LOGGER.error("The test case '%s' failed.", test.get_name())
+            self.overall_result = Result.EX_ERROR
+
+    def get_single_target(self, name):
+        """Return the callable running the tier or the test case or None"""
+        if self.tiers.get_tier(name) and self.dag_flag:
+            return functools.partial(self.run_dag, [self.tiers.get_tier(name)])
+        if self.tiers.get_tier(name):
+            return functools.partial(self.run_tier, self.tiers.get_tier(name))
+        if self.tiers.get_test(name):
+            return functools.partial(
+                self.run_single_test, self.tiers.get_test(name))
+        if name == "all":
+            return self.run_all
+        return None
+
+    def get_target(self, selectors, tags=None):
+        """Return the callable running the selection or None
+
+        One tier or one test case is run as is. The other selections
+        (several selectors, patterns or tags) run all the tiers restricted
+        to the selected test cases.
+        """
+        if not isinstance(selectors, list):
+            selectors = [selectors] if selectors else []
+        if not selectors and tags:
+            selectors = ['all']
+        if len(selectors) == 1 and not tags:
+            target = self.get_single_target(selectors[0])
+            if target:
+                return target
+        try:
+            names = self.tiers.resolve(selectors, tags)
+        except ValueError as exc:
+            LOGGER.error(exc)
+            return None
+        if not names:
+            return None
+        self.tiers.select(names)
+        return self.run_all
+
+    def report_empty_selection(self, selectors, tags=None):
+        """Log why the selection leaves no test case to run"""
+        if not isinstance(selectors, list):
+            selectors = [selectors] if selectors else []
+        try:
+            selected = tags and self.tiers.resolve(selectors or ['all'])
+        except ValueError:
+            selected = None
+        if selected:
+            LOGGER.error("No test case selected by '%s' has any of the "
+                         "tags '%s'.", ' '.join(selectors or ['all']),
+                         ' '.join(tags))
+        else:
+            LOGGER.error("Unknown test case or tier '%s', or not supported "
+                         "by the given scenario '%s'.", ' '.join(selectors),
+                         env.get('DEPLOY_SCENARIO'))
+        LOGGER.debug("Available tiers are:\n\n%s", self.tiers)
+
+    def run_iterations(self, target, repeat=None, duration=None):
+        """Run the test cases again and again
+
+        It stops after repeat iterations or once duration seconds have
+        elapsed (whichever comes first). A blocking failure only stops the
+        current iteration. The results of the last iteration are published
+        once with the statistics of all the iterations in their details.
+        """
+        if self.cache:
+            LOGGER.warning("The cached results are not reused when "
+                           "repeating the test cases")
+            self.cache = None
+        flags = (self.report_flag, self.push_flag, self.pipeline)
+        self.report_flag, self.push_flag, self.pipeline = False, False, None
+        start_time = time.time()
+        iteration = 0
+        try:
+            while ((repeat is None or iteration < repeat) and (
+                    duration is None or
+                    time.time() - start_time < duration)):
+                iteration += 1
+                LOGGER.info("Running the iteration %d...", iteration)
+                self.executed_test_cases = {}
+                self.checkpoint.reset()
+                try:
+                    target()
+                except BlockingTestFailed:
+                    pass
+                for name, test_case in self.executed_test_cases.items():
+                    if test_case.is_skipped:
+                        continue
+                    self.distributions.setdefault(
+                        name, stats.Distribution()).add(
+                            (test_case.stop_time or 0) - (
+                                test_case.start_time or 0),
+                            test_case.is_successful() ==
+                            testcase.TestCase.EX_OK)
+        finally:
+            self.report_flag, self.push_flag, self.pipeline = flags
+        for name, test_case in self.executed_test_cases.items():
+            if name not in self.distributions:
+                continue
+            if isinstance(test_case.details, dict):
+                test_case.details['iterations'] = self.distributions[
+                    name].to_dict()
+            if self.pipeline:
+                self.pipeline.put(test_case)
+            else:
+                self.publish(test_case)
+
+    def main(self, **kwargs):
+        # pylint: disable=too-many-branches,too-many-statements
         """Entry point of class Runner"""
+        test = kwargs.get('test')
+        if isinstance(test, list):
+            test = test[0] if len(test) == 1 else None
         if 'noclean' in kwargs:
             self.clean_flag = not kwargs['noclean']
         if 'report' in kwargs:
             self.report_flag = kwargs['report']
         if 'push' in kwargs:
             self.push_flag = kwargs['push']
+        if 'workers' in kwargs:
+            self.workers = kwargs['workers']
+        if 'dag' in kwargs:
+            self.dag_flag = kwargs['dag']
+        if 'isolate' in kwargs:
+            self.isolate_flag = kwargs['isolate']
+        if kwargs.get('resume'):
+            self.checkpoint.load()
+        if kwargs.get('reuse_results'):
+            self.cache = cache.Cache()
+        if kwargs.get('longest_first'):
+            self.durations = self.history.get_durations()
+        if kwargs.get('shard'):
+            if not kwargs.get('durations'):
+                LOGGER.warning("The shards are computed round-robin as no "
+                               "durations file is given (--durations)")
+            self.select_shard(*kwargs['shard'], shard.load_durations(
+                kwargs['durations']) if kwargs.get('durations') else None)
+        if kwargs.get('plan'):
+            return self.plan(kwargs.get('test'), kwargs.get('tags'),
+                             kwargs.get('durations'))
+        if kwargs.get('background') and (self.push_flag or self.report_flag):
+            self.pipeline = pipeline.Pipeline(self.publish)
         try:
             LOGGER.info("Deployment description:\n\n%s\n", env.string())
             self.source_envfile()
+            target = self.run_all
             if 'test' in kwargs:
                 LOGGER.debug("Test args: %s", kwargs['test'])
-                if self.tiers.get_tier(kwargs['test']):
-                    self.run_tier(self.tiers.get_tier(kwargs['test']))
-                elif self.tiers.get_test(kwargs['test']):
-                    result = self.run_test(
-                        self.tiers.get_test(kwargs['test']))
-                    if result == testcase.TestCase.EX_TESTCASE_FAILED:
-                        LOGGER.error("The test case '%s' failed.",
-                                     kwargs['test'])
-                        self.overall_result = Result.EX_ERROR
-                elif kwargs['test'] == "all":
-                    self.run_all()
-                else:
-                    LOGGER.error("Unknown test case or tier '%s', or not "
-                                 "supported by the given scenario '%s'.",
-                                 kwargs['test'],
-                                 env.get('DEPLOY_SCENARIO'))
-                    LOGGER.debug("Available tiers are:\n\n%s",
-                                 self.tiers)
+                target = self.get_target(kwargs['test'], kwargs.get('tags'))
+                if not target:
+                    self.report_empty_selection(
+                        kwargs['test'], kwargs.get('tags'))
                     return Result.EX_ERROR
+            if kwargs.get('repeat') or kwargs.get('soak_duration'):
+                self.run_iterations(
+                    target, kwargs.get('repeat'), kwargs.get('soak_duration'))
             else:
-                self.run_all()
+                target()
         except BlockingTestFailed:
             pass
         except Exception:  # pylint: disable=broad-except
             LOGGER.exception("Failures when running testcase(s)")
             self.overall_result = Result.EX_ERROR
-        if not self.tiers.get_test(kwargs['test']):
-            self.summary(self.tiers.get_tier(kwargs['test']))
+        if self.pipeline:
+            LOGGER.info("Waiting for the pending publications...")
+            self.pipeline.join()
+        self.reporter.flush()
+        try:
+            self.timings.dump()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot dump the timings")
+        tier = self.tiers.get_tier(test) if test else None
+        if tier or not self.tiers.get_test(test):
+            self.summary(tier)
+        if self.distributions:
+            self.summary_iterations()
+        if self.publication_errors:
+            self.summary_publications()
         LOGGER.info("Execution exit value: %s", self.overall_result)
         return self.overall_result
 
+    def summary_iterations(self):
+        """Report the pass rates and the durations of the iterations"""
+        msg = prettytable.PrettyTable(
+            header_style='upper', padding_width=5,
+            field_names=['test case', 'iterations', 'pass rate', 'min',
+                         'mean', 'p50', 'p95', 'p99', 'max'])
+        for name, distribution in self.distributions.items():
+            data = distribution.to_dict()
+            msg.add_row([name, data['iterations'], f"{data['pass_rate']}%"] +
+                        [data[key] for key in [
+                            'min', 'mean', 'p50', 'p95', 'p99', 'max']])
+        LOGGER.info("Iterations:\n\n%s\n", msg)
+
     def summary(self, tier=None):
         """To generate xtesting report showing the overall results"""
         msg = prettytable.PrettyTable(
@@ -306,6 +768,15 @@ class Runner():
                              each_tier.get_name(), "00:00", "SKIP"])
         LOGGER.info("Xtesting report:\n\n%s\n", msg)
 
+    def summary_publications(self):
+        """Report the artifacts and the results which were not published"""
+        msg = prettytable.PrettyTable(
+            header_style='upper', padding_width=5,
+            field_names=['test case', 'failures'])
+        for name, steps in self.publication_errors.items():
+            msg.add_row([name, ' '.join(steps)])
+        LOGGER.error("Publication failures:\n\n%s\n", msg)
+
 
 def main():
     """Entry point"""
@@ -328,5 +799,14 @@ def main():
     # e.g. pyats fails by expecting an arg to -p (publish to database) when
     # called via Robot.run()
     sys.argv = [sys.argv[0]]
-    runner = Runner()
+    if args.pop('serve'):
+        # pylint: disable=import-outside-toplevel
+        from xtesting.ci import server
+        return server.serve(Runner, args, args['socket'],
+                            cache_dir=constants.CACHE_DIR)
+    runner = Runner(tier_builder.TierBuilder(
+        config.get_xtesting_config(
+            constants.TESTCASE_DESCRIPTION,
+            constants.TESTCASE_DESCRIPTION_DEFAULT),
+        cache_dir=constants.CACHE_DIR))
     return runner.main(**args).value
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Scheduler running the test cases according to their dependencies
+
+The test cases may list the test cases they depend on (depends_on) in
+testcases.yaml whatever their tiers. A test case is started as soon as all
+its prerequisites have passed and is never run if one of them fails or is
+skipped.
+"""
+
+from concurrent import futures
+import logging
+import textwrap
+
+import prettytable
+
+from xtesting.ci import history
+from xtesting.core import testcase
+
+LOGGER = logging.getLogger('xtesting.ci.scheduler')
+
+
+class DependencyError(Exception):
+    """Exception when the dependencies cannot be scheduled"""
+
+
+class Scheduler():
+    """Directed acyclic graph of the test cases to be executed"""
+
+    def __init__(self, tiers, durations=None):
+        self.tests = {}
+        for tier in tiers:
+            for test in tier.get_tests():
+                self.tests[test.get_name()] = test
+        self.order = {name: index for index, name in enumerate(self.tests)}
+        self.by_duration = None if durations is None else (
+            history.by_duration(durations))
+        self.dependents = {name: [] for name in self.tests}
+        self.unmet = {}
+        for name, test in self.tests.items():
+            for dependency in test.get_depends_on():
+                if dependency in self.tests:
+                    self.dependents[dependency].append(name)
+                else:
+                    self.unmet.setdefault(name, []).append(dependency)
+        self.stages = self.sort()
+
+    def sort(self):
+        """Sort the test cases by stages and detect the cycles
+
+        Returns:
+            the list of stages, each of them listing the test cases which
+            only depend on the previous stages
+
+        Raises:
+            DependencyError if the dependencies form a cycle
+        """
+        indegrees = {name: len([
+            dependency for dependency in test.get_depends_on()
+            if dependency in self.tests]) for name, test in self.tests.items()}
+        stages = []
+        stage = [name for name, value in indegrees.items() if not value]
+        while stage:
+            stages.append(stage)
+            next_stage = []
+            for name in stage:
+                for dependent in self.dependents[name]:
+                    indegrees[dependent] -= 1
+                    if not indegrees[dependent]:
+                        next_stage.append(dependent)
+            stage = sorted(next_stage, key=self.order.get)
+        cycle = [name for name, value in indegrees.items() if value]
+        if cycle:
+            raise DependencyError(
+                f"The dependencies of {', '.join(cycle)} form a cycle")
+        return stages
+
+    def get_priority(self, name):
+        """Return the sort key of the test cases ready to be started
+
+        The longest test cases are started first if their durations are
+        known. They are started in the catalog order otherwise.
+        """
+        if self.by_duration is None:
+            return self.order[name]
+        return (self.by_duration(name), self.order[name])
+
+    def get_tests(self):
+        """Return the test cases in the catalog order"""
+        return list(self.tests.values())
+
+    def run(self, run_test, workers=1):
+        """Run the test cases as soon as their prerequisites have passed
+
+        No test case is started once a blocking test case has failed.
+
+        Args:
+            run_test: the callable running one test case and returning
+                its result (e.g. Runner.run_test)
+            workers: the maximum number of test cases run at the same time
+
+        Returns:
+            the results of the test cases which were started by names
+        """
+        for name, dependencies in self.unmet.items():
+            LOGGER.warning("The test case '%s' depends on %s which will not "
+                           "be executed", name, ', '.join(dependencies))
+        waiting = {name: {dependency for dependency in test.get_depends_on()
+                          if dependency in self.tests}
+                   for name, test in self.tests.items()
+                   if name not in self.unmet}
+        ready = sorted([name for name, value in waiting.items() if not value],
+                       key=self.get_priority)
+        results = {}
+        stop = False
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while running or (ready and not stop):
+                while ready and not stop and len(running) < workers:
+                    name = ready.pop(0)
+                    running[pool.submit(run_test, self.tests[name])] = name
+                done, _ = futures.wait(
+                    running, return_when=futures.FIRST_COMPLETED)
+                for job in done:
+                    name = running.pop(job)
+                    results[name] = job.result()
+                    if results[name] == testcase.TestCase.EX_OK:
+                        for dependent in self.dependents[name]:
+                            if dependent not in waiting:
+                                continue
+                            waiting[dependent].discard(name)
+                            if not waiting[dependent]:
+                                ready.append(dependent)
+                        ready.sort(key=self.get_priority)
+                    elif self.tests[name].is_blocking():
+                        stop = True
+        for name in self.tests:
+            if name not in results:
+                LOGGER.info("The test case '%s' was not started.", name)
+        return results
+
+    def __str__(self):
+        msg = prettytable.PrettyTable(
+            header_style='upper', padding_width=5,
+            field_names=['stage', 'test case', 'depends on'])
+        for index, stage in enumerate(self.stages):
+            for name in stage:
+                msg.add_row([index + 1, name, textwrap.fill(' '.join(
+                    self.tests[name].get_depends_on()), width=40)])
+        return msg.get_string()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Resident run_tests process listening on a Unix socket
+
+run_tests --serve keeps one warm process (imported modules, logging
+configuration and parsed testcases.yaml) which runs the campaigns
+requested by the clients one after the other. testcases.yaml is parsed
+again only if it or any file it includes has changed.
+
+A request is one JSON line listing the run_tests arguments, e.g.
+{"test": "first", "report": true}. The logs are streamed back as JSON lines
+({"log": "..."}) while the campaign runs and the last line holds the exit
+value and the result records of the test cases ({"result": 0,
+"test_cases": [...]}) or the error ({"error": "..."}).
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+
+from xtesting.ci import record
+from xtesting.ci import tier_builder
+from xtesting.utils import config
+from xtesting.utils import constants
+
+LOGGER = logging.getLogger('xtesting.ci.server')
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class StreamHandler(logging.Handler):
+    """Logging handler sending the records to the client"""
+
+    def __init__(self, send, level=logging.INFO):
+        super().__init__(level)
+        self.send = send
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def emit(self, record):  # pylint: disable=redefined-outer-name
+        try:
+            self.send({'log': self.format(record)})
+        except OSError:
+            # the client has gone, the campaign goes on
+            pass
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Run the campaign requested by the client"""
+
+    def send(self, data):
+        """Send one JSON line to the client"""
+        self.wfile.write(json.dumps(data, default=str).encode() + b'\n')
+        self.wfile.flush()
+
+    def handle(self):
+        try:
+            kwargs = self.server.get_kwargs(
+                json.loads(self.rfile.readline()))
+        except (ValueError, TypeError) as exc:
+            self.send({'error': f"Wrong request: {exc}"})
+            return
+        handler = StreamHandler(self.send)
+        logging.getLogger().addHandler(handler)
+        try:
+            runner = self.server.runner_class(self.server.get_tiers())
+            result = runner.main(**kwargs)
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot run %s", kwargs)
+            self.send({'error': str(exc)})
+            return
+        finally:
+            logging.getLogger().removeHandler(handler)
+        self.send({'result': result.value, 'test_cases': [
+            record.dump(test_case)
+            for test_case in runner.executed_test_cases.values()]})
+
+
+class Server(socketserver.UnixStreamServer):
+    """Unix socket server running the campaigns one after the other"""
+
+    def __init__(self, runner_class, defaults, path=constants.SOCKET_PATH,
+                 cache_dir=None):
+        if os.path.exists(path):
+            os.remove(path)
+        super().__init__(path, Handler)
+        self.runner_class = runner_class
+        self.cache_dir = cache_dir
+        self.defaults = {key: value for key, value in defaults.items()
+                         if key not in ['serve', 'socket']}
+        self.tiers = None
+
+    def get_kwargs(self, data):
+        """Return the run_tests arguments of the request"""
+        if not isinstance(data, dict):
+            raise TypeError("the request is not a JSON object")
+        unknown = set(data) - set(self.defaults)
+        if unknown:
+            raise ValueError(
+                f"unknown arguments {', '.join(sorted(unknown))}")
+        kwargs = dict(self.defaults)
+        kwargs.update(data)
+        return kwargs
+
+    def get_tiers(self):
+        """Return the tiers parsing testcases.yaml again if it has changed
+
+        The files included by testcases.yaml are checked too (see
+        TierBuilder.sources).
+        """
+        path = config.get_xtesting_config(
+            constants.TESTCASE_DESCRIPTION,
+            constants.TESTCASE_DESCRIPTION_DEFAULT)
+        if (not self.tiers or self.tiers.testcases_file != path or
+                self.tiers.is_modified()):
+            LOGGER.info("Loading %s", path)
+            self.tiers = tier_builder.TierBuilder(
+                path, cache_dir=self.cache_dir)
+        else:
+            self.tiers.generate_tiers()
+        return self.tiers
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+def serve(runner_class, defaults, path=constants.SOCKET_PATH,
+          cache_dir=None):
+    """Run the campaigns requested on the Unix socket until interrupted
+
+    Args:
+        runner_class: the class running the campaigns (run_tests.Runner)
+        defaults: the default run_tests arguments (e.g. the flags given
+                  with --serve)
+        path: the path of the Unix socket
+        cache_dir: the directory of the catalog cache (see TierBuilder)
+    """
+    with Server(runner_class, defaults, path, cache_dir) as server:
+        LOGGER.info("Listening on %s", path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            LOGGER.info("Stopping")
+    return os.EX_OK
+
+
+def request(path=constants.SOCKET_PATH, **kwargs):
+    """Request a campaign to the resident process
+
+    It yields the JSON lines sent back (logs and then result).
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(kwargs).encode() + b'\n')
+        with sock.makefile('rb') as stream:
+            for line in stream:
+                yield json.loads(line)
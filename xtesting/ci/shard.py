@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Split a campaign across several nodes
+
+The enabled test cases are partitioned into balanced shards according to
+their durations recorded by a previous campaign (longest processing time
+first) or round-robin if no duration is known. All the nodes must then
+pass the same durations file (--durations) to compute the same partition:
+the timings file of RESULTS_DIR is never used as it is local to the node
+and overwritten by every shard.
+"""
+
+import argparse
+import json
+import logging
+import os
+
+from xtesting.ci import timings
+from xtesting.utils import constants
+
+LOGGER = logging.getLogger('xtesting.ci.shard')
+
+PUBLICATION_PHASES = ['publish_artifacts', 'push_to_db']
+
+
+def parse(value):
+    """Parse i/N into the 1-based index of the shard and the shard count"""
+    try:
+        index, count = (int(item) for item in value.split('/'))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"{value} is not formatted as i/N") from exc
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"{value} is not a shard between 1/{count} and {count}/{count}")
+    return index, count
+
+
+def load_durations(path=os.path.join(
+        constants.RESULTS_DIR, timings.JSON_FILE)):
+    """Return the durations of the test cases recorded in the timings file
+
+    The publication phases are excluded as they may run in background.
+    """
+    try:
+        with open(path, encoding='utf-8') as tfile:
+            testcases = json.load(tfile).get('testcases', {})
+    except (OSError, ValueError):
+        LOGGER.info("No durations can be read from %s", path)
+        return {}
+    return {name: sum(duration for phase, duration in phases.items()
+                      if phase not in PUBLICATION_PHASES)
+            for name, phases in testcases.items()}
+
+
+def partition(names, count, durations=None):
+    """Partition the test cases into count balanced shards
+
+    The test cases without any recorded duration are given the mean of the
+    known durations. The test cases keep their order in every shard.
+
+    Returns:
+        the list of the shards which are the lists of their test cases
+    """
+    durations = {name: durations[name] for name in names
+                 if name in (durations or {})}
+    if not durations:
+        return [names[index::count] for index in range(count)]
+    mean = sum(durations.values()) / len(durations)
+    loads = [0] * count
+    assignment = {}
+    for name in sorted(names, key=lambda name: -durations.get(name, mean)):
+        index = loads.index(min(loads))
+        assignment[name] = index
+        loads[index] += durations.get(name, mean)
+    LOGGER.debug("Expected durations of the shards: %s", loads)
+    return [[name for name in names if assignment[name] == index]
+            for index in range(count)]
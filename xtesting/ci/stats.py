@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Streaming statistics of the repeated test cases
+
+The distributions of the durations are computed in constant memory
+whatever the number of iterations. The percentiles are exact for the first
+SAMPLES iterations and then estimated by the P-square algorithm (Jain and
+Chlamtac) which only keeps five markers.
+"""
+
+PERCENTILES = [50, 95, 99]
+SAMPLES = 1000
+
+
+def _interpolate(values, quantile):
+    """Return the quantile of the sorted values"""
+    rank = quantile * (len(values) - 1)
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (rank - lower) * (values[upper] - values[lower])
+
+
+class P2():
+    """Streaming estimator of one quantile (0 < quantile < 1)"""
+
+    def __init__(self, quantile):
+        self.quantile = quantile
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile,
+                        3 + 2 * quantile, 5]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def _parabolic(self, i, sign):
+        heights, positions = self.heights, self.positions
+        return heights[i] + sign / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + sign) *
+            (heights[i + 1] - heights[i]) /
+            (positions[i + 1] - positions[i]) +
+            (positions[i + 1] - positions[i] - sign) *
+            (heights[i] - heights[i - 1]) /
+            (positions[i] - positions[i - 1]))
+
+    def _linear(self, i, sign):
+        return self.heights[i] + sign * (
+            self.heights[i + sign] - self.heights[i]) / (
+                self.positions[i + sign] - self.positions[i])
+
+    def add(self, value):
+        """Add one observation"""
+        heights = self.heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = max(i for i in range(4) if heights[i] <= value)
+        for i in range(cell + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        for i in range(1, 4):
+            delta = self.desired[i] - self.positions[i]
+            if (delta >= 1 and self.positions[i + 1] - self.positions[i] > 1
+                    or delta <= -1 and
+                    self.positions[i - 1] - self.positions[i] < -1):
+                sign = 1 if delta > 0 else -1
+                height = self._parabolic(i, sign)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, sign)
+                heights[i] = height
+                self.positions[i] += sign
+
+    def get(self):
+        """Return the estimated quantile or None without observation"""
+        if not self.heights:
+            return None
+        if self.positions[4] == 5:
+            return _interpolate(self.heights, self.quantile)
+        return self.heights[2]
+
+
+class Distribution():
+    """Results and durations of the iterations of one test case"""
+
+    def __init__(self):
+        self.iterations = 0
+        self.passed = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.samples = []
+        self.percentiles = {
+            percentile: P2(percentile / 100) for percentile in PERCENTILES}
+
+    def add(self, duration, passed):
+        """Add the duration in seconds and the result of one iteration"""
+        self.iterations += 1
+        self.passed += int(passed)
+        self.total += duration
+        self.minimum = duration if self.minimum is None else min(
+            self.minimum, duration)
+        self.maximum = duration if self.maximum is None else max(
+            self.maximum, duration)
+        if len(self.samples) < SAMPLES:
+            self.samples.append(duration)
+        for estimator in self.percentiles.values():
+            estimator.add(duration)
+
+    def to_dict(self):
+        """Return the pass rate (%) and the statistics of the durations"""
+        if not self.iterations:
+            return {'iterations': 0}
+        data = {
+            'iterations': self.iterations,
+            'pass_rate': round(100 * self.passed / self.iterations, 2),
+            'min': round(self.minimum, 3),
+            'mean': round(self.total / self.iterations, 3),
+            'max': round(self.maximum, 3)}
+        samples = sorted(self.samples)
+        for percentile, estimator in self.percentiles.items():
+            data[f'p{percentile}'] = round(
+                _interpolate(samples, percentile / 100)
+                if self.iterations <= SAMPLES else estimator.get(), 3)
+        return data
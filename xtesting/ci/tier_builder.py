@@ -7,110 +7,476 @@
 # which accompanies this distribution, and is available at
 # http://www.apache.org/licenses/LICENSE-2.0
 
-"""TierBuilder class to parse testcases config file"""
+"""TierBuilder class to parse testcases config file
 
+testcases.yaml may include other files listing tiers (include, glob
+patterns relative to the including file) whose tiers follow its own ones.
+The test cases of a tier may also be described in a separate file (tier
+include instead of testcases) which is only parsed once the tier or one
+of its test cases is needed, e.g.:
+
+tiers:
+    -
+        name: healthcheck
+        include: healthcheck.yaml
+include:
+    - testcases.d/*.yaml
+
+A test case may be a template listing the values of its parameters
+(matrix). It is expanded into one test case per combination of the values
+where the placeholders {{ parameter }} are replaced. The generated names
+only depend on the values (e.g. ping-host1-5 or the case_name template
+filled in) and the test case descriptions are only built on demand:
+
+-
+    case_name: ping
+    project_name: xtesting
+    matrix:
+        host: [host1, host2]
+        count: [5, 100]
+    run:
+        name: bashfeature
+        args:
+            cmd: ping -c {{ count }} {{ host }}
+
+The tiers may be saved in a cache directory once built. They are then
+reloaded as long as testcases.yaml and the env values their dependencies
+were evaluated with are unchanged.
+"""
+
+import fnmatch
+import functools
+import glob
+import hashlib
+import itertools
+import logging
+import os
+import pickle
 import re
 import yaml
 
 from xtesting.ci import tier_handler
 from xtesting.utils import env
+from xtesting.utils import files
+
+LOGGER = logging.getLogger('xtesting.ci.tier_builder')
+
+# the libyaml bindings are much faster if available
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+PLACEHOLDER = re.compile(r'{{\s*(\w+)\s*}}')
+
+CATALOG_VERSION = 4
+CATALOG_ATTRS = ['dic_tier_array', 'tier_objects', 'testcases_yaml',
+                 'catalog', 'index', 'tiers_by_name', 'tiers_by_test',
+                 'variables', 'lazy', 'sources']
+
+
+def get_stat(path):
+    """Return the modification time and the size of the file or None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def is_modified(sources):
+    """Check if any of the files read has changed since"""
+    return any(get_stat(path) != value for path, value in sources.items())
+
+
+@functools.lru_cache(maxsize=None)
+def compile_dependency(pattern):
+    """Return the regular expression of the dependency compiled once"""
+    return re.compile(pattern)
+
+
+def substitute(value, params):
+    """Replace the placeholders {{ parameter }} by the parameter values
+
+    A string only made of one placeholder is replaced by the value as is
+    (e.g. a list or an int). The unknown placeholders are kept.
+    """
+    if isinstance(value, str):
+        match = PLACEHOLDER.fullmatch(value)
+        if match and match.group(1) in params:
+            return params[match.group(1)]
+        return PLACEHOLDER.sub(lambda match: str(params.get(
+            match.group(1), match.group(0))), value)
+    if isinstance(value, dict):
+        return {key: substitute(item, params) for key, item in value.items()}
+    if isinstance(value, list):
+        return [substitute(item, params) for item in value]
+    return value
+
+
+def get_case_name(template, params):
+    """Return the stable name of the test case generated by the matrix"""
+    if PLACEHOLDER.search(template['case_name']):
+        return str(substitute(template['case_name'], params))
+    return '-'.join([template['case_name']] + [
+        re.sub(r'[^\w.]', '_', str(value)) for value in params.values()])
+
+
+class Variant():
+    """Test case generated by the matrix of a template"""
+
+    __slots__ = ['template', 'values']
+
+    def __init__(self, template, values):
+        self.template = template
+        self.values = values
+
+    def get_params(self):
+        """Return the values of the parameters by names"""
+        return dict(zip(self.template['matrix'], self.values))
+
+    def get_name(self):
+        """Return the generated name of the test case"""
+        return get_case_name(self.template, self.get_params())
+
+    def get_dict(self):
+        """Return the description of the test case built from the template"""
+        params = self.get_params()
+        test_dict = substitute({key: value for key, value in (
+            self.template.items()) if key != 'matrix'}, params)
+        test_dict['case_name'] = get_case_name(self.template, params)
+        return test_dict
+
+
+def expand(dic_testcase):
+    """Yield the test cases generated by the matrix one by one"""
+    if 'matrix' not in dic_testcase:
+        yield dic_testcase
+        return
+    for values in itertools.product(*dic_testcase['matrix'].values()):
+        yield Variant(dic_testcase, values)
 
 
 class TierBuilder():
-    # pylint: disable=missing-docstring
+    # pylint: disable=missing-docstring,too-many-instance-attributes
+    # pylint: disable=too-many-public-methods
 
-    def __init__(self, testcases_file):
+    def __init__(self, testcases_file, cache_dir=None):
         self.ci_installer = env.get('INSTALLER_TYPE')
         self.ci_scenario = env.get('DEPLOY_SCENARIO')
         self.testcases_file = testcases_file
+        self.cache_file = None
+        if cache_dir:
+            digest = hashlib.sha256(
+                os.path.abspath(testcases_file).encode()).hexdigest()
+            self.cache_file = os.path.join(
+                cache_dir, f'catalog-{digest}.pickle')
         self.dic_tier_array = None
         self.tier_objects = []
         self.testcases_yaml = None
-        self.generate_tiers()
+        self.catalog = {}
+        self.index = {}
+        self.tiers_by_name = {}
+        self.tiers_by_test = {}
+        self.variables = {}
+        self.lazy = {}
+        self.sources = {}
+        if not self.load_catalog():
+            self.generate_tiers()
+            if not self.lazy:
+                self.dump_catalog()
 
-    def read_test_yaml(self):
-        with open(self.testcases_file, encoding='utf-8') as tc_file:
-            self.testcases_yaml = yaml.safe_load(tc_file)
+    def get_catalog_key(self):
+        return CATALOG_VERSION, os.path.abspath(self.testcases_file)
+
+    def load_catalog(self):
+        """Reload the tiers from the cache file if still valid"""
+        if not self.cache_file:
+            return False
+        try:
+            with open(self.cache_file, 'rb') as cfile:
+                data = pickle.load(cfile)
+            if data['key'] != self.get_catalog_key() or is_modified(
+                    data['sources']) or any(
+                        env.get(key) != value
+                        for key, value in data['variables'].items()):
+                LOGGER.debug("The cache file %s is outdated", self.cache_file)
+                return False
+            for attr in CATALOG_ATTRS:
+                setattr(self, attr, data[attr])
+        except OSError:
+            return False
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot load the cache file %s", self.cache_file)
+            return False
+        LOGGER.debug("The tiers are loaded from %s", self.cache_file)
+        return True
+
+    def dump_catalog(self):
+        """Save the tiers in the cache file"""
+        if not self.cache_file:
+            return
+        try:
+            data = {attr: getattr(self, attr) for attr in CATALOG_ATTRS}
+            data['key'] = self.get_catalog_key()
+            files.write_atomically(self.cache_file, pickle.dumps(
+                data, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot save the cache file %s", self.cache_file)
+
+    def is_modified(self):
+        """Check if testcases.yaml or any file it includes has changed"""
+        return is_modified(self.sources)
 
+    def read_fragment(self, path):
+        self.sources[path] = get_stat(path)
+        with open(path, encoding='utf-8') as tc_file:
+            return yaml.load(tc_file, Loader=LOADER)
+
+    def read_test_yaml(self):
         self.dic_tier_array = []
-        for tier in self.testcases_yaml.get("tiers"):
+        self.catalog = {}
+        self.lazy = {}
+        self.sources = {}
+        self.testcases_yaml = self.read_fragment(self.testcases_file)
+        self.read_tiers(
+            self.testcases_yaml, os.path.dirname(self.testcases_file))
+
+    def read_tiers(self, testcases, dirname):
+        """Read the tiers and the included files but not the tier includes"""
+        for tier in testcases.get("tiers") or []:
             self.dic_tier_array.append(tier)
+            if 'testcases' not in tier and 'include' in tier:
+                self.lazy[tier['name']] = os.path.join(
+                    dirname, tier['include'])
+                continue
+            self.add_testcases(tier)
+        for pattern in testcases.get("include") or []:
+            pattern = os.path.join(dirname, pattern)
+            # the directory is modified if files are added or removed
+            self.sources[os.path.dirname(pattern)] = get_stat(
+                os.path.dirname(pattern))
+            for path in sorted(glob.glob(pattern)):
+                self.read_tiers(
+                    self.read_fragment(path), os.path.dirname(path))
+
+    def load_tier(self, tier_name):
+        """Parse the tier include if the tier is not loaded yet"""
+        path = self.lazy.pop(tier_name, None)
+        if not path:
+            return
+        LOGGER.debug("Loading the tier %s from %s", tier_name, path)
+        dic_tier = next(tier for tier in self.dic_tier_array
+                        if tier['name'] == tier_name)
+        dic_tier['testcases'] = self.read_fragment(path).get(
+            'testcases') or []
+        self.add_testcases(dic_tier)
+        self.build_tier(dic_tier)
+        order = {tier['name']: index
+                 for index, tier in enumerate(self.dic_tier_array)}
+        self.tier_objects.sort(key=lambda tier: order[tier.get_name()])
+        self.index = {name: test for tier in self.tier_objects
+                      for name, test in tier.index.items()}
+        if not self.lazy:
+            self.dump_catalog()
+
+    def add_testcases(self, dic_tier):
+        """Add the test cases to the catalog
+
+        The test cases generated by a matrix are only described by their
+        variants until get_dict_by_test is called.
+
+        Raises:
+            ValueError if a generated name is already taken (e.g. by
+            matrix values only differing by the characters sanitized)
+        """
+        for dic_testcase in dic_tier['testcases']:
+            for test in expand(dic_testcase):
+                if isinstance(test, Variant):
+                    name = test.get_name()
+                else:
+                    name = test['case_name']
+                if name in self.catalog and (isinstance(
+                        test, Variant) or isinstance(
+                            self.catalog[name], Variant)):
+                    raise ValueError(
+                        f"Duplicate test case {name} in the tier "
+                        f"{dic_tier['name']} (the names generated by the "
+                        "matrices must be unique)")
+                self.catalog[name] = test
+
+    def load_tiers(self):
+        """Parse all the tier includes not loaded yet"""
+        for tier_name in list(self.lazy):
+            self.load_tier(tier_name)
+
+    def load_test(self, test_name):
+        """Parse all the tier includes if the test case is not loaded"""
+        if test_name not in self.catalog:
+            self.load_tiers()
 
     def generate_tiers(self):
         if self.dic_tier_array is None:
             self.read_test_yaml()
 
         del self.tier_objects[:]
+        self.index = {}
+        self.tiers_by_name = {}
+        self.tiers_by_test = {}
+        self.variables = {}
         for dic_tier in self.dic_tier_array:
-            tier = tier_handler.Tier(
-                name=dic_tier['name'],
-                description=dic_tier.get('description', ''))
-            for dic_testcase in dic_tier['testcases']:
-                testcase = tier_handler.TestCase(
-                    name=dic_testcase['case_name'],
-                    enabled=dic_testcase.get('enabled', True),
-                    skipped=False,
-                    criteria=dic_testcase.get('criteria', 100),
-                    blocking=dic_testcase.get('blocking', True),
-                    description=dic_testcase.get('description', ''),
-                    project=dic_testcase['project_name'])
-                if not dic_testcase.get('dependencies'):
-                    if testcase.is_enabled():
-                        tier.add_test(testcase)
-                    else:
-                        testcase.skipped = True
-                        tier.skip_test(testcase)
-                else:
-                    for dependency in dic_testcase['dependencies']:
-                        kenv = list(dependency.keys())[0]
-                        if not re.search(dependency[kenv],
-                                         env.get(kenv) or ''):
-                            testcase.skipped = True
-                            tier.skip_test(testcase)
-                            break
-                    else:
-                        if testcase.is_enabled():
-                            tier.add_test(testcase)
-                        else:
-                            testcase.skipped = True
-                            tier.skip_test(testcase)
-            self.tier_objects.append(tier)
+            if dic_tier['name'] not in self.lazy:
+                self.build_tier(dic_tier)
+
+    def build_tier(self, dic_tier):
+        tier = tier_handler.Tier(
+            name=dic_tier['name'],
+            description=dic_tier.get('description', ''))
+        for dic_testcase in self.iter_testcases(dic_tier):
+            testcase = tier_handler.TestCase(
+                name=dic_testcase['case_name'],
+                enabled=dic_testcase.get('enabled', True),
+                skipped=False,
+                criteria=dic_testcase.get('criteria', 100),
+                blocking=dic_testcase.get('blocking', True),
+                description=dic_testcase.get('description', ''),
+                project=dic_testcase['project_name'],
+                parallel=dic_testcase.get('parallel', False),
+                depends_on=dic_testcase.get('depends_on', []),
+                tags=dic_testcase.get('tags', []))
+            self.index[testcase.get_name()] = testcase
+            self.tiers_by_test[testcase.get_name()] = tier
+            if testcase.is_enabled() and self.check_dependencies(
+                    dic_testcase.get('dependencies') or []):
+                tier.add_test(testcase)
+            else:
+                testcase.skipped = True
+                tier.skip_test(testcase)
+        self.tier_objects.append(tier)
+        self.tiers_by_name[tier.get_name()] = tier
+
+    @staticmethod
+    def iter_testcases(dic_tier):
+        """Yield the descriptions of the test cases of the tier"""
+        for dic_testcase in dic_tier['testcases']:
+            for test in expand(dic_testcase):
+                yield test.get_dict() if isinstance(test, Variant) else test
+
+    def check_dependencies(self, dependencies):
+        """Return True if all the env values match the dependencies
+
+        The env values are read once and recorded as they also validate
+        the cache file.
+        """
+        for dependency in dependencies:
+            kenv = list(dependency.keys())[0]
+            if kenv not in self.variables:
+                self.variables[kenv] = env.get(kenv)
+            if not compile_dependency(dependency[kenv]).search(
+                    self.variables[kenv] or ''):
+                return False
+        return True
+
+    def match(self, selector):
+        """Return the names of the test cases matching the selector
+
+        The selector is 'all', a tier name, a test case name, a glob
+        pattern or a regular expression prefixed by 're:'. The patterns
+        are matched against the tier names and the test case names.
+        """
+        self.load_tiers()
+        if selector == 'all':
+            return list(self.index)
+        tier = self.get_tier(selector)
+        if tier:
+            return [test.get_name() for test in (
+                tier.get_tests() + tier.get_skipped_test())]
+        if selector in self.index:
+            return [selector]
+        try:
+            if selector.startswith('re:'):
+                matches = re.compile(selector[3:]).search
+            elif any(char in selector for char in '*?['):
+                matches = re.compile(fnmatch.translate(selector)).match
+            else:
+                return []
+        except re.error as exc:
+            raise ValueError(f"Wrong pattern {selector}: {exc}") from exc
+        names = []
+        for tier in self.tier_objects:
+            for test in tier.get_tests() + tier.get_skipped_test():
+                if matches(tier.get_name()) or matches(test.get_name()):
+                    names.append(test.get_name())
+        return names
+
+    def resolve(self, selectors, tags=None):
+        """Return the names of the selected test cases in the tiers order
+
+        The test cases are selected by any of the selectors (see match)
+        and, if tags are given, by any of the tags.
+
+        Raises:
+            ValueError if a selector matches no test case
+        """
+        self.load_tiers()
+        names = set()
+        unknown = []
+        for selector in selectors:
+            matches = self.match(selector)
+            if not matches:
+                unknown.append(selector)
+            names.update(matches)
+        if unknown:
+            raise ValueError(
+                f"Unknown test cases or tiers: {', '.join(unknown)}")
+        if tags:
+            names = {name for name in names if set(tags).intersection(
+                self.index[name].get_tags())}
+        return [name for name in self.index if name in names]
+
+    def select(self, test_names):
+        self.load_tiers()
+        test_names = set(test_names)
+        for tier in self.tier_objects:
+            tier.select(test_names)
+
+    def get_dict_by_test(self, test_name):
+        self.load_test(test_name)
+        test_dict = self.catalog.get(test_name)
+        if isinstance(test_dict, Variant):
+            return test_dict.get_dict()
+        return test_dict
 
     def get_tiers(self):
+        self.load_tiers()
         return self.tier_objects
 
     def get_tier_names(self):
-        tier_names = []
-        for tier in self.tier_objects:
-            tier_names.append(tier.get_name())
-        return tier_names
+        return [tier['name'] for tier in self.dic_tier_array]
 
     def get_tier(self, tier_name):
-        for i, _ in enumerate(self.tier_objects):
-            if self.tier_objects[i].get_name() == tier_name:
-                return self.tier_objects[i]
-        return None
+        self.load_tier(tier_name)
+        return self.tiers_by_name.get(tier_name)
 
     def get_tier_name(self, test_name):
-        for i, _ in enumerate(self.tier_objects):
-            if self.tier_objects[i].is_test(test_name):
-                return self.tier_objects[i].name
+        self.load_test(test_name)
+        tier = self.tiers_by_test.get(test_name)
+        if tier and tier.is_test(test_name):
+            return tier.name
         return None
 
     def get_test(self, test_name):
-        for i, _ in enumerate(self.tier_objects):
-            if self.tier_objects[i].is_test(test_name):
-                return self.tier_objects[i].get_test(test_name)
+        self.load_test(test_name)
+        tier = self.tiers_by_test.get(test_name)
+        if tier:
+            return tier.get_test(test_name)
         return None
 
     def get_tests(self, tier_name):
-        for i, _ in enumerate(self.tier_objects):
-            if self.tier_objects[i].get_name() == tier_name:
-                return self.tier_objects[i].get_tests()
+        tier = self.get_tier(tier_name)
+        if tier:
+            return tier.get_tests()
         return None
 
     def __str__(self):
         output = ""
-        for i, _ in enumerate(self.tier_objects):
-            output += str(self.tier_objects[i]) + "\n"
+        for tier in self.get_tiers():
+            output += str(tier) + "\n"
         return output
@@ -9,7 +9,12 @@
 
 # pylint: disable=missing-docstring,too-many-instance-attributes
 
-"""Tier and TestCase classes to wrap the testcases config file"""
+"""Tier and TestCase classes to wrap the testcases config file
+
+Both are slotted as generated catalogs may list tens of thousands of test
+cases. The test cases of a tier are returned as tuples which are only
+rebuilt once the tier is modified.
+"""
 
 import textwrap
 
@@ -18,45 +23,59 @@ import prettytable
 
 class Tier():
 
+    __slots__ = ['tests_array', 'skipped_tests_array', 'index', 'views',
+                 'name', 'description']
+
     def __init__(self, name, description=""):
         self.tests_array = []
         self.skipped_tests_array = []
+        self.index = {}
+        self.views = None
         self.name = name
         self.description = description
 
     def add_test(self, testcase):
         self.tests_array.append(testcase)
+        self.index[testcase.get_name()] = testcase
+        self.views = None
 
     def skip_test(self, testcase):
         self.skipped_tests_array.append(testcase)
+        self.index[testcase.get_name()] = testcase
+        self.views = None
+
+    def get_views(self):
+        if self.views is None:
+            self.views = (tuple(self.tests_array),
+                          tuple(self.skipped_tests_array))
+        return self.views
+
+    def select(self, test_names):
+        self.tests_array = [
+            test for test in self.tests_array
+            if test.get_name() in test_names]
+        self.skipped_tests_array = [
+            test for test in self.skipped_tests_array
+            if test.get_name() in test_names]
+        self.index = {
+            name: test for name, test in self.index.items()
+            if name in test_names}
+        self.views = None
 
     def get_tests(self):
-        array_tests = []
-        for test in self.tests_array:
-            array_tests.append(test)
-        return array_tests
+        return self.get_views()[0]
 
     def get_skipped_test(self):
-        return self.skipped_tests_array
+        return self.get_views()[1]
 
     def get_test_names(self):
-        array_tests = []
-        for test in self.tests_array:
-            array_tests.append(test.get_name())
-        return array_tests
+        return [test.get_name() for test in self.tests_array]
 
     def get_test(self, test_name):
-        if self.is_test(test_name):
-            for test in self.tests_array + self.skipped_tests_array:
-                if test.get_name() == test_name:
-                    return test
-        return None
+        return self.index.get(test_name)
 
     def is_test(self, test_name):
-        for test in self.tests_array + self.skipped_tests_array:
-            if test.get_name() == test_name:
-                return True
-        return False
+        return test_name in self.index
 
     def get_name(self):
         return self.name
@@ -75,8 +94,12 @@ class Tier():
 
 class TestCase():
 
+    __slots__ = ['name', 'enabled', 'skipped', 'criteria', 'blocking',
+                 'description', 'project', 'parallel', 'depends_on', 'tags']
+
     def __init__(self, name, enabled, skipped, criteria, blocking,
-                 description="", project=""):
+                 description="", project="", parallel=False,
+                 depends_on=None, tags=None):
         # pylint: disable=too-many-arguments
         self.name = name
         self.enabled = enabled
@@ -85,6 +108,9 @@ class TestCase():
         self.blocking = blocking
         self.description = description
         self.project = project
+        self.parallel = parallel
+        self.depends_on = tuple(depends_on or ())
+        self.tags = tuple(tags or ())
 
     def get_name(self):
         return self.name
@@ -104,6 +130,15 @@ class TestCase():
     def get_project(self):
         return self.project
 
+    def is_parallel(self):
+        return self.parallel
+
+    def get_depends_on(self):
+        return self.depends_on
+
+    def get_tags(self):
+        return self.tags
+
     def __str__(self):
         msg = prettytable.PrettyTable(
             header_style='upper', padding_width=5,
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Per-phase timings of the test cases
+
+Runner measures how long each test case spends in every phase (loading the
+driver, check_requirements, run, clean, publish_artifacts and push_to_db).
+The durations are added to the details of the test cases and dumped at the
+end of the campaign in RESULTS_DIR as JSON and as a Prometheus
+textfile-collector file.
+"""
+
+import contextlib
+from datetime import datetime
+import json
+import os
+import time
+
+from xtesting.utils import constants
+from xtesting.utils import files
+
+JSON_FILE = 'timings.json'
+PROMETHEUS_FILE = 'xtesting.prom'
+
+
+@contextlib.contextmanager
+def measure(phases, phase):
+    """Store the duration of the phase in seconds"""
+    start_time = time.time()
+    try:
+        yield
+    finally:
+        phases[phase] = round(time.time() - start_time, 3)
+
+
+def get(test_case):
+    """Return the per-phase timings of the test case
+
+    They are stored in its details if they are a dict.
+    """
+    if test_case.details is None:
+        test_case.details = {}
+    if not isinstance(test_case.details, dict):
+        return {}
+    return test_case.details.setdefault('timings', {})
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace(
+        '\n', r'\n')
+
+
+class Timings():
+    """Per-phase timings of all the test cases of the campaign"""
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.testcases = {}
+
+    def add(self, name, phases):
+        """Add the per-phase timings of the test case"""
+        self.testcases[name] = phases
+
+    def to_json(self):
+        """Return the campaign-level timings as JSON"""
+        stop_time = time.time()
+        return json.dumps({
+            'start_date': datetime.fromtimestamp(self.start_time).strftime(
+                '%Y-%m-%d %H:%M:%S'),
+            'stop_date': datetime.fromtimestamp(stop_time).strftime(
+                '%Y-%m-%d %H:%M:%S'),
+            'duration': round(stop_time - self.start_time, 3),
+            'testcases': self.testcases}, indent=2, sort_keys=True)
+
+    def to_prometheus(self):
+        """Return the timings in the Prometheus text format"""
+        lines = [
+            '# HELP xtesting_campaign_duration_seconds Duration of the '
+            'campaign.',
+            '# TYPE xtesting_campaign_duration_seconds gauge',
+            'xtesting_campaign_duration_seconds '
+            f'{round(time.time() - self.start_time, 3)}',
+            '# HELP xtesting_testcase_phase_duration_seconds Duration of '
+            'each phase of the test cases.',
+            '# TYPE xtesting_testcase_phase_duration_seconds gauge']
+        for name, phases in self.testcases.items():
+            for phase, duration in phases.items():
+                lines.append(
+                    'xtesting_testcase_phase_duration_seconds{'
+                    f'case_name="{_escape(name)}",phase="{_escape(phase)}"'
+                    f'}} {duration}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, results_dir=constants.RESULTS_DIR):
+        """Write the JSON and Prometheus files in results_dir"""
+        files.write_atomically(
+            os.path.join(results_dir, JSON_FILE), self.to_json())
+        files.write_atomically(
+            os.path.join(results_dir, PROMETHEUS_FILE), self.to_prometheus())
@@ -14,8 +14,6 @@ import os
 import shutil
 import time
 
-import ansible_runner
-
 from xtesting.core import testcase
 
 
@@ -47,6 +45,7 @@ class Ansible(testcase.TestCase):
             EX_OK if the playbook ran well.
             EX_RUN_ERROR otherwise.
         """
+        import ansible_runner  # pylint: disable=import-outside-toplevel
         status = self.EX_RUN_ERROR
         self.start_time = time.time()
         if ("private_data_dir" in kwargs and
@@ -17,8 +17,6 @@ import time
 
 import json
 
-from behave.__main__ import main as behave_main
-
 from xtesting.core import testcase
 
 __author__ = "Deepak Chandella <deepak.chandella@orange.com>"
@@ -98,6 +96,8 @@ class BehaveFramework(testcase.TestCase):
             config += ['--format=pretty', '--outfile=-']
         for feature in suites:
             config.append(feature)
+        # pylint: disable=import-outside-toplevel
+        from behave.__main__ import main as behave_main
         self.start_time = time.time()
         behave_main(config)
         self.stop_time = time.time()
@@ -17,7 +17,6 @@ import os
 import shutil
 import time
 
-from lxml import etree
 import prettytable
 
 from xtesting.core import feature
@@ -119,6 +118,7 @@ class MTSLauncher(feature.BashFeature):
         """Parse the XML file containing the test definition for MTS.
         See sample file in `xtesting/samples/mts/test.xml`
         """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         nb_testcases = -1
         self.__logger.info(
             "Parsing XML test file %s containing the MTS tests definitions.",
@@ -18,11 +18,7 @@ import os
 import re
 
 from urllib.parse import urlparse
-import boto3
-from boto3.s3.transfer import TransferConfig
-import botocore
 import prettytable
-import requests
 
 from xtesting.utils import decorators
 from xtesting.utils import env
@@ -202,10 +198,16 @@ class TestCase(metaclass=abc.ABCMeta):
             * NODE_NAME,
             * BUILD_TAG.
 
+        TEST_DB_RATE_LIMIT may limit the requests per second of the
+        process (see xtesting.utils.session).
+
         Returns:
             TestCase.EX_OK if results were pushed to DB.
             TestCase.EX_PUSH_TO_DB_ERROR otherwise.
         """
+        # pylint: disable=import-outside-toplevel
+        import requests
+        from xtesting.utils import session
         try:
             if self.is_skipped:
                 return TestCase.EX_PUSH_TO_DB_ERROR
@@ -233,7 +235,7 @@ class TestCase(metaclass=abc.ABCMeta):
                     env.get('BUILD_TAG')).group(2)
             except Exception:  # pylint: disable=broad-except
                 data["version"] = "unknown"
-            req = requests.post(
+            req = session.post(
                 url, data=json.dumps(data, sort_keys=True),
                 headers=self.headers)
             req.raise_for_status()
@@ -281,6 +283,10 @@ class TestCase(metaclass=abc.ABCMeta):
             TestCase.EX_OK if artifacts were published to repository.
             TestCase.EX_PUBLISH_ARTIFACTS_ERROR otherwise.
         """
+        # pylint: disable=import-outside-toplevel
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        import botocore.exceptions
         try:
             b3resource = boto3.resource(
                 's3', endpoint_url=os.environ["S3_ENDPOINT_URL"])
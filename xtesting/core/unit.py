@@ -18,8 +18,6 @@ import subprocess
 import time
 import unittest
 
-from subunit.run import SubunitTestRunner
-
 from xtesting.core import testcase
 
 __author__ = ("Steven Pisarski <s.pisarski@cablelabs.com>, "
@@ -107,6 +105,8 @@ class Suite(testcase.TestCase):
                 return testcase.TestCase.EX_RUN_ERROR
         except KeyError:
             pass
+        # pylint: disable=import-outside-toplevel
+        from subunit.run import SubunitTestRunner
         try:
             assert self.suite
             self.start_time = time.time()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the loading and the per-test lookup cost of testcases.yaml
+
+The cold loads parse testcases.yaml with the pure Python loader or with
+the libyaml one and save the tiers in the cache directory. The warm loads
+reload them from the cache directory.
+
+python -m xtesting.tests.perf.bench_catalog
+"""
+
+import os
+import tempfile
+import time
+
+import mock
+import prettytable
+import yaml
+
+from xtesting.ci import run_tests
+from xtesting.ci import tier_builder
+from xtesting.tests.perf import catalog
+
+SIZES = [10, 100, 600, 5000]
+
+
+def load(path, cache_dir=None):
+    start = time.perf_counter()
+    tier_builder.TierBuilder(path, cache_dir=cache_dir)
+    return f'{time.perf_counter() - start:.3f}'
+
+
+def main():
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['test cases', 'SafeLoader (s)', 'cold load (s)',
+                     'warm load (s)', 'lookup (us/test)'])
+    runner = run_tests.Runner()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in SIZES:
+            path = os.path.join(tmpdir, f'testcases{size}.yaml')
+            names = catalog.generate(path, size)
+            row = [size]
+            with mock.patch('xtesting.ci.tier_builder.LOADER',
+                            yaml.SafeLoader):
+                row.append(load(path))
+            cache_dir = os.path.join(tmpdir, f'cache{size}')
+            row.append(load(path, cache_dir))
+            row.append(load(path, cache_dir))
+            runner.tiers = tier_builder.TierBuilder(path)
+            start = time.perf_counter()
+            for name in names:
+                runner.get_run_dict(name)
+                runner.get_dict_by_test(name)
+            lookup = (time.perf_counter() - start) / size * 1e6
+            msg.add_row(row + [f'{lookup:.2f}'])
+    print(msg)
+
+
+if __name__ == '__main__':
+    main()
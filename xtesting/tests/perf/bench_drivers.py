@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the per-test driver loading overhead
+
+python -m xtesting.tests.perf.bench_drivers
+"""
+
+import time
+
+import prettytable
+from stevedore import driver
+
+from xtesting.ci import drivers
+
+TESTS = 500
+
+
+def load_uncached(index):
+    return driver.DriverManager(
+        namespace='xtesting.testcase', name='bashfeature',
+        invoke_on_load=True,
+        invoke_kwds={'case_name': f'test{index}'}).driver
+
+
+def load_cached(index):
+    return drivers.load('bashfeature', {'case_name': f'test{index}'})
+
+
+def main():
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['loader', 'overhead (us/test)'])
+    for name, loader in [('DriverManager per test', load_uncached),
+                         ('cached driver class', load_cached)]:
+        loader(0)
+        start = time.perf_counter()
+        for index in range(TESTS):
+            loader(index)
+        overhead = (time.perf_counter() - start) / TESTS * 1e6
+        msg.add_row([name, f'{overhead:.1f}'])
+    print(msg)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the import time of run_tests and of the lightweight drivers
+
+It exits with an error if one of the heavy dependencies is imported only
+to run a BashFeature.
+
+python -m xtesting.tests.perf.bench_importtime
+"""
+
+import subprocess
+import sys
+
+import prettytable
+
+MODULES = ['xtesting.ci.run_tests', 'xtesting.core.testcase',
+           'xtesting.core.feature']
+HEAVY = ['ansible_runner', 'behave', 'boto3', 'botocore', 'lxml', 'mock',
+         'requests', 'robot']
+
+
+def importtime(module):
+    """Return the cumulated import times (us) by top-level packages"""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stderr=subprocess.PIPE, check=True, text=True).stderr
+    times = {}
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        package = name.strip().split('.')[0]
+        times[package] = max(times.get(package, 0), int(cumulative))
+    return times
+
+
+def main():
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['module', 'import time (ms)', 'heavy dependencies'])
+    status = 0
+    for module in MODULES:
+        times = importtime(module)
+        heavy = [package for package in HEAVY if package in times]
+        status = status or len(heavy)
+        msg.add_row([module, f"{times['xtesting'] / 1000:.1f}",
+                     ' '.join(heavy)])
+    print(msg)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the memory allocated by the tiers of large catalogs
+
+Only the Tier and TestCase objects built from the parsed testcases.yaml
+are measured.
+
+python -m xtesting.tests.perf.bench_memory
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+import prettytable
+
+from xtesting.ci import tier_builder
+from xtesting.tests.perf import catalog
+
+SIZES = [1000, 10000, 50000]
+
+
+def main():
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['test cases', 'tiers (MB)', 'bytes/test'])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in SIZES:
+            path = os.path.join(tmpdir, f'testcases{size}.yaml')
+            catalog.generate(path, size)
+            tiers = tier_builder.TierBuilder(path)
+            # the objects built before tracing are not counted once freed
+            tracemalloc.start()
+            tiers.generate_tiers()
+            for tier in tiers.get_tiers():
+                tier.get_tests()
+                tier.get_skipped_test()
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            msg.add_row([size, f'{allocated / 2 ** 20:.1f}',
+                         f'{allocated / size:.0f}'])
+    print(msg)
+
+
+if __name__ == '__main__':
+    main()
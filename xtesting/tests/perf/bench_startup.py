@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the wall-clock startup time of run_tests --help
+
+python -m xtesting.tests.perf.bench_startup
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+import prettytable
+
+RUNS = 5
+COMMANDS = {
+    'python': [sys.executable, '-c', 'pass'],
+    'import pkg_resources (reference)': [
+        sys.executable, '-c', 'import pkg_resources'],
+    'import xtesting.utils.constants': [
+        sys.executable, '-c', 'import xtesting.utils.constants'],
+    'run_tests --help': [
+        sys.executable, '-c', 'from xtesting.ci.run_tests import main; main()',
+        '--help']}
+
+
+def main():
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['command', 'median (ms)', 'min (ms)'])
+    for name, command in COMMANDS.items():
+        durations = []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=False)
+            durations.append((time.perf_counter() - start) * 1000)
+        msg.add_row([name, f'{statistics.median(durations):.0f}',
+                     f'{min(durations):.0f}'])
+    print(msg)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Measure the per-test cost of the tier lookups and of the summary
+
+python -m xtesting.tests.perf.bench_tiers
+"""
+
+import logging
+import os
+import tempfile
+import time
+
+import prettytable
+
+from xtesting.ci import record
+from xtesting.ci import run_tests
+from xtesting.ci import tier_builder
+from xtesting.tests.perf import catalog
+
+SIZES = [100, 1000, 10000]
+
+
+def lookup(tiers, names):
+    for name in names:
+        tiers.get_tier(tiers.get_tier_name(name))
+        tiers.get_test(name)
+
+
+def summary(runner, names):
+    for name in names:
+        test_case = record.TestCase(case_name=name, project_name='xtesting')
+        test_case.start_time, test_case.stop_time = 1, 2
+        test_case.successful = test_case.EX_OK
+        runner.executed_test_cases[name] = test_case
+    runner.summary()
+
+
+def main():
+    logging.disable(logging.INFO)
+    msg = prettytable.PrettyTable(
+        header_style='upper', padding_width=5,
+        field_names=['test cases', 'lookups (us/test)', 'summary (us/test)'])
+    runner = run_tests.Runner()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in SIZES:
+            path = os.path.join(tmpdir, f'testcases{size}.yaml')
+            names = catalog.generate(path, size)
+            runner.tiers = tier_builder.TierBuilder(path)
+            row = [size]
+            for function in [lookup, summary]:
+                start = time.perf_counter()
+                function(runner.tiers if function is lookup else runner,
+                         names)
+                row.append(
+                    f'{(time.perf_counter() - start) / size * 1e6:.2f}')
+            msg.add_row(row)
+    print(msg)
+
+
+if __name__ == '__main__':
+    main()
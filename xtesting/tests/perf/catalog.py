@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+"""Generate synthetic testcases.yaml for the benchmarks"""
+
+import yaml
+
+
+def generate(path, size, tier_size=50):
+    tiers = []
+    for index in range(size):
+        if not index % tier_size:
+            tiers.append({'name': f'tier{len(tiers)}', 'description': '',
+                          'testcases': []})
+        tiers[-1]['testcases'].append({
+            'case_name': f'test{index}', 'project_name': 'xtesting',
+            'criteria': 100, 'blocking': False, 'description': '',
+            'run': {'name': 'bashfeature',
+                    'args': {'cmd': f'echo -n {index}; exit 0'}}})
+    with open(path, 'w', encoding='utf-8') as tyaml:
+        yaml.safe_dump({'tiers': tiers}, tyaml)
+    return [f'test{index}' for index in range(size)]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import os
+import tempfile
+import time
+import unittest
+
+import mock
+
+from xtesting.ci import cache
+from xtesting.ci import record
+from xtesting.core import testcase
+
+
+class CacheTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.suite = os.path.join(self.tmpdir.name, 'suite.robot')
+        with open(self.suite, 'w', encoding='utf-8') as sfile:
+            sfile.write('foo')
+        self.test_dict = {
+            'case_name': 'test1', 'project_name': 'xtesting',
+            'run': {'name': 'robotframework',
+                    'args': {'suites': [self.suite]}}}
+        self.cache = cache.Cache(os.path.join(self.tmpdir.name, 'cache'))
+        self.test_case = record.TestCase(
+            case_name='test1', project_name='xtesting')
+        self.test_case.result = 100
+        self.test_case.successful = testcase.TestCase.EX_OK
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hash_files(self):
+        hashes = cache.hash_files({'args': {
+            'suites': [self.suite, 'foo', self.tmpdir.name],
+            'dir': self.tmpdir.name}})
+        self.assertEqual(list(hashes), [self.suite, self.tmpdir.name])
+        self.assertEqual(cache.hash_files({'args': {'dir': self.suite}}), {})
+        self.assertEqual(cache.hash_files({'args': 'foo'}), {})
+
+    def test_hash_files_playbook(self):
+        os.makedirs(os.path.join(self.tmpdir.name, 'project'))
+        playbook = os.path.join(self.tmpdir.name, 'project', 'site.yml')
+        with open(playbook, 'w', encoding='utf-8') as pfile:
+            pfile.write('foo')
+        self.assertEqual(list(cache.hash_files({'args': {
+            'private_data_dir': self.tmpdir.name,
+            'playbook': 'site.yml'}})), [playbook])
+
+    @mock.patch('xtesting.ci.cache.LOGGER.warning')
+    def test_hash_files_broken_link(self, *args):
+        suites = os.path.join(self.tmpdir.name, 'suites')
+        os.makedirs(suites)
+        os.symlink(os.path.join(suites, 'missing'),
+                   os.path.join(suites, 'link'))
+        self.test_dict['run']['args']['suites'] = [suites]
+        self.assertIsNone(self.cache.get(self.test_dict))
+        self.cache.add(self.test_dict, self.test_case)
+        self.assertEqual(self.cache.get(self.test_dict).result, 100)
+        args[0].assert_called()
+
+    def test_get_ko(self):
+        with mock.patch('xtesting.ci.cache.get_key', side_effect=OSError):
+            self.assertIsNone(self.cache.get(self.test_dict))
+
+    def test_get_key_suite(self):
+        key = cache.get_key(self.test_dict)
+        self.assertEqual(cache.get_key(self.test_dict), key)
+        with open(self.suite, 'w', encoding='utf-8') as sfile:
+            sfile.write('bar')
+        self.assertNotEqual(cache.get_key(self.test_dict), key)
+
+    def test_get_key_env(self):
+        key = cache.get_key(self.test_dict)
+        with mock.patch.dict(os.environ, {'BUILD_TAG': 'foo'}):
+            self.assertEqual(cache.get_key(self.test_dict), key)
+        with mock.patch.dict(os.environ, {'DEPLOY_SCENARIO': 'foo'}):
+            self.assertNotEqual(cache.get_key(self.test_dict), key)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(self.test_dict))
+        self.assertIsNone(self.cache.get(None))
+
+    def test_add_get(self):
+        self.cache.add(self.test_dict, self.test_case)
+        test_case = self.cache.get(self.test_dict)
+        self.assertEqual(test_case.case_name, 'test1')
+        self.assertEqual(test_case.result, 100)
+        self.assertEqual(test_case.is_successful(), testcase.TestCase.EX_OK)
+
+    def test_add_failed(self):
+        self.test_case.successful = testcase.TestCase.EX_TESTCASE_FAILED
+        self.cache.add(self.test_dict, self.test_case)
+        self.assertEqual(self.cache.get_entries(), [])
+
+    def test_add_skipped(self):
+        self.test_case.is_skipped = True
+        self.cache.add(self.test_dict, self.test_case)
+        self.assertEqual(self.cache.get_entries(), [])
+
+    def test_not_cacheable(self):
+        self.test_dict['cacheable'] = False
+        self.cache.add(self.test_dict, self.test_case)
+        self.assertEqual(self.cache.get_entries(), [])
+        self.assertIsNone(self.cache.get(self.test_dict))
+
+    def test_not_a_directory(self):
+        with open(os.path.join(self.tmpdir.name, 'foo'), 'w',
+                  encoding='utf-8'):
+            pass
+        self.cache = cache.Cache(os.path.join(self.tmpdir.name, 'foo'))
+        self.assertEqual(self.cache.get_entries(), [])
+        self.cache.add(self.test_dict, self.test_case)
+        self.assertIsNone(self.cache.get(self.test_dict))
+
+    def test_ttl(self):
+        self.cache.add(self.test_dict, self.test_case)
+        self.cache.ttl = 10
+        with mock.patch('time.time', return_value=time.time() + 20):
+            self.assertIsNone(self.cache.get(self.test_dict))
+            self.cache.evict()
+        self.assertEqual(self.cache.get_entries(), [])
+
+    def test_max_entries(self):
+        self.cache.max_entries = 2
+        for index, name in enumerate(['test1', 'test2', 'test3']):
+            self.test_dict['case_name'] = name
+            self.cache.add(self.test_dict, self.test_case)
+            path = os.path.join(
+                self.cache.path, f'{cache.get_key(self.test_dict)}.json')
+            os.utime(path, (time.time() - 3 + index, ) * 2)
+        self.assertEqual(len(self.cache.get_entries()), 2)
+        self.test_dict['case_name'] = 'test1'
+        self.assertIsNone(self.cache.get(self.test_dict))
+        self.test_dict['case_name'] = 'test3'
+        self.assertIsNotNone(self.cache.get(self.test_dict))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from xtesting.ci import checkpoint
+from xtesting.ci import record
+from xtesting.core import testcase
+
+
+class CheckpointTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'checkpoint.jsonl')
+        self.checkpoint = checkpoint.Checkpoint(self.path)
+        self.test_case = record.TestCase(
+            case_name='test1', project_name='xtesting')
+        self.test_case.result = 100
+        self.test_case.successful = testcase.TestCase.EX_OK
+        self.test_case.details = {'timings': {'run': 1.5}}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_load_missing(self):
+        self.checkpoint.load()
+        self.assertEqual(self.checkpoint.records, {})
+        self.assertIsNone(self.checkpoint.get('test1'))
+
+    def _read_lines(self):
+        with open(self.path, encoding='utf-8') as cfile:
+            return [json.loads(line) for line in cfile]
+
+    def test_add(self):
+        with open(self.path, 'w', encoding='utf-8') as cfile:
+            cfile.write('previous campaign\n')
+        self.checkpoint.add(self.test_case)
+        self.test_case.case_name = 'test2'
+        self.checkpoint.add(self.test_case)
+        lines = self._read_lines()
+        self.assertEqual([line['case_name'] for line in lines],
+                         ['test1', 'test2'])
+        self.assertEqual(lines[0]['result'], 100)
+        self.assertEqual(lines[0]['successful'], testcase.TestCase.EX_OK)
+
+    def test_load_compact(self):
+        self.checkpoint.add(self.test_case)
+        self.test_case.result = 50
+        self.checkpoint.add(self.test_case)
+        with open(self.path, 'a', encoding='utf-8') as cfile:
+            cfile.write('{"case_name": "test2", "res')
+        self.assertEqual(len(checkpoint.read(self.path)), 1)
+        resumed = checkpoint.Checkpoint(self.path)
+        resumed.load()
+        self.assertEqual(resumed.get('test1').result, 50)
+        self.assertEqual(
+            [line['result'] for line in self._read_lines()], [50])
+        self.test_case.case_name = 'test2'
+        resumed.add(self.test_case)
+        self.assertEqual([line['case_name'] for line in self._read_lines()],
+                         ['test1', 'test2'])
+
+    def test_add_ko(self):
+        self.checkpoint.path = os.path.join(self.path, 'foo')
+        self.checkpoint.add(self.test_case)
+        self.assertEqual(self.checkpoint.get('test1').result, 100)
+
+    def test_reset(self):
+        self.checkpoint.add(self.test_case)
+        self.checkpoint.reset()
+        self.assertIsNone(self.checkpoint.get('test1'))
+
+    def test_add_copy(self):
+        self.checkpoint.add(self.test_case)
+        self.test_case.details['links'] = ['foo']
+        self.assertNotIn(
+            'links', self.checkpoint.records['test1']['details'])
+
+    def test_resume(self):
+        self.checkpoint.add(self.test_case)
+        resumed = checkpoint.Checkpoint(self.path)
+        resumed.load()
+        test_case = resumed.get('test1')
+        self.assertEqual(test_case.case_name, 'test1')
+        self.assertEqual(test_case.project_name, 'xtesting')
+        self.assertEqual(test_case.details, {'timings': {'run': 1.5}})
+        self.assertEqual(test_case.is_successful(), testcase.TestCase.EX_OK)
+        self.assertIsNone(resumed.get('test2'))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import unittest
+
+import mock
+
+from xtesting.ci import drivers
+from xtesting.core import feature
+
+
+class DriversTesting(unittest.TestCase):
+
+    def setUp(self):
+        drivers.get.cache_clear()
+
+    def tearDown(self):
+        drivers.get.cache_clear()
+
+    @mock.patch('stevedore.driver.DriverManager',
+                return_value=mock.Mock(driver=feature.BashFeature))
+    def test_get(self, *args):
+        self.assertEqual(drivers.get('bashfeature'), feature.BashFeature)
+        self.assertEqual(drivers.get('bashfeature'), feature.BashFeature)
+        args[0].assert_called_once_with(
+            namespace='xtesting.testcase', name='bashfeature')
+
+    @mock.patch('stevedore.driver.DriverManager',
+                return_value=mock.Mock(driver=feature.BashFeature))
+    def test_load(self, *args):
+        test_case = drivers.load('bashfeature', {'case_name': 'foo'})
+        self.assertIsInstance(test_case, feature.BashFeature)
+        self.assertEqual(test_case.case_name, 'foo')
+        self.assertIsNot(
+            drivers.load('bashfeature', {'case_name': 'foo'}), test_case)
+        args[0].assert_called_once_with(
+            namespace='xtesting.testcase', name='bashfeature')
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import os
+import tempfile
+import unittest
+
+import mock
+
+from xtesting.ci import history
+from xtesting.ci import record
+from xtesting.core import testcase
+
+
+class HistoryTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.history = history.History(
+            os.path.join(self.tmpdir.name, 'history.db'), size=3)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _test_case(name, start_time, duration, successful=0):
+        test_case = record.TestCase(case_name=name)
+        test_case.start_time = start_time
+        test_case.stop_time = start_time + duration
+        test_case.successful = successful
+        return test_case
+
+    def test_by_duration(self):
+        key = history.by_duration({'test1': 1, 'test2': 5})
+        self.assertEqual(
+            sorted(['test1', 'test2', 'test3'], key=key),
+            ['test2', 'test3', 'test1'])
+        self.assertEqual(history.by_duration({})('test1'), 0)
+
+    def test_add(self):
+        self.history.add(self._test_case('test1', 10, 2))
+        self.history.add(self._test_case(
+            'test1', 20, 4, testcase.TestCase.EX_TESTCASE_FAILED))
+        self.assertEqual(self.history.get_runs('test1'),
+                         [(20, 4, 'FAIL'), (10, 2, 'PASS')])
+        self.assertEqual(self.history.get_runs('test2'), [])
+
+    def test_add_skipped(self):
+        test_case = self._test_case('test1', 10, 2)
+        test_case.is_skipped = True
+        self.history.add(test_case)
+        self.assertEqual(self.history.get_runs('test1'), [])
+
+    def test_add_not_started(self):
+        test_case = self._test_case('test1', 10, 2)
+        test_case.start_time = None
+        self.history.add(test_case)
+        self.assertEqual(self.history.get_runs('test1'),
+                         [(None, None, 'PASS')])
+        self.assertEqual(self.history.get_durations(), {})
+
+    def test_size(self):
+        for start_time in range(5):
+            self.history.add(self._test_case('test1', start_time, 1))
+        self.history.add(self._test_case('test2', 0, 1))
+        self.assertEqual(
+            [run[0] for run in self.history.get_runs('test1')], [4, 3, 2])
+        self.assertEqual(len(self.history.get_runs('test2')), 1)
+
+    def test_get_durations(self):
+        self.history.add(self._test_case('test1', 10, 2))
+        self.history.add(self._test_case('test1', 20, 4))
+        self.history.add(self._test_case('test2', 20, 1))
+        self.assertEqual(self.history.get_durations(),
+                         {'test1': 3, 'test2': 1})
+
+    @mock.patch('xtesting.ci.history.LOGGER.exception')
+    def test_ko(self, *args):
+        self.history.path = os.path.join(self.tmpdir.name, 'foo', 'bar.db')
+        self.history.add(self._test_case('test1', 10, 2))
+        self.assertEqual(self.history.get_runs('test1'), [])
+        self.assertEqual(self.history.get_durations(), {})
+        args[0].assert_called_once()
+
+    def test_no_history(self):
+        self.assertEqual(self.history.get_runs('test1'), [])
+        self.assertEqual(self.history.get_durations(), {})
+        self.assertFalse(os.path.exists(self.history.path))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+
+import mock
+
+from xtesting.ci import isolation
+from xtesting.core.testcase import TestCase
+
+
+class FakeModule(TestCase):
+
+    def run(self, **kwargs):
+        self.start_time = 1
+        self.stop_time = 2
+        self.result = 100
+        self.details = {'pid': os.getpid(), 'kwargs': kwargs}
+        return TestCase.EX_OK
+
+
+class SkippedModule(FakeModule):
+
+    def check_requirements(self):
+        self.is_skipped = True
+
+
+class CrashingModule(FakeModule):
+
+    def run(self, **kwargs):
+        os._exit(1)  # pylint: disable=protected-access
+
+
+class SleepingModule(FakeModule):
+
+    def run(self, **kwargs):
+        time.sleep(60)
+
+
+class SubprocessModule(FakeModule):
+
+    def run(self, **kwargs):
+        # pylint: disable=consider-using-with
+        process = subprocess.Popen(['sleep', '60'])
+        with open(kwargs['foo'], 'w', encoding='utf-8') as pfile:
+            pfile.write(str(process.pid))
+        process.wait()
+
+
+class ExceptionModule(FakeModule):
+
+    def run(self, **kwargs):
+        raise ValueError('foo')
+
+
+class IsolationTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.run_dict = {'name': 'fake', 'args': {'foo': 'bar'}}
+        self.test_dict = {'case_name': 'test_name', 'project_name': 'xtesting',
+                          'run': self.run_dict}
+
+    def _execute(self, module, timeout=None):
+        with mock.patch('xtesting.ci.drivers.get', return_value=module):
+            return isolation.execute(
+                self.run_dict, self.test_dict, timeout=timeout)
+
+    def test_execute(self):
+        test_case = self._execute(FakeModule)
+        self.assertEqual(test_case.is_successful(), TestCase.EX_OK)
+        self.assertEqual(test_case.case_name, 'test_name')
+        self.assertEqual(test_case.details['kwargs'], {'foo': 'bar'})
+        self.assertNotEqual(test_case.details['pid'], os.getpid())
+        self.assertEqual(test_case.run(), TestCase.EX_OK)
+
+    def test_execute_skipped(self):
+        test_case = self._execute(SkippedModule)
+        self.assertTrue(test_case.is_skipped)
+        self.assertEqual(test_case.is_successful(),
+                         TestCase.EX_TESTCASE_SKIPPED)
+
+    @mock.patch('xtesting.ci.isolation.LOGGER.error')
+    def test_execute_crash(self, *args):
+        test_case = self._execute(CrashingModule)
+        self.assertEqual(test_case.is_successful(),
+                         TestCase.EX_TESTCASE_FAILED)
+        self.assertEqual(test_case.details, {'exitcode': 1})
+        self.assertEqual(test_case.case_name, 'test_name')
+        self.assertTrue(test_case.stop_time >= test_case.start_time)
+        args[0].assert_called_once_with(
+            "The child process running %s exited with %s", 'test_name', 1)
+
+    @mock.patch('xtesting.ci.isolation.LOGGER.error')
+    def test_execute_timeout(self, *args):
+        start_time = time.time()
+        test_case = self._execute(SleepingModule, timeout=0.5)
+        self.assertLess(time.time() - start_time, 30)
+        self.assertEqual(test_case.is_successful(),
+                         TestCase.EX_TESTCASE_FAILED)
+        self.assertEqual(test_case.details,
+                         {'timeout': 0.5, 'clean': 'skipped'})
+        args[0].assert_called_once_with(
+            "Killing %s after %s second(s)", 'test_name', 0.5)
+
+    @staticmethod
+    def _is_running(pid):
+        try:
+            with open(f'/proc/{pid}/stat', encoding='utf-8') as sfile:
+                return sfile.read().rsplit(')', 1)[1].split()[0] != 'Z'
+        except FileNotFoundError:
+            return False
+
+    @mock.patch('xtesting.ci.isolation.LOGGER.error')
+    def test_execute_timeout_subprocess(self, *args):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.run_dict['args']['foo'] = os.path.join(tmpdir, 'pid')
+            test_case = self._execute(SubprocessModule, timeout=1)
+            with open(self.run_dict['args']['foo'], encoding='utf-8') as pfile:
+                pid = int(pfile.read())
+        self.assertEqual(test_case.details['timeout'], 1)
+        for _ in range(50):
+            if not self._is_running(pid):
+                break
+            time.sleep(0.1)
+        self.assertFalse(self._is_running(pid))
+        args[0].assert_called_once()
+
+    @mock.patch('os.killpg', side_effect=ProcessLookupError)
+    def test_kill_before_setsid(self, *args):
+        process = mock.Mock(pid=1234, exitcode=None)
+        with mock.patch('os.kill') as mock_kill:
+            isolation.kill(process, 0.1)
+            self.assertEqual(mock_kill.call_count, 2)
+        process.join.assert_called_once_with(0.1)
+        args[0].assert_called_with(1234, isolation.signal.SIGKILL)
+
+    @mock.patch('xtesting.ci.isolation.LOGGER.error')
+    def test_execute_exception(self, *args):
+        with mock.patch('xtesting.ci.isolation.LOGGER.exception'):
+            test_case = self._execute(ExceptionModule)
+        self.assertEqual(test_case.is_successful(),
+                         TestCase.EX_TESTCASE_FAILED)
+        self.assertEqual(test_case.case_name, 'test_name')
+        self.assertEqual(test_case.details, {'exception': 'ValueError: foo'})
+        args[0].assert_not_called()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
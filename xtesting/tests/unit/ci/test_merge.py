@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+import mock
+
+from xtesting.ci import merge
+from xtesting.ci import run_tests
+from xtesting.core import testcase
+
+
+class MergeTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for index, records in enumerate([
+                {'first': self._record('first', testcase.TestCase.EX_OK)},
+                {'second': self._record(
+                    'second', testcase.TestCase.EX_TESTCASE_FAILED),
+                 'third': self._record('third', testcase.TestCase.EX_OK)}]):
+            path = os.path.join(self.tmpdir.name, f'checkpoint{index}.jsonl')
+            with open(path, 'w', encoding='utf-8') as cfile:
+                for data in records.values():
+                    cfile.write(json.dumps(data) + '\n')
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _record(name, successful):
+        return {'case_name': name, 'project_name': 'xtesting',
+                'criteria': 100, 'result': 100, 'start_time': 1,
+                'stop_time': 2, 'details': {'timings': {'run': 1}},
+                'is_skipped': False, 'res_dir': '/tmp',
+                'successful': successful, 'exit_code': None}
+
+    def test_parser(self):
+        self.assertEqual(
+            merge.MergeParser().parse_args(['foo', 'bar', '-r']),
+            {'checkpoints': ['foo', 'bar'], 'report': True})
+
+    def test_load(self):
+        test_cases = merge.load(self.paths)
+        self.assertEqual(list(test_cases), ['first', 'second', 'third'])
+        self.assertEqual(test_cases['second'].is_successful(),
+                         testcase.TestCase.EX_TESTCASE_FAILED)
+
+    @mock.patch('xtesting.ci.merge.LOGGER.warning')
+    def test_load_duplicate(self, *args):
+        test_cases = merge.load(self.paths + self.paths[:1])
+        self.assertEqual(list(test_cases), ['first', 'second', 'third'])
+        args[0].assert_called_once_with(
+            "%s is overridden by %s", 'first', self.paths[0])
+
+    @mock.patch('xtesting.ci.checkpoint.Checkpoint.add')
+    @mock.patch('xtesting.ci.timings.Timings.dump')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    @mock.patch('xtesting.ci.record.TestCase.push_to_db',
+                return_value=testcase.TestCase.EX_OK)
+    def test_merge(self, *args):
+        self.assertEqual(merge.merge(self.paths, report=True),
+                         run_tests.Result.EX_ERROR)
+        self.assertEqual(args[0].call_count, 3)
+        args[1].assert_called_once_with()
+        args[2].assert_called_once_with()
+        self.assertEqual(args[3].call_count, 3)
+
+    @mock.patch('xtesting.ci.checkpoint.Checkpoint.add')
+    @mock.patch('xtesting.ci.timings.Timings.dump')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    @mock.patch('xtesting.ci.record.TestCase.push_to_db')
+    def test_merge_ok(self, *args):
+        self.assertEqual(merge.merge(self.paths[:1]),
+                         run_tests.Result.EX_OK)
+        args[0].assert_not_called()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import threading
+import unittest
+
+import mock
+
+from xtesting.ci import pipeline
+
+
+class PipelineTesting(unittest.TestCase):
+
+    def test_join(self):
+        target = mock.Mock()
+        queue = pipeline.Pipeline(target)
+        for item in range(10):
+            queue.put(item)
+        queue.join()
+        self.assertEqual(target.call_args_list,
+                         [mock.call(item) for item in range(10)])
+        self.assertFalse(queue.thread.is_alive())
+
+    def test_bounded(self):
+        event = threading.Event()
+        queue = pipeline.Pipeline(lambda item: event.wait(), maxsize=1)
+        queue.put(1)
+        queue.put(2)
+        self.assertTrue(queue.queue.full())
+        event.set()
+        queue.join()
+
+    @mock.patch('xtesting.ci.pipeline.LOGGER.exception')
+    def test_exception(self, *args):
+        target = mock.Mock(side_effect=[Exception, None])
+        queue = pipeline.Pipeline(target)
+        queue.put(1)
+        queue.put(2)
+        queue.join()
+        self.assertEqual(target.call_count, 2)
+        args[0].assert_called_once_with("Cannot process %s", 1)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
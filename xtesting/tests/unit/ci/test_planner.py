@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import unittest
+
+from xtesting.ci import planner
+from xtesting.ci import scheduler
+from xtesting.ci import tier_handler
+
+
+class PlannerTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.tier1 = tier_handler.Tier('tier1')
+        self.tier2 = tier_handler.Tier('tier2')
+        self.add_test(self.tier1, 'test1')
+        self.add_test(self.tier1, 'test2')
+        self.add_test(self.tier2, 'test3', depends_on=['test1'])
+        self.add_test(self.tier2, 'test4', depends_on=['foo'])
+        self.planner = planner.Planner(
+            {'test1': 10, 'test2': 30, 'test3': 20}, workers=2)
+
+    @staticmethod
+    def add_test(tier, name, depends_on=None):
+        tier.add_test(tier_handler.TestCase(
+            name, True, False, 100, False, depends_on=depends_on))
+
+    def get_starts(self):
+        return {row['test case']: (row['worker'], row['start'])
+                for row in self.planner.rows}
+
+    def test_format_duration(self):
+        self.assertEqual(planner.format_duration(0), '00:00')
+        self.assertEqual(planner.format_duration(125.7), '02:05')
+
+    def test_predict(self):
+        self.assertEqual(self.planner.predict('test1'), 10)
+        self.assertEqual(self.planner.predict('test4'), 20)
+        self.assertEqual(planner.Planner().predict('test1'), 0)
+
+    def test_run_batch(self):
+        self.planner.run_batch(self.tier1.get_tests(), 'tier1')
+        self.planner.run_batch(self.tier2.get_tests(), 'tier2')
+        self.assertEqual(self.get_starts(), {
+            'test1': (1, 0), 'test2': (2, 0), 'test3': (1, 30),
+            'test4': (2, 30)})
+        self.assertEqual(self.planner.get_total(), 50)
+
+    def test_run_batch_sequential(self):
+        self.planner.workers = 1
+        self.planner.run_batch(self.tier1.get_tests(), 'tier1')
+        self.planner.run_batch(self.tier2.get_tests()[:1], 'tier2')
+        self.assertEqual(self.get_starts(), {
+            'test1': (1, 0), 'test2': (1, 10), 'test3': (1, 40)})
+        self.assertEqual(self.planner.get_total(), 60)
+
+    def test_run_dag(self):
+        self.planner.run_dag(
+            scheduler.Scheduler([self.tier1, self.tier2]),
+            {'test1': 'tier1', 'test2': 'tier1', 'test3': 'tier2',
+             'test4': 'tier2'})
+        self.assertEqual(self.get_starts(), {
+            'test1': (1, 0), 'test2': (2, 0), 'test3': (1, 10),
+            'test4': (None, None)})
+        self.assertEqual(self.planner.rows[-1]['result'], 'NOT RUN')
+        self.assertEqual(self.planner.get_total(), 30)
+
+    def test_str(self):
+        self.planner.run_batch(self.tier2.get_tests(), 'tier2')
+        self.planner.skip('test5', 'tier2', 'SKIP')
+        message = str(self.planner)
+        self.assertIn('00:20', message)
+        self.assertIn('~00:20', message)
+        self.assertIn('SKIP', message)
+        self.assertIn('WORKER', message)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
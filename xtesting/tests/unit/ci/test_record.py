@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import unittest
+
+from xtesting.ci import record
+from xtesting.core.testcase import TestCase
+
+
+class FakeModule(TestCase):
+
+    def run(self, **kwargs):
+        self.start_time = 1
+        self.stop_time = 61
+        self.result = 100
+        self.details = {'foo': 'bar'}
+        return TestCase.EX_OK
+
+
+class RecordTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.test = FakeModule(case_name='foo', project_name='bar')
+        self.test.run()
+
+    def test_dump(self):
+        data = record.dump(self.test, TestCase.EX_OK)
+        self.assertEqual(data['case_name'], 'foo')
+        self.assertEqual(data['details'], {'foo': 'bar'})
+        self.assertEqual(data['successful'], TestCase.EX_OK)
+        self.assertEqual(data['exit_code'], TestCase.EX_OK)
+
+    def test_load(self):
+        test_case = record.load(record.dump(self.test, TestCase.EX_OK))
+        self.assertEqual(test_case.is_successful(), TestCase.EX_OK)
+        self.assertEqual(test_case.run(), TestCase.EX_OK)
+        self.assertEqual(test_case.get_duration(), '01:00')
+        self.assertEqual(test_case.res_dir, self.test.res_dir)
+        self.assertEqual(str(test_case), str(self.test))
+
+    def test_default(self):
+        test_case = record.TestCase(case_name='foo')
+        self.assertEqual(test_case.is_successful(),
+                         TestCase.EX_TESTCASE_FAILED)
+        self.assertEqual(test_case.run(), TestCase.EX_RUN_ERROR)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import json
+import logging
+import tempfile
+import unittest
+from xml.etree import ElementTree
+
+import mock
+
+from xtesting.ci import record
+from xtesting.ci import reporter
+from xtesting.core import testcase
+
+
+class ReporterTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reporter = reporter.Reporter(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def _test_case(name, successful=testcase.TestCase.EX_OK,
+                   is_skipped=False):
+        test_case = record.TestCase(case_name=name, project_name='xtesting')
+        test_case.successful = successful
+        test_case.is_skipped = is_skipped
+        test_case.start_time = 1
+        test_case.stop_time = 3.5
+        test_case.result = 0
+        return test_case
+
+    def _read_jsonl(self):
+        with open(self.reporter.jsonl_file, encoding='utf-8') as jfile:
+            return [json.loads(line) for line in jfile]
+
+    def test_get_status(self):
+        self.assertEqual(reporter.get_status(self._test_case('test1')),
+                         'PASS')
+        self.assertEqual(reporter.get_status(self._test_case(
+            'test1', testcase.TestCase.EX_TESTCASE_FAILED)), 'FAIL')
+        self.assertEqual(reporter.get_status(self._test_case(
+            'test1', is_skipped=True)), 'SKIP')
+
+    def test_get_duration(self):
+        self.assertEqual(reporter.get_duration(self._test_case('test1')), 2.5)
+        test_case = self._test_case('test1')
+        test_case.stop_time = None
+        self.assertEqual(reporter.get_duration(test_case), 0)
+
+    def test_add(self):
+        with open(self.reporter.jsonl_file, 'w', encoding='utf-8') as jfile:
+            jfile.write('previous campaign\n')
+        self.reporter.add(self._test_case('test1'), 'tier1')
+        self.reporter.add(self._test_case(
+            'test2', testcase.TestCase.EX_TESTCASE_FAILED), 'tier1')
+        lines = self._read_jsonl()
+        self.assertEqual([line['case_name'] for line in lines],
+                         ['test1', 'test2'])
+        self.assertEqual(lines[1]['status'], 'FAIL')
+        self.assertEqual(lines[1]['tier'], 'tier1')
+        self.assertEqual(lines[1]['duration'], 2.5)
+
+    def test_add_ko(self):
+        with open(self.reporter.jsonl_file, 'w', encoding='utf-8'):
+            pass
+        self.reporter = reporter.Reporter(self.reporter.jsonl_file)
+        self.reporter.add(self._test_case('test1'), 'tier1')
+        self.assertEqual(list(self.reporter.test_cases), ['test1'])
+
+    def test_junit(self):
+        self.reporter.add(self._test_case('test1'), 'tier1')
+        self.reporter.add(self._test_case(
+            'test2', testcase.TestCase.EX_TESTCASE_FAILED), 'tier1')
+        self.reporter.add(self._test_case('test3', is_skipped=True), 'tier2')
+        self.reporter.add(self._test_case('test4'))
+        self.reporter.flush()
+        root = ElementTree.parse(self.reporter.junit_file).getroot()
+        self.assertEqual(root.tag, 'testsuites')
+        self.assertEqual(
+            (root.get('tests'), root.get('failures'), root.get('skipped'),
+             root.get('time')), ('4', '1', '1', '10.0'))
+        suites = root.findall('testsuite')
+        self.assertEqual([suite.get('name') for suite in suites],
+                         ['tier1', 'tier2', 'xtesting'])
+        self.assertEqual(suites[0].get('failures'), '1')
+        self.assertIsNotNone(suites[0][1].find('failure'))
+        self.assertIsNotNone(suites[1][0].find('skipped'))
+
+    @mock.patch('xtesting.ci.reporter.files.write_atomically')
+    def test_junit_throttled(self, *args):
+        self.reporter.junit_tests = 2
+        with mock.patch('time.monotonic', return_value=self.reporter.written):
+            self.reporter.add(self._test_case('test1'))
+            args[0].assert_not_called()
+            self.reporter.add(self._test_case('test2'))
+            args[0].assert_called_once()
+            self.reporter.add(self._test_case('test3'))
+            args[0].assert_called_once()
+        with mock.patch('time.monotonic',
+                        return_value=self.reporter.written + 30):
+            self.reporter.add(self._test_case('test4'))
+        self.assertEqual(args[0].call_count, 2)
+        self.reporter.flush()
+        self.assertEqual(args[0].call_count, 2)
+        self.reporter.add(self._test_case('test5'))
+        self.reporter.flush()
+        self.assertEqual(args[0].call_count, 3)
+        self.assertIn('test5', args[0].call_args[0][1])
+
+    def test_junit_rerun(self):
+        self.reporter.add(self._test_case(
+            'test1', testcase.TestCase.EX_TESTCASE_FAILED), 'tier1')
+        self.reporter.add(self._test_case('test1'), 'tier1')
+        self.reporter.flush()
+        root = ElementTree.parse(self.reporter.junit_file).getroot()
+        self.assertEqual((root.get('tests'), root.get('failures')),
+                         ('1', '0'))
+        self.assertEqual(len(self._read_jsonl()), 2)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -14,6 +14,7 @@ import os
 import mock
 
 from xtesting.ci import run_tests
+from xtesting.ci import stats
 from xtesting.core.testcase import TestCase
 
 
@@ -27,10 +28,15 @@ class FakeModule(TestCase):
         return TestCase.EX_OK
 
 
-class RunTestsTesting(unittest.TestCase):
+class RunnerTesting(unittest.TestCase):
 
     def setUp(self):
         self.runner = run_tests.Runner()
+        self.runner.timings = mock.Mock()
+        self.runner.checkpoint = mock.Mock()
+        self.runner.checkpoint.get.return_value = None
+        self.runner.history = mock.Mock()
+        self.runner.reporter = mock.Mock()
         mock_test_case = mock.Mock()
         mock_test_case.is_successful.return_value = TestCase.EX_OK
         self.runner.executed_test_cases['test1'] = mock_test_case
@@ -58,6 +64,9 @@ class RunTestsTesting(unittest.TestCase):
 
         self.run_tests_parser = run_tests.RunTestsParser()
 
+
+class RunTestsTesting(RunnerTesting):
+
     @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test')
     def test_get_run_dict(self, *args):
         retval = {'run': mock.Mock()}
@@ -117,17 +126,21 @@ class RunTestsTesting(unittest.TestCase):
             'export "\'OS_TENANT_NAME\'" = "\'admin\'"')
 
     def test_get_dict_by_test(self):
-        with mock.patch('builtins.open', mock.mock_open()), \
-                mock.patch('yaml.safe_load') as mock_yaml:
-            mock_obj = mock.Mock()
-            testcase_dict = {'case_name': 'testname',
-                             'criteria': 50}
-            attrs = {'get.return_value': [{'testcases': [testcase_dict]}]}
-            mock_obj.configure_mock(**attrs)
-            mock_yaml.return_value = mock_obj
-            self.assertDictEqual(
-                run_tests.Runner.get_dict_by_test('testname'),
-                testcase_dict)
+        testcase_dict = {'case_name': 'testname', 'criteria': 50}
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_dict_by_test.return_value = testcase_dict
+        self.assertDictEqual(
+            self.runner.get_dict_by_test('testname'), testcase_dict)
+        self.runner.tiers.get_dict_by_test.assert_called_once_with(
+            'testname')
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    def test_get_dict_by_test_missing(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_dict_by_test.return_value = None
+        self.assertIsNone(self.runner.get_dict_by_test('testname'))
+        args[0].assert_called_once_with(
+            'Project %s is not defined in testcases.yaml', 'testname')
 
     @mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
                 return_value=None)
@@ -144,9 +157,9 @@ class RunTestsTesting(unittest.TestCase):
         msg = "Cannot import the class for the test case."
         self.assertTrue(msg in str(context.exception))
 
-    @mock.patch('stevedore.driver.DriverManager',
-                return_value=mock.Mock(driver=FakeModule()))
-    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test')
+    @mock.patch('xtesting.ci.drivers.load', return_value=FakeModule())
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test',
+                return_value={'case_name': 'test_name'})
     def test_run_tests_default(self, *args):
         mock_test = mock.Mock()
         kwargs = {'get_name.return_value': 'test_name',
@@ -160,9 +173,18 @@ class RunTestsTesting(unittest.TestCase):
             self.runner.clean_flag = True
             self.assertEqual(self.runner.run_test(mock_test), TestCase.EX_OK)
         args[0].assert_called_with('test_name')
-        args[1].assert_called_with(
-            invoke_kwds=mock.ANY, invoke_on_load=True, name='test_module',
-            namespace='xtesting.testcase')
+        args[1].assert_called_with('test_module', args[0].return_value)
+        self.assertEqual(
+            list(args[1].return_value.details['timings']),
+            ['load', 'check_requirements', 'run', 'clean'])
+        self.runner.timings.add.assert_called_once_with(
+            'test_name', args[1].return_value.details['timings'])
+        self.runner.checkpoint.add.assert_called_once_with(
+            args[1].return_value)
+        self.runner.history.add.assert_called_once_with(
+            args[1].return_value)
+        self.runner.reporter.add.assert_called_once_with(
+            args[1].return_value, None)
         self.assertEqual(self.runner.overall_result,
                          run_tests.Result.EX_OK)
 
@@ -255,6 +277,9 @@ class RunTestsTesting(unittest.TestCase):
         self.assertEqual(self.runner.main(**kwargs),
                          run_tests.Result.EX_OK)
         mock_methods[1].assert_called()
+        self.runner.reporter.flush.assert_called_once_with()
+        mock_methods[0].assert_called_once_with(mock_tier)
+        self.runner.tiers.get_test.assert_not_called()
 
     @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
     @mock.patch('xtesting.ci.run_tests.Runner.run_test',
@@ -285,10 +310,30 @@ class RunTestsTesting(unittest.TestCase):
         args[1].assert_called_once_with()
         args[2].assert_called_once_with()
 
+    def test_parse_args_workers(self):
+        self.assertEqual(
+            self.run_tests_parser.parse_args(['-w', '4'])['workers'], 4)
+        self.assertEqual(
+            self.run_tests_parser.parse_args([])['workers'], 1)
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.exception')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_timings_ko(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.runner.timings.dump.side_effect = OSError
+        self.assertEqual(self.runner.main(test='all'),
+                         run_tests.Result.EX_OK)
+        args[3].assert_called_once_with("Cannot dump the timings")
+
     @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
     def test_main_any_tier_test_ko(self, *args):
         kwargs = {'get_tier.return_value': None,
-                  'get_test.return_value': None}
+                  'get_test.return_value': None,
+                  'resolve.return_value': []}
         self.runner.tiers = mock.Mock()
         self.runner.tiers.configure_mock(**kwargs)
         self.assertEqual(
@@ -297,6 +342,528 @@ class RunTestsTesting(unittest.TestCase):
         args[0].assert_called_once_with()
 
 
+class RunTestsExecutionTesting(RunnerTesting):
+
+    def test_get_timeout(self):
+        self.assertIsNone(self.runner.get_timeout({}))
+        self.assertEqual(self.runner.get_timeout({'timeout': '1.5'}), 1.5)
+        with mock.patch('xtesting.ci.run_tests.LOGGER.warning') as mock_log:
+            self.assertIsNone(self.runner.get_timeout({'timeout': 'foo'}))
+            mock_log.assert_called_once_with(
+                "Wrong value for timeout: %s", 'foo')
+
+    def test_run_driver(self):
+        test_case = mock.Mock()
+        self.runner.run_driver(test_case, {'args': {'foo': 'bar'}})
+        test_case.run.assert_called_once_with(foo='bar')
+        test_case.reset_mock()
+        self.runner.run_driver(test_case, {})
+        test_case.run.assert_called_once_with()
+
+    def test_run_driver_exception(self):
+        test_case = mock.Mock()
+        test_case.run.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            self.runner.run_driver(test_case, {})
+
+    @mock.patch('xtesting.ci.run_tests.Runner.execute')
+    @mock.patch('xtesting.ci.isolation.execute')
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test',
+                return_value={'case_name': 'test_name', 'timeout': 1})
+    def test_run_tests_timeout(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_skipped.return_value': False,
+                  'is_enabled.return_value': True}
+        mock_test.configure_mock(**kwargs)
+        test_case = FakeModule(case_name='test_name')
+        args[1].return_value = test_case
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value={'name': 'test_module'}):
+            self.assertEqual(self.runner.run_test(mock_test),
+                             TestCase.EX_TESTCASE_FAILED)
+        args[1].assert_called_once_with(
+            {'name': 'test_module'}, args[0].return_value, True, 1.0)
+        args[2].assert_not_called()
+        self.assertEqual(self.runner.executed_test_cases['test_name'],
+                         test_case)
+
+    @mock.patch('xtesting.ci.isolation.execute')
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test')
+    def test_run_tests_isolate(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_skipped.return_value': False,
+                  'is_enabled.return_value': True}
+        mock_test.configure_mock(**kwargs)
+        test_case = FakeModule(case_name='test_name')
+        test_case.run()
+        args[1].return_value = test_case
+        args[0].return_value = {'case_name': 'test_name', 'timeout': 60}
+        test_run_dict = {'name': 'test_module'}
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value=test_run_dict):
+            self.runner.isolate_flag = True
+            self.assertEqual(self.runner.run_test(mock_test), TestCase.EX_OK)
+        args[1].assert_called_once_with(
+            test_run_dict, args[0].return_value, True, 60)
+        self.assertEqual(self.runner.executed_test_cases['test_name'],
+                         test_case)
+
+    @mock.patch('xtesting.ci.isolation.execute')
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test')
+    def test_run_tests_isolate_skipped(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_skipped.return_value': False,
+                  'is_enabled.return_value': True}
+        mock_test.configure_mock(**kwargs)
+        args[1].return_value = FakeModule(case_name='test_name')
+        args[1].return_value.is_skipped = True
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value={'name': 'test_module'}):
+            self.runner.isolate_flag = True
+            self.assertEqual(self.runner.run_test(mock_test),
+                             TestCase.EX_TESTCASE_SKIPPED)
+
+    def test_publish(self):
+        test_case = mock.Mock(case_name='test_name', details={})
+        test_case.publish_artifacts.return_value = TestCase.EX_OK
+        test_case.push_to_db.return_value = TestCase.EX_PUSH_TO_DB_ERROR
+        self.runner.publish(test_case)
+        test_case.publish_artifacts.assert_not_called()
+        test_case.push_to_db.assert_not_called()
+        self.runner.push_flag = True
+        self.runner.report_flag = True
+        self.runner.publish(test_case)
+        test_case.publish_artifacts.assert_called_once_with()
+        test_case.push_to_db.assert_called_once_with()
+        self.assertEqual(self.runner.publication_errors,
+                         {'test_name': ['push_to_db']})
+        self.assertEqual(
+            list(test_case.details['timings']),
+            ['publish_artifacts', 'push_to_db'])
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    def test_summary_publications(self, *args):
+        self.runner.publication_errors = {'test_name': ['push_to_db']}
+        self.runner.summary_publications()
+        self.assertIn('push_to_db', str(args[0].call_args[0][1]))
+
+    @mock.patch('xtesting.ci.run_tests.Runner.summary_publications')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_single_test')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    def test_main_test_publication_errors(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_tier.return_value = None
+        self.runner.publication_errors = {'test_name': ['push_to_db']}
+        self.runner.main(test='test_name', report=True)
+        args[2].assert_not_called()
+        args[3].assert_called_once_with()
+
+    @mock.patch('xtesting.ci.run_tests.Runner.publish')
+    @mock.patch('xtesting.ci.drivers.load', return_value=FakeModule())
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test',
+                return_value={})
+    def test_run_tests_background(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_skipped.return_value': False,
+                  'is_enabled.return_value': True}
+        mock_test.configure_mock(**kwargs)
+        self.runner.pipeline = mock.Mock()
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value={'name': 'test_module'}):
+            self.assertEqual(self.runner.run_test(mock_test), TestCase.EX_OK)
+        self.runner.pipeline.put.assert_called_once_with(
+            args[1].return_value)
+        args[2].assert_not_called()
+
+    @mock.patch('xtesting.ci.pipeline.Pipeline')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_background(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(
+            self.runner.main(test='all', report=True, background=True),
+            run_tests.Result.EX_OK)
+        args[3].assert_called_once_with(self.runner.publish)
+        args[3].return_value.join.assert_called_once_with()
+
+    @mock.patch('xtesting.ci.server.serve', return_value=os.EX_OK)
+    @mock.patch('logging.config.fileConfig')
+    @mock.patch('os.makedirs')
+    @mock.patch('sys.argv', ['run_tests', '--serve', '--socket', 'foo',
+                             '-r', '--workers', '3'])
+    def test_main_serve(self, *args):
+        self.assertEqual(run_tests.main(), os.EX_OK)
+        args[2].assert_called_once_with(
+            run_tests.Runner, mock.ANY, 'foo',
+            cache_dir=run_tests.constants.CACHE_DIR)
+        defaults = args[2].call_args[0][1]
+        self.assertTrue(defaults['report'])
+        self.assertEqual(defaults['workers'], 3)
+        self.assertNotIn('serve', defaults)
+
+
+class RunTestsCacheTesting(RunnerTesting):
+
+    @mock.patch('xtesting.ci.run_tests.Runner.publish')
+    @mock.patch('xtesting.ci.drivers.load', return_value=FakeModule())
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test',
+                return_value={'case_name': 'test_name'})
+    def test_run_tests_cache_miss(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_enabled.return_value': True,
+                  'is_skipped.return_value': False}
+        mock_test.configure_mock(**kwargs)
+        self.runner.cache = mock.Mock()
+        self.runner.cache.get.return_value = None
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value={'name': 'test_module'}):
+            self.assertEqual(self.runner.run_test(mock_test), TestCase.EX_OK)
+        self.runner.cache.get.assert_called_once_with(args[0].return_value)
+        self.runner.cache.add.assert_called_once_with(
+            args[0].return_value, args[1].return_value)
+        args[2].assert_called_once_with(args[1].return_value)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.publish')
+    @mock.patch('xtesting.ci.drivers.load')
+    @mock.patch('xtesting.ci.run_tests.Runner.get_dict_by_test',
+                return_value={'case_name': 'test_name'})
+    def test_run_tests_cache_hit(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_enabled.return_value': True,
+                  'is_skipped.return_value': False}
+        mock_test.configure_mock(**kwargs)
+        test_case = mock.Mock()
+        test_case.is_skipped = False
+        test_case.is_successful.return_value = TestCase.EX_OK
+        self.runner.cache = mock.Mock()
+        self.runner.cache.get.return_value = test_case
+        with mock.patch('xtesting.ci.run_tests.Runner.get_run_dict',
+                        return_value={'name': 'test_module'}):
+            self.assertEqual(self.runner.run_test(mock_test), TestCase.EX_OK)
+        self.assertEqual(
+            self.runner.executed_test_cases['test_name'], test_case)
+        self.runner.checkpoint.add.assert_called_once_with(test_case)
+        self.runner.cache.add.assert_not_called()
+        args[1].assert_not_called()
+        args[2].assert_not_called()
+
+    @mock.patch('xtesting.ci.run_tests.Runner.publish')
+    @mock.patch('xtesting.ci.drivers.load')
+    def test_run_tests_completed(self, *args):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_enabled.return_value': True,
+                  'is_skipped.return_value': False}
+        mock_test.configure_mock(**kwargs)
+        test_case = mock.Mock()
+        test_case.is_successful.return_value = TestCase.EX_TESTCASE_FAILED
+        test_case.details = {'timings': {'run': 1.0}}
+        test_case.is_skipped = False
+        self.runner.checkpoint.get.return_value = test_case
+        self.assertEqual(self.runner.run_test(mock_test),
+                         TestCase.EX_TESTCASE_FAILED)
+        self.runner.checkpoint.get.assert_called_once_with('test_name')
+        self.assertEqual(
+            self.runner.executed_test_cases['test_name'], test_case)
+        self.runner.timings.add.assert_called_once_with(
+            'test_name', {'run': 1.0})
+        self.runner.checkpoint.add.assert_not_called()
+        self.runner.reporter.add.assert_called_once_with(
+            test_case, None)
+        args[0].assert_not_called()
+        args[1].assert_not_called()
+
+    def test_run_tests_completed_skipped(self):
+        mock_test = mock.Mock()
+        kwargs = {'get_name.return_value': 'test_name',
+                  'is_enabled.return_value': True,
+                  'is_skipped.return_value': False}
+        mock_test.configure_mock(**kwargs)
+        test_case = mock.Mock()
+        test_case.is_skipped = True
+        self.runner.checkpoint.get.return_value = test_case
+        self.assertEqual(self.runner.run_test(mock_test),
+                         TestCase.EX_TESTCASE_SKIPPED)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_resume(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(self.runner.main(test='all', resume=True),
+                         run_tests.Result.EX_OK)
+        self.runner.checkpoint.load.assert_called_once_with()
+        args[1].assert_called_once_with()
+
+    @mock.patch('xtesting.ci.cache.Cache')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_reuse_results(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(self.runner.main(test='all', reuse_results=True),
+                         run_tests.Result.EX_OK)
+        self.assertEqual(self.runner.cache, args[3].return_value)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_no_resume(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(self.runner.main(test='all'),
+                         run_tests.Result.EX_OK)
+        self.runner.checkpoint.load.assert_not_called()
+        args[1].assert_called_once_with()
+
+
+class RunTestsParallelTesting(RunnerTesting):
+
+    def _get_parallel_tests(self, blocking=False):
+        tests = []
+        for name in ['test1', 'test2', 'test3']:
+            test = mock.Mock()
+            attrs = {'get_name.return_value': name,
+                     'is_parallel.return_value': True,
+                     'is_blocking.return_value': blocking,
+                     'get_depends_on.return_value': ()}
+            test.configure_mock(**attrs)
+            tests.append(test)
+        return tests
+
+    def test_get_batches_sequential(self):
+        tests = self._get_parallel_tests()
+        self.assertEqual(self.runner.get_batches(tests),
+                         [[tests[0]], [tests[1]], [tests[2]]])
+
+    def test_get_batches_parallel(self):
+        tests = self._get_parallel_tests()
+        tests[1].is_parallel.return_value = False
+        self.runner.workers = 2
+        self.assertEqual(self.runner.get_batches(tests),
+                         [[tests[0]], [tests[1]], [tests[2]]])
+        tests[1].is_parallel.return_value = True
+        self.assertEqual(self.runner.get_batches(tests), [tests])
+
+    def test_get_batches_depends_on(self):
+        tests = self._get_parallel_tests()
+        tests[2].get_depends_on.return_value = ('test1', )
+        self.runner.workers = 3
+        self.assertEqual(self.runner.get_batches(tests),
+                         [[tests[0], tests[1]], [tests[2]]])
+        tests[2].get_depends_on.return_value = ('test0', )
+        self.assertEqual(self.runner.get_batches(tests), [tests])
+
+    @mock.patch('xtesting.ci.run_tests.Runner.run_test',
+                return_value=TestCase.EX_OK)
+    def test_run_tier_parallel(self, *args):
+        tests = self._get_parallel_tests()
+        self.tier.get_tests.return_value = tests
+        self.runner.executed_test_cases['test3'] = mock.Mock(
+            is_successful=mock.Mock(return_value=TestCase.EX_OK))
+        self.runner.workers = 3
+        self.assertEqual(self.runner.run_tier(self.tier),
+                         run_tests.Result.EX_OK)
+        args[0].assert_has_calls(
+            [mock.call(test) for test in tests], any_order=True)
+
+    def test_run_tier_parallel_blocking(self):
+        tests = self._get_parallel_tests(blocking=True)
+        self.tier.get_tests.return_value = tests
+        failed = mock.Mock(EX_TESTCASE_FAILED=TestCase.EX_TESTCASE_FAILED)
+        failed.is_successful.return_value = TestCase.EX_TESTCASE_FAILED
+        self.runner.executed_test_cases['test1'] = failed
+        self.runner.workers = 1
+
+        def run_test(test):
+            return TestCase.EX_TESTCASE_FAILED if (
+                test.get_name() == 'test1') else TestCase.EX_OK
+
+        with mock.patch('xtesting.ci.run_tests.Runner.run_test',
+                        side_effect=run_test), \
+                mock.patch('xtesting.ci.run_tests.LOGGER.error'):
+            with self.assertRaises(run_tests.BlockingTestFailed):
+                self.runner.run_parallel_tests(tests)
+        self.assertEqual(self.runner.overall_result,
+                         run_tests.Result.EX_ERROR)
+
+    def test_sort_tests(self):
+        tests = self._get_parallel_tests()
+        self.assertEqual(self.runner.sort_tests(tests), tests)
+        self.runner.durations = {'test1': 1, 'test3': 5}
+        self.assertEqual(self.runner.sort_tests(tests),
+                         [tests[2], tests[1], tests[0]])
+
+    def test_run_parallel_tests_longest_first(self):
+        tests = self._get_parallel_tests()
+        self.runner.durations = {'test1': 1, 'test2': 2, 'test3': 5}
+        self.runner.executed_test_cases['test3'] = mock.Mock(
+            is_successful=mock.Mock(return_value=TestCase.EX_OK))
+        with mock.patch('xtesting.ci.run_tests.Runner.run_test',
+                        return_value=TestCase.EX_OK) as mock_run, \
+                mock.patch('xtesting.ci.run_tests.Runner.check_test') as \
+                mock_check:
+            self.runner.run_parallel_tests(tests)
+        mock_run.assert_has_calls([mock.call(test) for test in tests[::-1]])
+        mock_check.assert_has_calls([mock.call(test) for test in tests])
+
+    @mock.patch('xtesting.ci.run_tests.Runner.run_test',
+                side_effect=Exception)
+    def test_run_tier_parallel_exception(self, *args):
+        tests = self._get_parallel_tests()
+        self.runner.workers = 2
+        with self.assertRaises(Exception):
+            self.runner.run_parallel_tests(tests)
+        self.assertEqual(args[0].call_count, 3)
+
+    @mock.patch('xtesting.ci.scheduler.Scheduler')
+    def test_run_dag(self, *args):
+        tests = self._get_parallel_tests()
+        args[0].return_value.get_tests.return_value = tests
+        args[0].return_value.run.return_value = {
+            'test1': TestCase.EX_OK, 'test2': TestCase.EX_OK}
+        self.runner.workers = 2
+        self.assertEqual(self.runner.run_dag([self.tier]),
+                         run_tests.Result.EX_OK)
+        args[0].assert_called_once_with([self.tier], None)
+        args[0].return_value.run.assert_called_once_with(
+            self.runner.run_test, 2)
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.info')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_dag')
+    def test_run_all_dag(self, *args):
+        self.tier.description = 'test_desc'
+        self.runner.tiers = self.tiers
+        self.runner.dag_flag = True
+        self.runner.run_all()
+        args[0].assert_called_once_with([self.tier])
+
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_dag')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_tier_dag(self, *mock_methods):
+        kwargs = {'test': 'tier_name', 'dag': True}
+        args = {'get_tier.return_value': self.tier,
+                'get_test.return_value': None}
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.configure_mock(**args)
+        self.assertEqual(self.runner.main(**kwargs),
+                         run_tests.Result.EX_OK)
+        mock_methods[1].assert_called_once_with([self.tier])
+
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_longest_first(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(self.runner.main(test='all', longest_first=True),
+                         run_tests.Result.EX_OK)
+        self.assertEqual(self.runner.durations,
+                         self.runner.history.get_durations.return_value)
+        args[1].assert_called_once_with()
+
+
+class RunTestsIterationTesting(RunnerTesting):
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_test',
+                return_value=TestCase.EX_TESTCASE_FAILED)
+    def test_run_single_test_failed(self, *args):
+        self.runner.run_single_test(self.tier.get_tests()[0])
+        self.assertEqual(self.runner.overall_result,
+                         run_tests.Result.EX_ERROR)
+        args[1].assert_called_once_with(
+            "The test case '%s' failed.", 'test1')
+
+    def _get_iteration_target(self, results):
+        iterations = iter(results)
+
+        def target():
+            result = next(iterations)
+            test_case = mock.Mock(
+                start_time=0, stop_time=result[0], is_skipped=False,
+                details={})
+            test_case.is_successful.return_value = result[1]
+            self.runner.executed_test_cases['test1'] = test_case
+            skipped = mock.Mock(is_skipped=True)
+            self.runner.executed_test_cases['test2'] = skipped
+            if result[1] != TestCase.EX_OK:
+                raise run_tests.BlockingTestFailed
+        return target
+
+    @mock.patch('xtesting.ci.run_tests.Runner.publish')
+    def test_run_iterations_repeat(self, *args):
+        self.runner.report_flag = True
+        self.runner.cache = mock.Mock()
+        self.runner.run_iterations(self._get_iteration_target(
+            [(1, TestCase.EX_OK), (3, TestCase.EX_TESTCASE_FAILED),
+             (2, TestCase.EX_OK), (4, TestCase.EX_OK)]), repeat=3)
+        self.assertIsNone(self.runner.cache)
+        self.assertEqual(self.runner.checkpoint.reset.call_count, 3)
+        self.assertEqual(list(self.runner.distributions), ['test1'])
+        test_case = self.runner.executed_test_cases['test1']
+        self.assertEqual(test_case.stop_time, 2)
+        self.assertEqual(test_case.details['iterations'], {
+            'iterations': 3, 'pass_rate': 66.67, 'min': 1, 'mean': 2.0,
+            'p50': 2.0, 'p95': 2.9, 'p99': 2.98, 'max': 3})
+        args[0].assert_called_once_with(test_case)
+        self.assertTrue(self.runner.report_flag)
+
+    @mock.patch('time.time', side_effect=[0, 0, 5, 11])
+    def test_run_iterations_soak(self, *args):
+        pipeline = mock.Mock()
+        self.runner.pipeline = pipeline
+        self.runner.run_iterations(self._get_iteration_target(
+            [(1, TestCase.EX_OK)] * 3), duration=10)
+        self.assertEqual(self.runner.distributions['test1'].iterations, 2)
+        self.assertEqual(self.runner.pipeline, pipeline)
+        pipeline.put.assert_called_once_with(
+            self.runner.executed_test_cases['test1'])
+        self.assertEqual(args[0].call_count, 4)
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.info')
+    def test_summary_iterations(self, *args):
+        self.runner.distributions['test1'] = stats.Distribution()
+        self.runner.distributions['test1'].add(1.5, True)
+        self.runner.summary_iterations()
+        self.assertIn('100.0%', str(args[0].call_args[0][1]))
+
+    @mock.patch('xtesting.ci.run_tests.Runner.summary_iterations')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_iterations')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_repeat(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+
+        def run_iterations(*_):
+            self.runner.distributions['test1'] = stats.Distribution()
+
+        args[2].side_effect = run_iterations
+        self.assertEqual(self.runner.main(test='all', repeat=5),
+                         run_tests.Result.EX_OK)
+        args[2].assert_called_once_with(self.runner.run_all, 5, None)
+        args[3].assert_called_once_with()
+
+
 if __name__ == "__main__":
     logging.disable(logging.CRITICAL)
     unittest.main(verbosity=2)
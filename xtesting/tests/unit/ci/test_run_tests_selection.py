@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import unittest
+
+import mock
+
+from xtesting.ci import run_tests
+from xtesting.ci import tier_handler
+from xtesting.tests.unit.ci.test_run_tests import RunnerTesting
+
+
+class RunTestsSelectionTesting(RunnerTesting):
+
+    def test_select_shard(self):
+        skipped = mock.Mock()
+        skipped.get_name.return_value = 'test3'
+        self.tier.get_skipped_test.return_value = [skipped]
+        self.runner.tiers = self.tiers
+        self.runner.select_shard(1, 2)
+        self.tiers.select.assert_called_once_with(['test1', 'test3'])
+        self.tiers.select.reset_mock()
+        self.runner.select_shard(2, 2, {'test1': 1})
+        self.tiers.select.assert_called_once_with(['test2'])
+
+    @mock.patch('xtesting.ci.shard.load_durations')
+    @mock.patch('xtesting.ci.run_tests.Runner.select_shard')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_shard(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(
+            self.runner.main(test='all', shard=(2, 3), durations='foo'),
+            run_tests.Result.EX_OK)
+        args[4].assert_called_once_with('foo')
+        args[3].assert_called_once_with(2, 3, args[4].return_value)
+        args[1].assert_called_once_with()
+
+    @mock.patch('xtesting.ci.shard.load_durations')
+    @mock.patch('xtesting.ci.run_tests.Runner.select_shard')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_shard_wo_durations(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.get_tier.return_value = None
+        with mock.patch.object(run_tests.LOGGER, 'warning') as mock_method:
+            self.assertEqual(self.runner.main(test='all', shard=(2, 3)),
+                             run_tests.Result.EX_OK)
+            mock_method.assert_called_once()
+        args[4].assert_not_called()
+        args[3].assert_called_once_with(2, 3, None)
+        args[1].assert_called_once_with()
+
+    def _get_plan_tiers(self):
+        tier = tier_handler.Tier('tier1')
+        for name in ['test1', 'test2']:
+            tier.add_test(tier_handler.TestCase(
+                name, True, False, 100, False, parallel=True))
+        tier.skip_test(tier_handler.TestCase(
+            'test3', False, True, 100, False))
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_tiers.return_value = [tier]
+        self.runner.history.get_durations.return_value = {'test2': 20}
+
+    @mock.patch('xtesting.ci.shard.load_durations',
+                return_value={'test1': 30, 'test2': 10})
+    @mock.patch('xtesting.ci.run_tests.LOGGER.info')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_test')
+    def test_plan(self, *args):
+        self._get_plan_tiers()
+        self.runner.workers = 2
+        self.assertEqual(self.runner.plan(durations='foo'),
+                         run_tests.Result.EX_OK)
+        args[0].assert_not_called()
+        args[2].assert_called_once_with('foo')
+        self.runner.tiers.select.assert_not_called()
+        self.assertIn('test3', str(args[1].call_args_list[0][0][1]))
+        args[1].assert_called_with(
+            "Predicted duration: %s (%d worker(s))", '00:30', 2)
+
+    @mock.patch('xtesting.ci.shard.load_durations',
+                return_value={'test1': 30, 'test2': 10})
+    @mock.patch('xtesting.ci.run_tests.LOGGER.info')
+    def test_plan_dag(self, *args):
+        self._get_plan_tiers()
+        self.runner.dag_flag = True
+        self.assertEqual(self.runner.plan(), run_tests.Result.EX_OK)
+        args[0].assert_called_with(
+            "Predicted duration: %s (%d worker(s))", '00:50', 1)
+
+    @mock.patch('xtesting.ci.shard.load_durations', return_value={})
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    @mock.patch('xtesting.ci.run_tests.LOGGER.info')
+    def test_plan_selection(self, *args):
+        self._get_plan_tiers()
+        self.runner.tiers.resolve.return_value = ['test1']
+        self.assertEqual(self.runner.plan('test1', ['smoke']),
+                         run_tests.Result.EX_OK)
+        self.runner.tiers.resolve.assert_called_once_with(
+            ['test1'], ['smoke'])
+        self.runner.tiers.select.assert_called_once_with(['test1'])
+        self.runner.tiers.resolve.side_effect = ValueError('foo')
+        self.assertEqual(self.runner.plan(['foo']), run_tests.Result.EX_ERROR)
+        args[1].assert_called_once_with(self.runner.tiers.resolve.side_effect)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.plan',
+                return_value=run_tests.Result.EX_OK)
+    @mock.patch('xtesting.ci.run_tests.Runner.run_all')
+    def test_main_plan(self, *args):
+        self.assertEqual(
+            self.runner.main(test=['all'], plan=True, workers=3),
+            run_tests.Result.EX_OK)
+        args[0].assert_not_called()
+        args[1].assert_called_once_with(['all'], None, None)
+        self.assertEqual(self.runner.workers, 3)
+        self.runner.timings.dump.assert_not_called()
+
+    def test_get_target(self):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_tier.return_value = None
+        self.runner.tiers.get_test.return_value = None
+        self.runner.tiers.resolve.return_value = []
+        self.assertEqual(self.runner.get_target('all'), self.runner.run_all)
+        self.assertEqual(self.runner.get_target(['all']), self.runner.run_all)
+        self.assertIsNone(self.runner.get_target('foo'))
+        self.runner.tiers.resolve.assert_called_with(['foo'], None)
+        self.assertIsNone(self.runner.get_target(None))
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    def test_get_target_selection(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.resolve.return_value = ['test1', 'test3']
+        self.assertEqual(self.runner.get_target(['test1', 'test*']),
+                         self.runner.run_all)
+        self.runner.tiers.resolve.assert_called_once_with(
+            ['test1', 'test*'], None)
+        self.runner.tiers.select.assert_called_once_with(['test1', 'test3'])
+        self.runner.tiers.get_tier.assert_not_called()
+        self.assertEqual(self.runner.get_target(None, ['smoke']),
+                         self.runner.run_all)
+        self.runner.tiers.resolve.assert_called_with(['all'], ['smoke'])
+        self.runner.tiers.resolve.side_effect = ValueError('foo')
+        self.assertIsNone(self.runner.get_target(['foo', 'bar']))
+        args[0].assert_called_once_with(self.runner.tiers.resolve.side_effect)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.run_single_test')
+    def test_get_target_test(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_tier.return_value = None
+        self.runner.get_target('test_name')()
+        args[0].assert_called_once_with(
+            self.runner.tiers.get_test.return_value)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.run_dag')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_tier')
+    def test_get_target_tier(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.get_target('tier_name')()
+        args[0].assert_called_once_with(
+            self.runner.tiers.get_tier.return_value)
+        self.runner.dag_flag = True
+        self.runner.get_target('tier_name')()
+        args[1].assert_called_once_with(
+            [self.runner.tiers.get_tier.return_value])
+
+    @mock.patch('xtesting.ci.run_tests.Runner.get_target')
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.summary')
+    def test_main_selection(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_test.return_value = None
+        self.assertEqual(
+            self.runner.main(test=['test1', 'tier*'], tags=['smoke']),
+            run_tests.Result.EX_OK)
+        args[2].assert_called_once_with(['test1', 'tier*'], ['smoke'])
+        args[2].return_value.assert_called_once_with()
+        self.runner.tiers.get_test.assert_called_once_with(None)
+        self.runner.tiers.get_tier.assert_not_called()
+        args[0].assert_called_once_with(None)
+
+    @mock.patch('xtesting.ci.run_tests.Runner.source_envfile')
+    @mock.patch('xtesting.ci.run_tests.Runner.run_single_test')
+    def test_main_single_selection(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.get_tier.return_value = None
+        self.assertEqual(self.runner.main(test=['test1']),
+                         run_tests.Result.EX_OK)
+        args[0].assert_called_once_with(
+            self.runner.tiers.get_test.return_value)
+        self.runner.tiers.get_test.assert_called_with('test1')
+
+    @mock.patch('xtesting.ci.run_tests.LOGGER.error')
+    def test_report_empty_selection(self, *args):
+        self.runner.tiers = mock.Mock()
+        self.runner.tiers.resolve.side_effect = ValueError('foo')
+        self.runner.report_empty_selection(['re:^pi', 'foo'])
+        self.assertEqual(args[0].call_args[0][1], 're:^pi foo')
+        self.assertIn('Unknown', args[0].call_args[0][0])
+        self.runner.report_empty_selection(['re:^pi'], ['smoke'])
+        self.assertIn('Unknown', args[0].call_args[0][0])
+        self.runner.tiers.resolve.side_effect = None
+        self.runner.tiers.resolve.return_value = ['ping']
+        self.runner.report_empty_selection(None, ['smoke', 'slow'])
+        self.assertEqual(args[0].call_args[0][1:], ('all', 'smoke slow'))
+        self.assertIn('tags', args[0].call_args[0][0])
+        self.runner.tiers.resolve.assert_called_with(['all'])
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import unittest
+
+import mock
+
+from xtesting.ci import scheduler
+from xtesting.ci import tier_handler
+from xtesting.core.testcase import TestCase
+
+
+class SchedulerTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.tier1 = tier_handler.Tier('tier1')
+        self.tier2 = tier_handler.Tier('tier2')
+        self.add_test(self.tier1, 'test1')
+        self.add_test(self.tier1, 'test2')
+        self.add_test(self.tier2, 'test3', depends_on=['test1'])
+        self.add_test(self.tier2, 'test4', depends_on=['test2', 'test3'])
+        self.add_test(self.tier2, 'test5')
+
+    @staticmethod
+    def add_test(tier, name, depends_on=None, blocking=False):
+        tier.add_test(tier_handler.TestCase(
+            name, True, False, 100, blocking, depends_on=depends_on))
+
+    def test_stages(self):
+        plan = scheduler.Scheduler([self.tier1, self.tier2])
+        self.assertEqual(
+            plan.stages, [['test1', 'test2', 'test5'], ['test3'], ['test4']])
+
+    def test_cycle(self):
+        self.tier1.get_tests()[0].depends_on = ['test4']
+        with self.assertRaises(scheduler.DependencyError) as context:
+            scheduler.Scheduler([self.tier1, self.tier2])
+        self.assertIn('test1, test3, test4', str(context.exception))
+
+    def test_str(self):
+        message = str(scheduler.Scheduler([self.tier1, self.tier2]))
+        self.assertIn('test2 test3', message)
+        self.assertIn('STAGE', message)
+
+    def test_run(self):
+        run_test = mock.Mock(return_value=TestCase.EX_OK)
+        plan = scheduler.Scheduler([self.tier1, self.tier2])
+        self.assertEqual(plan.run(run_test, workers=2), {
+            'test1': TestCase.EX_OK, 'test2': TestCase.EX_OK,
+            'test3': TestCase.EX_OK, 'test4': TestCase.EX_OK,
+            'test5': TestCase.EX_OK})
+        started = [call[0][0].get_name() for call in run_test.call_args_list]
+        self.assertLess(started.index('test1'), started.index('test3'))
+        self.assertLess(started.index('test3'), started.index('test4'))
+
+    def test_run_longest_first(self):
+        run_test = mock.Mock(return_value=TestCase.EX_OK)
+        plan = scheduler.Scheduler(
+            [self.tier1, self.tier2], {'test1': 1, 'test5': 10})
+        plan.run(run_test)
+        self.assertEqual(
+            [call[0][0].get_name() for call in run_test.call_args_list],
+            ['test5', 'test2', 'test1', 'test3', 'test4'])
+
+    def test_run_failed_dependency(self):
+        def run_test(test):
+            return TestCase.EX_TESTCASE_FAILED if (
+                test.get_name() == 'test3') else TestCase.EX_OK
+
+        plan = scheduler.Scheduler([self.tier1, self.tier2])
+        results = plan.run(run_test)
+        self.assertNotIn('test4', results)
+        self.assertEqual(results['test5'], TestCase.EX_OK)
+
+    def test_run_unmet_dependency(self):
+        plan = scheduler.Scheduler([self.tier2])
+        results = plan.run(mock.Mock(return_value=TestCase.EX_OK))
+        self.assertEqual(results, {'test5': TestCase.EX_OK})
+
+    def test_run_blocking(self):
+        self.tier1.get_tests()[0].blocking = True
+        run_test = mock.Mock(return_value=TestCase.EX_TESTCASE_FAILED)
+        plan = scheduler.Scheduler([self.tier1, self.tier2])
+        self.assertEqual(plan.run(run_test),
+                         {'test1': TestCase.EX_TESTCASE_FAILED})
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+import mock
+
+from xtesting.ci import record
+from xtesting.ci import run_tests
+from xtesting.ci import server
+
+
+class StreamHandlerTesting(unittest.TestCase):
+
+    def test_emit(self):
+        send = mock.Mock()
+        handler = server.StreamHandler(send)
+        handler.emit(logging.makeLogRecord({'msg': 'foo'}))
+        self.assertIn('foo', send.call_args[0][0]['log'])
+
+    def test_emit_gone(self):
+        handler = server.StreamHandler(mock.Mock(side_effect=OSError))
+        with mock.patch.object(handler, 'handleError') as mock_error:
+            handler.emit(logging.makeLogRecord({'msg': 'foo'}))
+            mock_error.assert_not_called()
+
+
+class ServerTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'run_tests.sock')
+        self.server = server.Server(
+            run_tests.Runner, run_tests.RunTestsParser().parse_args([]),
+            self.path)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01, ))
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def test_get_kwargs(self):
+        kwargs = self.server.get_kwargs({'test': 'first', 'report': True})
+        self.assertEqual(kwargs['test'], 'first')
+        self.assertTrue(kwargs['report'])
+        self.assertFalse(kwargs['push'])
+        self.assertNotIn('serve', kwargs)
+
+    def test_get_kwargs_ko(self):
+        with self.assertRaises(ValueError):
+            self.server.get_kwargs({'serve': True})
+        with self.assertRaises(TypeError):
+            self.server.get_kwargs(['first'])
+
+    @mock.patch('xtesting.utils.config.get_xtesting_config',
+                return_value='testcases.yaml')
+    @mock.patch('xtesting.ci.tier_builder.TierBuilder')
+    def test_get_tiers(self, *args):
+        tiers = args[0].return_value
+        tiers.testcases_file = 'testcases.yaml'
+        tiers.is_modified.side_effect = [False, True]
+        self.assertEqual(self.server.get_tiers(), tiers)
+        self.assertEqual(self.server.get_tiers(), tiers)
+        tiers.generate_tiers.assert_called_once_with()
+        self.server.cache_dir = 'cache'
+        self.server.get_tiers()
+        self.assertEqual(args[0].call_count, 2)
+        args[0].assert_called_with('testcases.yaml', cache_dir='cache')
+
+    def test_get_tiers_include(self):
+        with open(os.path.join(self.tmpdir.name, 'testcases.yaml'), 'w',
+                  encoding='utf-8') as tfile:
+            tfile.write('tiers:\n  - name: t1\n    include: t1.yaml\n')
+        include = os.path.join(self.tmpdir.name, 't1.yaml')
+        with open(include, 'w', encoding='utf-8') as tfile:
+            tfile.write('testcases:\n  - case_name: x\n'
+                        '    project_name: xtesting\n')
+        with mock.patch('xtesting.utils.config.get_xtesting_config',
+                        return_value=os.path.join(
+                            self.tmpdir.name, 'testcases.yaml')):
+            tiers = self.server.get_tiers()
+            self.assertEqual(tiers.get_tier('t1').get_test_names(), ['x'])
+            self.assertIs(self.server.get_tiers(), tiers)
+            with open(include, 'w', encoding='utf-8') as tfile:
+                tfile.write('testcases:\n  - case_name: yz\n'
+                            '    project_name: xtesting\n')
+            tiers = self.server.get_tiers()
+            self.assertEqual(tiers.get_tier('t1').get_test_names(), ['yz'])
+
+    @mock.patch('xtesting.ci.server.Server.get_tiers')
+    def test_request(self, *args):
+        runner_class = mock.Mock()
+        self.server.runner_class = runner_class
+
+        def main(**kwargs):
+            logging.getLogger('xtesting.ci.run_tests').warning(
+                "Running %s", kwargs['test'])
+            return run_tests.Result.EX_OK
+
+        runner_class.return_value.main.side_effect = main
+        runner_class.return_value.executed_test_cases = {
+            'first': record.TestCase(case_name='first')}
+        lines = list(server.request(self.path, test='first'))
+        runner_class.assert_called_once_with(args[0].return_value)
+        self.assertIn('Running first', lines[-2]['log'])
+        self.assertEqual(lines[-1]['result'], os.EX_OK)
+        self.assertEqual(lines[-1]['test_cases'][0]['case_name'], 'first')
+
+    @mock.patch('xtesting.ci.server.LOGGER.exception')
+    @mock.patch('xtesting.ci.server.Server.get_tiers', side_effect=OSError)
+    def test_request_ko(self, *args):
+        self.assertEqual(list(server.request(self.path, test='first')),
+                         [{'error': ''}])
+        args[1].assert_called_once()
+
+    def test_request_wrong(self):
+        lines = list(server.request(self.path, foo='bar'))
+        self.assertEqual(
+            lines, [{'error': 'Wrong request: unknown arguments foo'}])
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from xtesting.ci import shard
+
+
+class ShardTesting(unittest.TestCase):
+
+    def test_parse(self):
+        self.assertEqual(shard.parse('1/3'), (1, 3))
+        self.assertEqual(shard.parse('3/3'), (3, 3))
+
+    def test_parse_ko(self):
+        for value in ['foo', '1', '1/2/3', '0/3', '4/3', 'a/b']:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                shard.parse(value)
+
+    def test_load_durations(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'timings.json')
+            with open(path, 'w', encoding='utf-8') as tfile:
+                json.dump({'testcases': {
+                    'test1': {'load': 0.5, 'run': 10, 'push_to_db': 3},
+                    'test2': {}}}, tfile)
+            self.assertEqual(shard.load_durations(path),
+                             {'test1': 10.5, 'test2': 0})
+
+    def test_load_durations_missing(self):
+        self.assertEqual(shard.load_durations('/nonexistent'), {})
+
+    def test_partition_round_robin(self):
+        names = ['test1', 'test2', 'test3', 'test4', 'test5']
+        self.assertEqual(
+            shard.partition(names, 2),
+            [['test1', 'test3', 'test5'], ['test2', 'test4']])
+        self.assertEqual(
+            shard.partition(names, 2, {'foo': 1}),
+            [['test1', 'test3', 'test5'], ['test2', 'test4']])
+
+    def test_partition_durations(self):
+        names = ['test1', 'test2', 'test3', 'test4', 'test5']
+        durations = {'test1': 1, 'test2': 8, 'test3': 3, 'test4': 4,
+                     'test5': 2}
+        self.assertEqual(
+            shard.partition(names, 2, durations),
+            [['test1', 'test2'], ['test3', 'test4', 'test5']])
+
+    def test_partition_unknown(self):
+        names = ['test1', 'test2', 'test3']
+        self.assertEqual(
+            shard.partition(names, 2, {'test1': 10, 'test2': 2}),
+            [['test1'], ['test2', 'test3']])
+
+    def test_partition_more_shards(self):
+        self.assertEqual(
+            shard.partition(['test1'], 3, {'test1': 1}),
+            [['test1'], [], []])
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
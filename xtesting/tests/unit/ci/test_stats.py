@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import random
+import unittest
+
+import mock
+
+from xtesting.ci import stats
+
+
+class P2Testing(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertIsNone(stats.P2(0.5).get())
+
+    def test_few(self):
+        estimator = stats.P2(0.5)
+        for value in [3, 1, 2]:
+            estimator.add(value)
+        self.assertEqual(estimator.get(), 2)
+
+    def test_estimate(self):
+        rand = random.Random(0)
+        values = [rand.uniform(0, 100) for _ in range(20000)]
+        for quantile in [0.5, 0.95, 0.99]:
+            estimator = stats.P2(quantile)
+            for value in values:
+                estimator.add(value)
+            self.assertAlmostEqual(
+                estimator.get(),
+                sorted(values)[int(quantile * len(values))], delta=1)
+            self.assertEqual(len(estimator.heights), 5)
+
+
+class DistributionTesting(unittest.TestCase):
+
+    def test_empty(self):
+        self.assertEqual(stats.Distribution().to_dict(), {'iterations': 0})
+
+    def test_to_dict(self):
+        distribution = stats.Distribution()
+        for value in range(1, 102):
+            distribution.add(value, value % 2)
+        self.assertEqual(distribution.to_dict(), {
+            'iterations': 101, 'pass_rate': 50.5, 'min': 1, 'mean': 51.0,
+            'p50': 51, 'p95': 96, 'p99': 100, 'max': 101})
+
+    @mock.patch('xtesting.ci.stats.SAMPLES', 10)
+    def test_constant_memory(self):
+        distribution = stats.Distribution()
+        for value in range(1000):
+            distribution.add(value, True)
+        self.assertEqual(len(distribution.samples), 10)
+        self.assertAlmostEqual(distribution.to_dict()['p50'], 500, delta=5)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
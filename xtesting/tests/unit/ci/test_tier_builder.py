@@ -9,9 +9,11 @@
 
 import logging
 import os
+import tempfile
 import unittest
 
 import mock
+import yaml
 
 from xtesting.ci import tier_builder
 
@@ -32,11 +34,9 @@ class TierBuilderTesting(unittest.TestCase):
         self.dic_tier = {
             'name': 'test_tier', 'description': 'test_desc',
             'testcases': [self.testcase, self.testcase_disabled]}
-        self.mock_yaml = mock.Mock()
-        attrs = {'get.return_value': [self.dic_tier]}
-        self.mock_yaml.configure_mock(**attrs)
+        self.mock_yaml = {'tiers': [self.dic_tier]}
 
-        with mock.patch('xtesting.ci.tier_builder.yaml.safe_load',
+        with mock.patch('xtesting.ci.tier_builder.yaml.load',
                         return_value=self.mock_yaml), \
                 mock.patch('builtins.open', mock.mock_open()):
             os.environ["INSTALLER_TYPE"] = 'test_installer'
@@ -77,7 +77,7 @@ class TierBuilderTesting(unittest.TestCase):
 
     def test_get_tests_present_tier(self):
         self.assertEqual(self.tierbuilder.get_tests('test_tier'),
-                         self.tier_obj.tests_array)
+                         tuple(self.tier_obj.tests_array))
 
     def test_get_tests_missing_tier(self):
         self.assertEqual(self.tierbuilder.get_tests('test_tier2'),
@@ -90,6 +90,68 @@ class TierBuilderTesting(unittest.TestCase):
     def test_get_tier_name_ko(self):
         self.assertEqual(self.tierbuilder.get_tier_name('test_name2'), None)
 
+    def test_get_dict_by_test(self):
+        self.assertEqual(self.tierbuilder.get_dict_by_test('test_name'),
+                         self.testcase)
+        self.assertEqual(
+            self.tierbuilder.get_dict_by_test('test_name_disabled'),
+            self.testcase_disabled)
+
+    def test_get_dict_by_test_missing(self):
+        self.assertIsNone(self.tierbuilder.get_dict_by_test('test_name2'))
+
+    def test_get_tags(self):
+        self.assertEqual(
+            self.tierbuilder.get_test('test_name').get_tags(), ())
+
+    def test_match(self):
+        self.assertEqual(self.tierbuilder.match('all'),
+                         ['test_name', 'test_name_disabled'])
+        self.assertEqual(self.tierbuilder.match('test_tier'),
+                         ['test_name', 'test_name_disabled'])
+        self.assertEqual(self.tierbuilder.match('test_name'), ['test_name'])
+        self.assertEqual(self.tierbuilder.match('*disabled'),
+                         ['test_name_disabled'])
+        self.assertEqual(self.tierbuilder.match('re:name$'), ['test_name'])
+        self.assertEqual(self.tierbuilder.match('re:^test_t'),
+                         ['test_name', 'test_name_disabled'])
+        self.assertEqual(self.tierbuilder.match('foo'), [])
+        self.assertEqual(self.tierbuilder.match('foo*'), [])
+        self.assertEqual(self.tierbuilder.match('name*'), [])
+        self.assertEqual(self.tierbuilder.match('re:name'),
+                         ['test_name', 'test_name_disabled'])
+
+    def test_match_wrong_pattern(self):
+        with self.assertRaises(ValueError):
+            self.tierbuilder.match('re:(')
+
+    def test_resolve(self):
+        self.assertEqual(
+            self.tierbuilder.resolve(['*disabled', 'test_name']),
+            ['test_name', 'test_name_disabled'])
+        with self.assertRaises(ValueError) as context:
+            self.tierbuilder.resolve(['test_name', 'foo', 'bar*'])
+        self.assertIn('foo, bar*', str(context.exception))
+
+    def test_resolve_tags(self):
+        self.tierbuilder.get_test('test_name').tags = ['smoke', 'api']
+        self.assertEqual(self.tierbuilder.resolve(['all'], ['api', 'foo']),
+                         ['test_name'])
+        self.assertEqual(self.tierbuilder.resolve(['all'], ['foo']), [])
+
+    def test_select(self):
+        self.tierbuilder.select(['test_name_disabled', 'foo'])
+        self.assertEqual(self.tier_obj.get_tests(), ())
+        self.assertEqual(
+            [test.get_name() for test in self.tier_obj.get_skipped_test()],
+            ['test_name_disabled'])
+        self.assertIsNone(self.tierbuilder.get_test('test_name'))
+        self.assertIsNone(self.tierbuilder.get_tier_name('test_name'))
+        self.assertEqual(
+            self.tierbuilder.get_tier_name('test_name_disabled'), 'test_tier')
+        self.tierbuilder.select([])
+        self.assertEqual(self.tier_obj.get_skipped_test(), ())
+
     def test_str(self):
         message = str(self.tierbuilder)
         self.assertTrue('test_tier' in message)
@@ -97,6 +159,264 @@ class TierBuilderTesting(unittest.TestCase):
         self.assertTrue('test_name' in message)
 
 
+class TierBuilderMatrixTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.template = {
+            'case_name': 'ping', 'project_name': 'xtesting',
+            'description': 'ping {{ host }}',
+            'matrix': {'host': ['host1', 'a/b'], 'count': [5, 100]},
+            'run': {'name': 'bashfeature', 'args': {
+                'cmd': 'ping -c {{count}} {{ host }} ${FOO} {{ bar }}',
+                'count': '{{ count }}', 'hosts': ['{{host}}']}}}
+        with mock.patch('xtesting.ci.tier_builder.yaml.load',
+                        return_value={'tiers': [{
+                            'name': 'tier1', 'testcases': [
+                                {'case_name': 'test1',
+                                 'project_name': 'xtesting'},
+                                self.template]}]}), \
+                mock.patch('builtins.open', mock.mock_open()):
+            self.tierbuilder = tier_builder.TierBuilder('testcases_file')
+
+    def test_substitute(self):
+        params = {'host': 'host1', 'count': 5}
+        self.assertEqual(tier_builder.substitute(
+            self.template['run'], params), {
+                'name': 'bashfeature', 'args': {
+                    'cmd': 'ping -c 5 host1 ${FOO} {{ bar }}',
+                    'count': 5, 'hosts': ['host1']}})
+        self.assertEqual(tier_builder.substitute(True, params), True)
+
+    def test_get_case_name(self):
+        self.assertEqual(tier_builder.get_case_name(
+            self.template, {'host': 'a/b', 'count': 5}), 'ping-a_b-5')
+        self.template['case_name'] = '{{ count }}'
+        self.assertEqual(tier_builder.get_case_name(
+            self.template, {'host': 'a/b', 'count': 5}), '5')
+
+    def test_expand(self):
+        self.assertEqual(
+            [test.get_name() for test in tier_builder.expand(self.template)],
+            ['ping-host1-5', 'ping-host1-100', 'ping-a_b-5', 'ping-a_b-100'])
+        test = {'case_name': 'test1'}
+        self.assertEqual(list(tier_builder.expand(test)), [test])
+
+    def _build(self, testcases):
+        with mock.patch('xtesting.ci.tier_builder.yaml.load',
+                        return_value={'tiers': [{
+                            'name': 'tier1', 'testcases': testcases}]}), \
+                mock.patch('builtins.open', mock.mock_open()):
+            return tier_builder.TierBuilder('testcases_file')
+
+    def test_duplicate_variants(self):
+        self.template['matrix'] = {'host': ['a b', 'a_b', 'a/b']}
+        with self.assertRaisesRegex(ValueError, 'ping-a_b'):
+            self._build([self.template])
+
+    def test_duplicate_case_name(self):
+        with self.assertRaisesRegex(ValueError, 'ping-host1-5'):
+            self._build([{'case_name': 'ping-host1-5'}, self.template])
+        with self.assertRaisesRegex(ValueError, 'ping-host1-5'):
+            self._build([self.template, {'case_name': 'ping-host1-5'}])
+
+    def test_tiers(self):
+        self.assertEqual(
+            self.tierbuilder.get_tier('tier1').get_test_names(),
+            ['test1', 'ping-host1-5', 'ping-host1-100', 'ping-a_b-5',
+             'ping-a_b-100'])
+        self.assertEqual(self.tierbuilder.get_tier_name('ping-a_b-5'),
+                         'tier1')
+        self.assertIsInstance(
+            self.tierbuilder.catalog['ping-a_b-5'], tier_builder.Variant)
+
+    def test_get_dict_by_test(self):
+        self.assertEqual(self.tierbuilder.get_dict_by_test('ping-a_b-100'), {
+            'case_name': 'ping-a_b-100', 'project_name': 'xtesting',
+            'description': 'ping a/b',
+            'run': {'name': 'bashfeature', 'args': {
+                'cmd': 'ping -c 100 a/b ${FOO} {{ bar }}',
+                'count': 100, 'hosts': ['a/b']}}})
+        self.assertEqual(self.tierbuilder.get_dict_by_test('test1'), {
+            'case_name': 'test1', 'project_name': 'xtesting'})
+        self.assertEqual(self.template['run']['args']['count'],
+                         '{{ count }}')
+
+
+class TierBuilderCacheTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'testcases.yaml')
+        self.cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        self.write({'tiers': [{'name': 'tier1', 'testcases': [
+            {'case_name': 'test1', 'project_name': 'xtesting'},
+            {'case_name': 'test2', 'project_name': 'xtesting',
+             'dependencies': [{'XTESTING_FOO': '^bar$'}]}]}]})
+        os.environ['XTESTING_FOO'] = 'bar'
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        del os.environ['XTESTING_FOO']
+
+    def write(self, testcases):
+        with open(self.path, 'w', encoding='utf-8') as tfile:
+            yaml.safe_dump(testcases, tfile)
+
+    def build(self):
+        return tier_builder.TierBuilder(self.path, cache_dir=self.cache_dir)
+
+    def test_compile_dependency(self):
+        self.assertIs(tier_builder.compile_dependency('^bar$'),
+                      tier_builder.compile_dependency('^bar$'))
+
+    def test_no_cache(self):
+        tiers = tier_builder.TierBuilder(self.path)
+        self.assertIsNone(tiers.cache_file)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_warm(self):
+        tiers = self.build()
+        self.assertEqual(tiers.variables, {'XTESTING_FOO': 'bar'})
+        self.assertTrue(os.path.isfile(tiers.cache_file))
+        with mock.patch.object(tier_builder.TierBuilder,
+                               'read_test_yaml') as read_test_yaml:
+            tiers = self.build()
+            read_test_yaml.assert_not_called()
+        self.assertEqual(tiers.get_tier('tier1').get_test_names(),
+                         ['test1', 'test2'])
+        self.assertIs(tiers.get_test('test2'),
+                      tiers.get_tier('tier1').get_test('test2'))
+        self.assertEqual(tiers.get_dict_by_test('test1')['project_name'],
+                         'xtesting')
+
+    def test_modified(self):
+        self.build()
+        self.write({'tiers': [{'name': 'tier2', 'testcases': [
+            {'case_name': 'test3', 'project_name': 'xtesting'}]}]})
+        self.assertEqual(self.build().get_tier_names(), ['tier2'])
+
+    def test_env(self):
+        self.build()
+        os.environ['XTESTING_FOO'] = 'baz'
+        tiers = self.build()
+        self.assertEqual(tiers.get_tier('tier1').get_test_names(), ['test1'])
+        self.assertEqual(tiers.variables, {'XTESTING_FOO': 'baz'})
+
+    @mock.patch('xtesting.ci.tier_builder.LOGGER.exception')
+    def test_corrupted(self, *args):
+        tiers = self.build()
+        with open(tiers.cache_file, 'wb') as cfile:
+            cfile.write(b'foo')
+        self.assertEqual(self.build().get_tier('tier1').get_test_names(),
+                         ['test1', 'test2'])
+        args[0].assert_called_once()
+        self.assertEqual(self.build().get_tier_names(), ['tier1'])
+        args[0].assert_called_once()
+
+    @mock.patch('xtesting.ci.tier_builder.LOGGER.exception')
+    def test_dump_ko(self, *args):
+        with open(self.cache_dir, 'w', encoding='utf-8'):
+            pass
+        self.assertEqual(self.build().get_tier_names(), ['tier1'])
+        args[0].assert_called_once()
+
+
+class TierBuilderIncludeTesting(unittest.TestCase):
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.write('testcases.yaml', {
+            'tiers': [
+                {'name': 'tier1', 'testcases': [self.get_test('test1')]},
+                {'name': 'tier2', 'description': 'tier2_desc',
+                 'include': 'tier2.yaml'},
+                {'name': 'tier3', 'include': 'tier3.yaml'}],
+            'include': ['testcases.d/*.yaml']})
+        self.write('tier2.yaml', {'testcases': [self.get_test('test2')]})
+        self.write('tier3.yaml', {'testcases': [
+            self.get_test('test3'), self.get_test('test4', enabled=False)]})
+        self.write('testcases.d/b.yaml', {'tiers': [
+            {'name': 'tier5', 'testcases': [self.get_test('test5')]}]})
+        self.write('testcases.d/a.yaml', {'tiers': [
+            {'name': 'tier4', 'testcases': [self.get_test('test6')]}]})
+        self.cache_dir = os.path.join(self.tmpdir.name, 'cache')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    @staticmethod
+    def get_test(name, enabled=True):
+        return {'case_name': name, 'project_name': 'xtesting',
+                'enabled': enabled}
+
+    def write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as tfile:
+            yaml.safe_dump(content, tfile)
+        return path
+
+    def build(self):
+        return tier_builder.TierBuilder(self.path, cache_dir=self.cache_dir)
+
+    def test_include(self):
+        tiers = self.build()
+        self.assertEqual(tiers.get_tier_names(),
+                         ['tier1', 'tier2', 'tier3', 'tier4', 'tier5'])
+        self.assertEqual(sorted(tiers.lazy), ['tier2', 'tier3'])
+        self.assertEqual(tiers.get_dict_by_test('test6')['case_name'],
+                         'test6')
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_lazy_tier(self):
+        tiers = self.build()
+        tier = tiers.get_tier('tier3')
+        self.assertEqual(tier.get_test_names(), ['test3'])
+        self.assertEqual(tier.get_skipped_test()[0].get_name(), 'test4')
+        self.assertEqual(list(tiers.lazy), ['tier2'])
+        self.assertEqual([tier.get_name() for tier in tiers.tier_objects],
+                         ['tier1', 'tier3', 'tier4', 'tier5'])
+        self.assertIsNone(tiers.get_tier('foo'))
+        self.assertEqual(list(tiers.lazy), ['tier2'])
+
+    def test_lazy_test(self):
+        tiers = self.build()
+        self.assertEqual(tiers.get_tier_name('test2'), 'tier2')
+        self.assertEqual(tiers.lazy, {})
+        self.assertEqual([tier.get_name() for tier in tiers.get_tiers()],
+                         ['tier1', 'tier2', 'tier3', 'tier4', 'tier5'])
+        self.assertEqual(tiers.get_tier('tier2').description, 'tier2_desc')
+        self.assertEqual(
+            tiers.match('all'),
+            ['test1', 'test2', 'test3', 'test4', 'test6', 'test5'])
+        self.assertTrue(os.path.isfile(tiers.cache_file))
+
+    def test_warm(self):
+        self.build().get_tiers()
+        with mock.patch.object(tier_builder.TierBuilder,
+                               'read_fragment') as read_fragment:
+            tiers = self.build()
+            self.assertEqual(tiers.get_tier('tier2').get_test_names(),
+                             ['test2'])
+            read_fragment.assert_not_called()
+
+    def test_modified_fragment(self):
+        self.build().get_tiers()
+        self.write('tier2.yaml', {'testcases': [
+            self.get_test('test2'), self.get_test('test7')]})
+        self.assertEqual(self.build().get_tier('tier2').get_test_names(),
+                         ['test2', 'test7'])
+
+    def test_new_fragment(self):
+        self.build().get_tiers()
+        os.utime(os.path.join(self.tmpdir.name, 'testcases.d'), ns=(0, 0))
+        self.write('testcases.d/c.yaml', {'tiers': [
+            {'name': 'tier6', 'testcases': [self.get_test('test8')]}]})
+        self.assertEqual(self.build().get_tier_names()[-1], 'tier6')
+
+
 if __name__ == "__main__":
     logging.disable(logging.CRITICAL)
     unittest.main(verbosity=2)
@@ -26,37 +26,68 @@ class TierHandlerTesting(unittest.TestCase):
         self.testcase = tier_handler.TestCase(
             'test_name', 'true', False, 'test_criteria',
             True, description='test_desc', project='project_name')
-        self.testcase.str = self.testcase.__str__()
-        self.tier.str = self.tier.__str__()
 
     def test_add_test(self):
         self.tier.add_test(self.test)
         self.assertEqual(self.tier.tests_array, [self.test])
 
     def test_get_skipped_test1(self):
-        self.assertEqual(self.tier.get_skipped_test(), [])
+        self.assertEqual(self.tier.get_skipped_test(), ())
 
     def test_get_skipped_test2(self):
         self.tier.skip_test(self.test)
-        self.assertEqual(self.tier.get_skipped_test(), [self.test])
+        self.assertEqual(self.tier.get_skipped_test(), (self.test, ))
 
     def test_get_tests(self):
         self.tier.tests_array = [self.test]
-        self.assertEqual(self.tier.get_tests(), [self.test])
+        self.assertEqual(self.tier.get_tests(), (self.test, ))
+
+    def test_get_tests_view(self):
+        self.tier.add_test(self.test)
+        tests = self.tier.get_tests()
+        self.assertIs(self.tier.get_tests(), tests)
+        self.tier.add_test(self.testcase)
+        self.assertEqual(self.tier.get_tests(), (self.test, self.testcase))
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.tier.foo = 'bar'  # pylint: disable=assigning-non-slot
+        with self.assertRaises(AttributeError):
+            self.testcase.foo = 'bar'  # pylint: disable=assigning-non-slot
+
+    def test_str(self):
+        self.tier.add_test(self.testcase)
+        self.assertIn('test_tier', str(self.tier))
+        self.assertIn('test_criteria', str(self.testcase))
 
     def test_get_test_names(self):
         self.tier.tests_array = [self.test]
         self.assertEqual(self.tier.get_test_names(), ['test_name'])
 
     def test_get_test(self):
-        self.tier.tests_array = [self.test]
-        with mock.patch.object(self.tier, 'is_test', return_value=True):
-            self.assertEqual(self.tier.get_test('test_name'), self.test)
+        self.tier.add_test(self.test)
+        self.assertEqual(self.tier.get_test('test_name'), self.test)
+        self.assertTrue(self.tier.is_test('test_name'))
+
+    def test_get_test_skipped(self):
+        self.tier.skip_test(self.test)
+        self.assertEqual(self.tier.get_test('test_name'), self.test)
+        self.assertTrue(self.tier.is_test('test_name'))
 
     def test_get_test_missing_test(self):
-        self.tier.tests_array = [self.test]
-        with mock.patch.object(self.tier, 'is_test', return_value=False):
-            self.assertEqual(self.tier.get_test('test_name'), None)
+        self.tier.add_test(self.test)
+        self.assertEqual(self.tier.get_test('foo'), None)
+        self.assertFalse(self.tier.is_test('foo'))
+
+    def test_select(self):
+        test = mock.Mock()
+        test.get_name.return_value = 'foo'
+        self.tier.add_test(self.test)
+        self.tier.skip_test(test)
+        self.tier.select({'test_name'})
+        self.assertEqual(self.tier.get_tests(), (self.test, ))
+        self.assertEqual(self.tier.get_skipped_test(), ())
+        self.assertFalse(self.tier.is_test('foo'))
 
     def test_get_name(self):
         self.assertEqual(self.tier.get_name(), 'test_tier')
@@ -76,6 +107,17 @@ class TierHandlerTesting(unittest.TestCase):
     def test_testcase_get_project(self):
         self.assertEqual(self.testcase.get_project(), 'project_name')
 
+    def test_testcase_is_parallel(self):
+        self.assertFalse(self.testcase.is_parallel())
+
+    def test_testcase_get_depends_on(self):
+        self.assertEqual(self.testcase.get_depends_on(), ())
+
+    def test_testcase_get_tags(self):
+        self.assertEqual(self.testcase.get_tags(), ())
+        self.testcase.tags = ['smoke']
+        self.assertEqual(self.testcase.get_tags(), ['smoke'])
+
 
 if __name__ == "__main__":
     logging.disable(logging.CRITICAL)
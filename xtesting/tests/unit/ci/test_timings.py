@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+import mock
+
+from xtesting.ci import timings
+
+
+class TimingsTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.timings = timings.Timings()
+        self.timings.add('test1', {'load': 0.1, 'run': 2.5})
+        self.timings.add('te"st2', {'run': 1})
+
+    def test_measure(self):
+        phases = {}
+        with mock.patch('time.time', side_effect=[1, 3.5]):
+            with timings.measure(phases, 'run'):
+                pass
+        self.assertEqual(phases, {'run': 2.5})
+
+    def test_measure_exception(self):
+        phases = {}
+        with self.assertRaises(ValueError):
+            with timings.measure(phases, 'run'):
+                raise ValueError
+        self.assertIn('run', phases)
+
+    def test_get(self):
+        test_case = mock.Mock(details=None)
+        timings.get(test_case)['run'] = 1
+        self.assertEqual(test_case.details, {'timings': {'run': 1}})
+        test_case.details = ['foo']
+        self.assertEqual(timings.get(test_case), {})
+        self.assertEqual(test_case.details, ['foo'])
+
+    def test_to_json(self):
+        data = json.loads(self.timings.to_json())
+        self.assertEqual(data['testcases']['test1'], {'load': 0.1, 'run': 2.5})
+        self.assertIn('duration', data)
+
+    def test_to_prometheus(self):
+        output = self.timings.to_prometheus()
+        self.assertIn(
+            'xtesting_testcase_phase_duration_seconds{case_name="test1",'
+            'phase="run"} 2.5\n', output)
+        self.assertIn('case_name="te\\"st2"', output)
+        self.assertIn('# TYPE xtesting_campaign_duration_seconds gauge',
+                      output)
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.timings.dump(tmpdir)
+            self.assertEqual(sorted(os.listdir(tmpdir)),
+                             [timings.JSON_FILE, timings.PROMETHEUS_FILE])
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
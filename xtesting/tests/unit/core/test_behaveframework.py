@@ -93,7 +93,7 @@ class RunTesting(unittest.TestCase):
     def test_exc_key_error(self):
         self.assertEqual(self.test.run(), self.test.EX_RUN_ERROR)
 
-    @mock.patch('xtesting.core.behaveframework.behave_main')
+    @mock.patch('behave.__main__.main')
     def _test_makedirs_exc(self, *args):
         with mock.patch.object(self.test, 'parse_results') as mock_method:
             self.assertEqual(
@@ -110,7 +110,7 @@ class RunTesting(unittest.TestCase):
         args[0].assert_called_once_with(self.test.res_dir)
         args[1].assert_called_once_with(self.test.res_dir)
 
-    @mock.patch('xtesting.core.behaveframework.behave_main')
+    @mock.patch('behave.__main__.main')
     def _test_makedirs(self, *args):
         with mock.patch.object(self.test, 'parse_results') as mock_method:
             self.assertEqual(
@@ -143,7 +143,7 @@ class RunTesting(unittest.TestCase):
         args[1].assert_not_called()
 
     @mock.patch('os.makedirs')
-    @mock.patch('xtesting.core.behaveframework.behave_main')
+    @mock.patch('behave.__main__.main')
     def _test_parse_results(self, status, console, *args):
         self.assertEqual(
             self.test.run(
@@ -17,7 +17,7 @@ import logging
 import os
 import unittest
 
-import botocore
+import botocore.exceptions
 import mock
 import requests
 
@@ -109,7 +109,10 @@ class TestCaseTesting(unittest.TestCase):
         self.test.stop_time = None
         self._test_pushdb_missing_attribute()
 
-    def _test_pushdb_missing_env(self, var):
+    @mock.patch('xtesting.utils.session.post',
+                side_effect=requests.exceptions.ConnectionError)
+    def _test_pushdb_missing_env(self, var, *args):
+        # pylint: disable=unused-argument
         del os.environ[var]
         self.assertEqual(self.test.push_to_db(),
                          testcase.TestCase.EX_PUSH_TO_DB_ERROR)
@@ -129,7 +132,7 @@ class TestCaseTesting(unittest.TestCase):
     def test_pushdb_no_build_tag(self):
         self._test_pushdb_missing_env('BUILD_TAG')
 
-    @mock.patch('requests.post')
+    @mock.patch('xtesting.utils.session.post')
     def test_pushdb_bad_start_time(self, mock_function=None):
         self.test.start_time = "1"
         self.assertEqual(
@@ -137,7 +140,7 @@ class TestCaseTesting(unittest.TestCase):
             testcase.TestCase.EX_PUSH_TO_DB_ERROR)
         mock_function.assert_not_called()
 
-    @mock.patch('requests.post')
+    @mock.patch('xtesting.utils.session.post')
     def test_pushdb_bad_end_time(self, mock_function=None):
         self.test.stop_time = "2"
         self.assertEqual(
@@ -145,7 +148,7 @@ class TestCaseTesting(unittest.TestCase):
             testcase.TestCase.EX_PUSH_TO_DB_ERROR)
         mock_function.assert_not_called()
 
-    @mock.patch('requests.post')
+    @mock.patch('xtesting.utils.session.post')
     def test_pushdb_skipped_test(self, mock_function=None):
         self.test.is_skipped = True
         self.assertEqual(
@@ -172,7 +175,7 @@ class TestCaseTesting(unittest.TestCase):
 
     @mock.patch('os.path.join', return_value='')
     @mock.patch('re.sub', return_value='')
-    @mock.patch('requests.post')
+    @mock.patch('xtesting.utils.session.post')
     def _test_pushdb_version(self, *args, **kwargs):
         payload = self._get_data()
         payload["version"] = kwargs.get("version", "unknown")
@@ -193,7 +196,7 @@ class TestCaseTesting(unittest.TestCase):
         os.environ['BUILD_TAG'] = 'whatever'
         self._test_pushdb_version(version="unknown")
 
-    @mock.patch('requests.post', return_value=mock.Mock(
+    @mock.patch('xtesting.utils.session.post', return_value=mock.Mock(
         raise_for_status=mock.Mock(
             side_effect=requests.exceptions.HTTPError)))
     def test_pushdb_http_errors(self, mock_function=None):
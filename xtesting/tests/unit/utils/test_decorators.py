@@ -87,7 +87,7 @@ class DecoratorsTesting(unittest.TestCase):
 
     @mock.patch('os.path.join')
     @mock.patch('re.sub')
-    @mock.patch('requests.post')
+    @mock.patch('xtesting.utils.session.post')
     def test_http_shema(self, *args):
         os.environ['TEST_DB_URL'] = 'http://127.0.0.1'
         test = self._get_testcase()
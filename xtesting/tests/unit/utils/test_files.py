@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import logging
+import os
+import tempfile
+import unittest
+
+from xtesting.utils import files
+
+
+class FilesTesting(unittest.TestCase):
+
+    def test_write_atomically(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'foo', 'bar.json')
+            files.write_atomically(path, 'foo')
+            files.write_atomically(path, 'bar')
+            with open(path, encoding='utf-8') as ofile:
+                self.assertEqual(ofile.read(), 'bar')
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['bar.json'])
+
+    def test_write_atomically_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'bar.prom')
+            files.write_atomically(path, 'foo')
+            self.assertEqual(os.stat(path).st_mode & 0o777,
+                             0o666 & ~files.UMASK)
+            os.chmod(path, 0o640)
+            files.write_atomically(path, 'bar')
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+    def test_write_atomically_bytes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'bar.pickle')
+            files.write_atomically(path, b'\x00foo')
+            with open(path, 'rb') as ofile:
+                self.assertEqual(ofile.read(), b'\x00foo')
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
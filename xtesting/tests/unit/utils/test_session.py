@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+from http import server
+import json
+import logging
+import os
+import threading
+import unittest
+
+import mock
+
+from xtesting.core import testcase
+from xtesting.utils import session
+
+
+class Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(self.client_address)
+        status = 503 if self.server.failures else 200
+        if self.server.failures:
+            self.server.failures -= 1
+        body = json.dumps({'href': '/api/v1/results/foo'}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class FakeTestCase(testcase.TestCase):
+
+    def run(self, **kwargs):
+        return testcase.TestCase.EX_OK
+
+
+class SessionTesting(unittest.TestCase):
+
+    def setUp(self):
+        self.server = server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.requests = []
+        self.server.failures = 0
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={'poll_interval': 0.05})
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/results'
+        session.get_session.cache_clear()
+        session.get_limiter.cache_clear()
+        patcher = mock.patch('xtesting.utils.session.random.uniform',
+                             return_value=0)
+        self.uniform = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        session.get_session(os.getpid()).close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        os.environ.pop('TEST_DB_RATE_LIMIT', None)
+
+    def test_post(self):
+        self.assertEqual(session.post(self.url, data='foo').status_code, 200)
+        self.assertEqual(session.post(self.url, data='bar').status_code, 200)
+        self.assertEqual(len(self.server.requests), 2)
+        # the connection is kept alive
+        self.assertEqual(self.server.requests[0], self.server.requests[1])
+
+    def test_retry(self):
+        self.server.failures = 2
+        self.assertEqual(session.post(self.url, data='foo').status_code, 200)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.uniform.call_count, 2)
+
+    def test_retry_ko(self):
+        self.server.failures = session.RETRIES + 1
+        self.assertEqual(session.post(self.url, data='foo').status_code, 503)
+        self.assertEqual(len(self.server.requests), session.RETRIES + 1)
+
+    @mock.patch('xtesting.utils.session.TokenBucket.acquire')
+    def test_rate_limit(self, *args):
+        session.post(self.url, data='foo')
+        args[0].assert_not_called()
+        os.environ['TEST_DB_RATE_LIMIT'] = '2.5'
+        session.post(self.url, data='foo')
+        session.post(self.url, data='foo')
+        self.assertEqual(args[0].call_count, 2)
+        self.assertEqual(
+            session.get_limiter(os.getpid(), '2.5').rate, 2.5)
+
+    def test_get_limiter(self):
+        self.assertIsNone(session.get_limiter(1, None))
+        self.assertIsNone(session.get_limiter(1, '0'))
+        self.assertIsNone(session.get_limiter(1, '-1'))
+        self.assertIsNone(session.get_limiter(1, 'inf'))
+        with mock.patch.object(session.LOGGER, 'warning') as mock_method:
+            self.assertIsNone(session.get_limiter(1, 'foo'))
+            self.assertIsNone(session.get_limiter(1, 'foo'))
+            mock_method.assert_called_once()
+        self.assertEqual(session.get_limiter(1, '0.5').rate, 0.5)
+
+    @mock.patch.dict(os.environ, {'TEST_DB_RATE_LIMIT': '0'})
+    def test_post_unlimited(self):
+        for _ in range(3):
+            self.assertEqual(
+                session.post(self.url, data='foo').status_code, 200)
+
+    @mock.patch('requests.post')
+    def test_file(self, *args):
+        self.assertEqual(session.post('file:///dev/null', data='foo'),
+                         args[0].return_value)
+        args[0].assert_called_once_with(
+            'file:///dev/null', data='foo', timeout=session.TIMEOUT)
+
+    @mock.patch.dict(os.environ)
+    def test_push_to_db(self):
+        self.server.failures = 1
+        os.environ['TEST_DB_URL'] = self.url
+        test = FakeTestCase(project_name='xtesting', case_name='foo')
+        test.start_time = 1
+        test.stop_time = 2
+        test.result = 100
+        self.assertEqual(test.push_to_db(), testcase.TestCase.EX_OK)
+        self.assertEqual(len(self.server.requests), 2)
+        self.server.failures = session.RETRIES + 1
+        self.assertEqual(test.push_to_db(),
+                         testcase.TestCase.EX_PUSH_TO_DB_ERROR)
+
+
+class RetryTesting(unittest.TestCase):
+
+    def test_get_backoff_time(self):
+        retry = session.Retry(total=5, backoff_factor=1)
+        for _ in range(4):
+            retry = retry.increment(method='POST', url='/')
+        self.assertIsInstance(retry, session.Retry)
+        for _ in range(10):
+            self.assertTrue(0 <= retry.get_backoff_time() <= 8)
+
+
+class TokenBucketTesting(unittest.TestCase):
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.monotonic', return_value=10)
+    def test_acquire(self, *args):
+        bucket = session.TokenBucket(2)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0.5)
+        args[1].assert_called_once_with(0.5)
+        self.assertEqual(bucket.acquire(), 1)
+        args[0].return_value = 12
+        self.assertEqual(bucket.acquire(), 0)
+
+    def test_capacity(self):
+        self.assertEqual(session.TokenBucket(0.1).capacity, 1)
+        self.assertEqual(session.TokenBucket(5, 10).capacity, 10)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    unittest.main(verbosity=2)
@@ -12,7 +12,9 @@
 import os
 import sys
 
-import pkg_resources
+# The package data are resolved from the package directory as importing
+# pkg_resources scans all the installed distributions
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 ENV_FILE = '/var/lib/xtesting/conf/env_file'
 
@@ -20,14 +22,15 @@ XTESTING_PATHES = [
     "~/.xtesting", "/etc/xtesting", os.path.join(sys.prefix + "/etc/xtesting")]
 
 TESTCASE_DESCRIPTION = 'testcases.yaml'
-TESTCASE_DESCRIPTION_DEFAULT = pkg_resources.resource_filename(
-    'xtesting', f'ci/{TESTCASE_DESCRIPTION}')
+TESTCASE_DESCRIPTION_DEFAULT = os.path.join(
+    PACKAGE_DIR, 'ci', TESTCASE_DESCRIPTION)
 
 RESULTS_DIR = '/var/lib/xtesting/results'
 LOG_PATH = os.path.join(RESULTS_DIR, 'xtesting.log')
 DEBUG_LOG_PATH = os.path.join(RESULTS_DIR, 'xtesting.debug.log')
+SOCKET_PATH = os.path.join(RESULTS_DIR, 'run_tests.sock')
 
-INI_PATH_DEFAULT = pkg_resources.resource_filename(
-    'xtesting', 'ci/logging.ini')
-DEBUG_INI_PATH_DEFAULT = pkg_resources.resource_filename(
-    'xtesting', 'ci/logging.debug.ini')
+INI_PATH_DEFAULT = os.path.join(PACKAGE_DIR, 'ci', 'logging.ini')
+DEBUG_INI_PATH_DEFAULT = os.path.join(PACKAGE_DIR, 'ci', 'logging.debug.ini')
+
+CACHE_DIR = '/var/lib/xtesting/cache'
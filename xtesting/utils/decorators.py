@@ -14,11 +14,10 @@ import functools
 import os
 from urllib.parse import urlparse
 
-import mock
-import requests.sessions
-
 
 def can_dump_request_to_file(method):
+    # mock and requests are only imported when the decorated method is called
+    # pylint: disable=import-outside-toplevel
 
     def dump_preparedrequest(request, **kwargs):
         # pylint: disable=unused-argument
@@ -38,9 +37,12 @@ def can_dump_request_to_file(method):
                     f"{request.method} {request.url}"
                     f"\n{headers}\n{request.body}\n\n\n")
                 dumpfile.write(message)
+        import mock
         return mock.Mock()
 
     def patch_request(method, url, **kwargs):
+        import mock
+        import requests.sessions
         with requests.sessions.Session() as session:
             parseresult = urlparse(url)
             if parseresult.scheme == "file":
@@ -52,6 +54,7 @@ def can_dump_request_to_file(method):
 
     @functools.wraps(method)
     def hook(*args, **kwargs):
+        import mock
         with mock.patch('requests.api.request', side_effect=patch_request):
             return method(*args, **kwargs)
 
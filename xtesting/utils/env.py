@@ -23,6 +23,7 @@ INPUTS = {
     'NODE_NAME': None,
     'TEST_DB_URL': 'http://testresults.opnfv.org/test/api/v1/results',
     'TEST_DB_EXT_URL': None,
+    'TEST_DB_RATE_LIMIT': None,
     'S3_ENDPOINT_URL': None,
     'S3_DST_URL': None,
     'HTTP_DST_URL': None
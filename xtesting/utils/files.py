@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+# pylint: disable=missing-docstring
+
+import os
+import stat
+import tempfile
+
+
+def get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# read once as os.umask is not thread-safe
+UMASK = get_umask()
+
+
+def write_atomically(path, content):
+    """Replace the file content at once
+
+    The readers never see a partially written file even if the process is
+    killed while writing it. The content is either a string or bytes.
+    The file keeps its mode or gets the usual one (0666 minus the umask)
+    instead of the private mode of the temporary files.
+    """
+    dirname = os.path.dirname(path) or '.'
+    os.makedirs(dirname, exist_ok=True)
+    binary = isinstance(content, bytes)
+    with tempfile.NamedTemporaryFile(
+            'wb' if binary else 'w', encoding=None if binary else 'utf-8',
+            dir=dirname, delete=False,
+            prefix=f'.{os.path.basename(path)}.') as tmpfile:
+        tmpfile.write(content)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+    os.chmod(tmpfile.name, mode)
+    os.replace(tmpfile.name, path)
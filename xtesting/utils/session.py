@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2026 Orange and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+
+"""Process-wide HTTP session pushing the results
+
+The connections are kept alive and reused by all the test cases of the
+process. The requests failing on connection errors or on transient
+statuses are retried after jittered exponential backoffs, and the requests
+may be rate limited (TEST_DB_RATE_LIMIT requests per second) to spare the
+database when many campaigns end at the same time.
+
+The file:// URLs are still sent via requests.post to be dumped by
+decorators.can_dump_request_to_file.
+"""
+
+import functools
+import logging
+import math
+import os
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests import adapters
+from urllib3.util import retry
+
+from xtesting.utils import env
+
+LOGGER = logging.getLogger('xtesting.utils.session')
+
+RETRIES = 5
+BACKOFF_FACTOR = 0.5
+STATUS_FORCELIST = [429, 500, 502, 503, 504]
+POOL_MAXSIZE = 10
+TIMEOUT = 60
+
+
+class Retry(retry.Retry):
+    """Retry sleeping a random duration up to the exponential backoff"""
+
+    def get_backoff_time(self):
+        # pylint: disable=no-member
+        return random.uniform(0, super().get_backoff_time())
+
+
+class TokenBucket():
+    """Rate limit of rate requests per second allowing bursts of capacity"""
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token and wait for it if the bucket is empty
+
+        Returns:
+            the duration waited in seconds
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            LOGGER.debug("Waiting %.3f second(s) for the rate limit", wait)
+            time.sleep(wait)
+        return wait
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(pid):
+    """Return the session of the process (pid) retrying the requests
+
+    A forked child process gets its own session as the connections must
+    not be shared with its parent.
+    """
+    # pylint: disable=unused-argument
+    session = requests.Session()
+    # the requests are not retried once sent (read=0) but on the statuses
+    # listed as the results could be duplicated otherwise
+    adapter = adapters.HTTPAdapter(
+        pool_maxsize=POOL_MAXSIZE, max_retries=Retry(
+            total=RETRIES, read=0, backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=STATUS_FORCELIST,
+            allowed_methods=None, raise_on_status=False))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def get_limiter(pid, rate):
+    """Return the token bucket of the process or None if unlimited
+
+    The rates which are not positive (e.g. 0) disable the rate limit and
+    the ones which cannot be parsed are ignored (warned once).
+    """
+    # pylint: disable=unused-argument
+    if not rate:
+        return None
+    try:
+        value = float(rate)
+    except ValueError:
+        LOGGER.warning("Ignoring the wrong TEST_DB_RATE_LIMIT %s", rate)
+        return None
+    return TokenBucket(value) if value > 0 and math.isfinite(value) else None
+
+
+def post(url, **kwargs):
+    """Post via the session of the process once allowed by the rate limit"""
+    kwargs.setdefault('timeout', TIMEOUT)
+    if urlparse(url).scheme == "file":
+        return requests.post(url, **kwargs)  # pylint: disable=missing-timeout
+    limiter = get_limiter(os.getpid(), env.get('TEST_DB_RATE_LIMIT'))
+    if limiter:
+        limiter.acquire()
+    return get_session(os.getpid()).post(url, **kwargs)